@@ -0,0 +1,47 @@
+"""Benchmark the single-scan tokenizer against the general, multi-pass code path
+of ``textblob._text.find_tokens``.
+
+Usage::
+
+    python benchmarks/bench_tokenizer.py
+"""
+
+import timeit
+
+from textblob._text import find_token_offsets, find_tokens
+
+TEXT = """\
+The titular threat of The Blob has always struck me as the ultimate movie
+monster: an insatiably hungry, amoeba-like mass able to penetrate virtually any
+safeguard, capable of--as a doomed doctor chillingly describes it--"assimilating
+flesh on contact." Snide comparisons to gelatin be damned, it's a concept with the
+most devastating of potential consequences, not unlike the grey goo scenario
+proposed by technological theorists fearful of artificial intelligence run rampant.
+
+Isn't it great?! Mr. Smith (a.k.a. the U.S. expert) didn't think so... :-) (!)
+"""
+
+# A line break pattern other than the default disables the single-scan code path.
+GENERAL = {"linebreak": r"\n\n+"}
+
+
+def best_of(func, number=3, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    print(f"{'chars':>10} {'general':>10} {'scan':>10} {'speedup':>8} {'offsets':>10}")
+    for n in (1, 10, 100, 1000):
+        text = TEXT * n
+        assert find_tokens(text) == find_tokens(text, **GENERAL)
+        general = best_of(lambda: find_tokens(text, **GENERAL))  # noqa: B023
+        scan = best_of(lambda: find_tokens(text))  # noqa: B023
+        offsets = best_of(lambda: find_token_offsets(text))  # noqa: B023
+        print(
+            f"{len(text):>10} {general * 1000:>8.2f}ms {scan * 1000:>8.2f}ms "
+            f"{general / scan:>7.1f}x {offsets * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
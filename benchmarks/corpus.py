@@ -0,0 +1,107 @@
+"""Deterministic corpora for the benchmarks in ``run.py``.
+
+Both corpora are built offline: the synthetic corpus from the words of the
+bundled spelling dictionary (``en-spelling.txt``), and the bundled corpus from
+a few paragraphs of English prose. The same size and seed always give the
+same documents.
+"""
+
+import os
+import random
+
+import textblob.en
+
+#: The number of documents of each corpus size
+SIZES = {"small": 20, "medium": 200, "large": 2000}
+
+POSITIVE = ["good", "great", "amazing", "happy", "excellent", "love", "best"]
+NEGATIVE = ["bad", "terrible", "awful", "sad", "horrible", "hate", "worst"]
+
+PARAGRAPHS = [
+    """The titular threat of The Blob has always struck me as the ultimate movie
+monster: an insatiably hungry, amoeba-like mass able to penetrate virtually any
+safeguard, capable of--as a doomed doctor chillingly describes it--"assimilating
+flesh on contact." Snide comparisons to gelatin be damned, it's a concept with the
+most devastating of potential consequences, not unlike the grey goo scenario
+proposed by technological theorists fearful of artificial intelligence run rampant.""",
+    """Beautiful is better than ugly. Explicit is better than implicit. Simple is
+better than complex. Complex is better than complicated. Flat is better than
+nested. Sparse is better than dense. Readability counts. Special cases aren't
+special enough to break the rules. Although practicality beats purity.""",
+    """Python is a high-level, general-purpose programming language. Its design
+philosophy emphasizes code readability with the use of significant indentation.
+Mr. Smith didn't think the U.S. team would win, but they played a great game and
+the fans were happy. The weather was terrible, though, and the bus was late.""",
+    """I love this sandwich. This is an amazing place! I feel very good about these
+beers. I do not like this restaurant. I am tired of this stuff. I can't deal with
+this. My boss is horrible. The beer was good. I do not enjoy my job.""",
+]
+
+
+def _vocabulary(size=2000):
+    """Return the ``size`` most frequent words of the spelling dictionary."""
+    path = os.path.join(os.path.dirname(textblob.en.__file__), "en-spelling.txt")
+    counts = []
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            if line.startswith(";;;") or not line.strip():
+                continue
+            word, count = line.split()
+            if word.isalpha() and len(word) > 1:
+                counts.append((int(count), word))
+    counts.sort(reverse=True)
+    return [word for _, word in counts[:size]]
+
+
+def _typo(word, rng):
+    """Swap two adjacent letters of ``word``."""
+    i = rng.randrange(len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+
+
+def synthetic(num_docs, seed=0, sentences=5, typo_rate=0.03):
+    """Return ``num_docs`` labeled documents as ``(text, label)`` tuples.
+    Each document has ``sentences`` sentences of common words, some
+    sentiment words of its label (``"pos"`` or ``"neg"``) and typos.
+    """
+    rng = random.Random(seed)
+    vocabulary = _vocabulary()
+    docs = []
+    for _ in range(num_docs):
+        label = rng.choice(["pos", "neg"])
+        sentiment_words = POSITIVE if label == "pos" else NEGATIVE
+        text = []
+        for _ in range(sentences):
+            words = rng.sample(vocabulary, rng.randint(6, 20))
+            words.insert(rng.randrange(len(words)), rng.choice(sentiment_words))
+            words = [
+                _typo(w, rng) if len(w) > 3 and rng.random() < typo_rate else w
+                for w in words
+            ]
+            if rng.random() < 0.3:
+                words.insert(rng.randrange(1, len(words)), "Mr. Smith,")
+            words[0] = words[0].capitalize()
+            text.append(" ".join(words) + rng.choice([".", ".", ".", "!", "?"]))
+        docs.append((" ".join(text), label))
+    return docs
+
+
+def bundled(num_docs):
+    """Return ``num_docs`` labeled documents cycling through the bundled
+    paragraphs, labeled by their sentiment words.
+    """
+    docs = []
+    for i in range(num_docs):
+        text = PARAGRAPHS[i % len(PARAGRAPHS)]
+        words = text.lower().split()
+        score = sum(w in POSITIVE for w in words) - sum(w in NEGATIVE for w in words)
+        docs.append((" ".join(text.split()), "pos" if score >= 0 else "neg"))
+    return docs
+
+
+CORPORA = {"synthetic": synthetic, "bundled": bundled}
+
+
+def load(corpus, size):
+    """Return the labeled documents of the named ``corpus`` and ``size``."""
+    return CORPORA[corpus](SIZES[size])
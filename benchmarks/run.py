@@ -0,0 +1,306 @@
+"""Benchmark TextBlob's hot paths on deterministic corpora (see ``corpus.py``)
+and report throughput and peak memory as JSON.
+
+Each benchmark is run once on the first document to load models and corpora,
+then timed ``--repeat`` times on the whole corpus (the best time is
+reported), then run once more under ``tracemalloc`` to measure the peak
+memory. Benchmarks that need missing NLTK data are reported as skipped.
+
+Usage::
+
+    # Run every benchmark on the small and medium corpora
+    python benchmarks/run.py --output results.json
+
+    # Run the tagger benchmarks on the large corpus
+    python benchmarks/run.py --size large --case "tags.*"
+
+    # Compare with a saved run; exits with status 1 on a regression
+    python benchmarks/run.py --baseline results.json --threshold 0.1
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import corpus
+import nltk
+
+from textblob import TextBlob, Word
+from textblob.classifiers import NaiveBayesClassifier
+from textblob.en import spelling
+from textblob.en.np_extractors import ConllExtractor, FastNPExtractor
+from textblob.en.taggers import NLTKTagger, PatternTagger
+
+#: Benchmarks by name. Each is a function that takes a list of labeled
+#: documents, does any untimed preparation and returns the function to time.
+CASES = {}
+
+#: Functions that reset global caches before each timed run
+SETUP = {}
+
+
+def case(name, setup=None):
+    def decorator(func):
+        CASES[name] = func
+        if setup is not None:
+            SETUP[name] = setup
+        return func
+
+    return decorator
+
+
+def texts(docs):
+    return [text for text, _ in docs]
+
+
+@case("words")
+def bench_words(docs):
+    return lambda: [TextBlob(text).words for text in texts(docs)]
+
+
+@case("sentences")
+def bench_sentences(docs):
+    return lambda: [TextBlob(text).sentences for text in texts(docs)]
+
+
+@case("tags.nltk")
+def bench_tags_nltk(docs):
+    tagger = NLTKTagger()
+    return lambda: [TextBlob(text, pos_tagger=tagger).tags for text in texts(docs)]
+
+
+@case("tags.pattern")
+def bench_tags_pattern(docs):
+    tagger = PatternTagger()
+    return lambda: [TextBlob(text, pos_tagger=tagger).tags for text in texts(docs)]
+
+
+@case("noun_phrases.fast")
+def bench_noun_phrases_fast(docs):
+    extractor = FastNPExtractor()
+    return lambda: [
+        TextBlob(text, np_extractor=extractor).noun_phrases for text in texts(docs)
+    ]
+
+
+@case("noun_phrases.conll")
+def bench_noun_phrases_conll(docs):
+    extractor = ConllExtractor()
+    return lambda: [
+        TextBlob(text, np_extractor=extractor).noun_phrases for text in texts(docs)
+    ]
+
+
+@case("sentiment")
+def bench_sentiment(docs):
+    return lambda: [TextBlob(text).sentiment for text in texts(docs)]
+
+
+@case("correct", setup=spelling.cache_clear)
+def bench_correct(docs):
+    return lambda: [TextBlob(text).correct() for text in texts(docs)]
+
+
+@case("parse")
+def bench_parse(docs):
+    return lambda: [TextBlob(text).parse() for text in texts(docs)]
+
+
+@case("pluralize")
+def bench_pluralize(docs):
+    words = [w.strip(".,!?") for text in texts(docs) for w in text.split()]
+    return lambda: [Word(w).pluralize() for w in words]
+
+
+@case("singularize")
+def bench_singularize(docs):
+    words = [w.strip(".,!?") for text in texts(docs) for w in text.split()]
+    return lambda: [Word(w).singularize() for w in words]
+
+
+@case("classifier.train")
+def bench_classifier_train(docs):
+    return lambda: NaiveBayesClassifier(list(docs)).classifier
+
+
+@case("classifier.train_sparse")
+def bench_classifier_train_sparse(docs):
+    return lambda: NaiveBayesClassifier(list(docs), sparse=True).classifier
+
+
+@case("classifier.classify")
+def bench_classifier_classify(docs):
+    # Train on a bounded number of documents, so that the size of the model
+    # does not depend on the size of the corpus.
+    classifier = NaiveBayesClassifier(docs[:100])
+    _ = classifier.classifier  # Train outside of the timed function.
+    return lambda: classifier.classify_many(texts(docs))
+
+
+def _reason(error):
+    lines = [line.strip() for line in str(error).splitlines() if line.strip()]
+    return f"{type(error).__name__}: {lines[0]}" if lines else type(error).__name__
+
+
+def measure(name, docs, repeat=3):
+    """Return the result of the benchmark ``name`` on ``docs`` as a dict."""
+    setup = SETUP.get(name, lambda: None)
+    try:
+        # Warm up: load models and corpora.
+        CASES[name](docs[:1])()
+        workload = CASES[name](docs)
+    except Exception as error:
+        return {"skipped": _reason(error)}
+    times = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        workload()
+        times.append(time.perf_counter() - start)
+    setup()
+    tracemalloc.start()
+    try:
+        workload()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    seconds = min(times)
+    tokens = sum(len(text.split()) for text in texts(docs))
+    return {
+        "docs": len(docs),
+        "tokens": tokens,
+        "seconds": seconds,
+        "docs_per_sec": len(docs) / seconds,
+        "tokens_per_sec": tokens / seconds,
+        "peak_memory": peak,
+    }
+
+
+def run(names, sizes, corpora, repeat=3, log=sys.stderr):
+    """Run the benchmarks and return the report as a dict."""
+    results = []
+    for corpus_name in corpora:
+        for size in sizes:
+            docs = corpus.load(corpus_name, size)
+            for name in names:
+                result = {"name": name, "corpus": corpus_name, "size": size}
+                result.update(measure(name, docs, repeat))
+                results.append(result)
+                print(_format_result(result), file=log)
+    try:
+        from importlib.metadata import version
+
+        textblob_version = version("textblob")
+    except Exception:
+        textblob_version = None
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "textblob": textblob_version,
+            "nltk": nltk.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _format_result(result):
+    label = f"{result['name']:<24} {result['corpus']:<10} {result['size']:<7}"
+    if "skipped" in result:
+        return f"{label} skipped ({result['skipped']})"
+    return (
+        f"{label} {result['docs_per_sec']:>10.1f} docs/s "
+        f"{result['tokens_per_sec']:>12.1f} tokens/s "
+        f"{result['peak_memory'] / 2**20:>8.1f} MiB"
+    )
+
+
+def compare(report, baseline, threshold=0.1):
+    """Compare the throughput of each benchmark in ``report`` to the same
+    benchmark in ``baseline``. Return a list of ``(result, ratio)`` tuples,
+    where ratio is the current divided by the baseline docs/sec, and whether
+    any benchmark is slower than the baseline by more than ``threshold``.
+    """
+
+    def key(result):
+        return result["name"], result["corpus"], result["size"]
+
+    baseline_results = {key(r): r for r in baseline["results"] if "skipped" not in r}
+    rows, regressed = [], False
+    for result in report["results"]:
+        previous = baseline_results.get(key(result))
+        if previous is None or "skipped" in result:
+            continue
+        ratio = result["docs_per_sec"] / previous["docs_per_sec"]
+        rows.append((result, ratio))
+        regressed = regressed or ratio < 1 - threshold
+    return rows, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--case",
+        action="append",
+        help="Benchmarks to run, as glob patterns (default: all). "
+        f"Available: {', '.join(CASES)}",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        choices=list(corpus.SIZES),
+        help="Corpus sizes (default: small and medium)",
+    )
+    parser.add_argument(
+        "--corpus",
+        action="append",
+        choices=list(corpus.CORPORA),
+        help="Corpora (default: synthetic)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="A JSON report to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The fraction by which a benchmark may be slower than the "
+        "baseline before it counts as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+    patterns = args.case or ["*"]
+    names = [n for n in CASES if any(fnmatch.fnmatch(n, p) for p in patterns)]
+    report = run(
+        names,
+        args.size or ["small", "medium"],
+        args.corpus or ["synthetic"],
+        repeat=args.repeat,
+    )
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        rows, regressed = compare(report, baseline, args.threshold)
+        for result, ratio in rows:
+            flag = "  REGRESSION" if ratio < 1 - args.threshold else ""
+            print(
+                f"{result['name']:<24} {result['corpus']:<10} {result['size']:<7} "
+                f"{ratio:>6.2f}x baseline{flag}",
+                file=sys.stderr,
+            )
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,9 @@
 URL: http://www.clips.ua.ac.be/pages/pattern-web
 Licence: BSD
 """
+import bisect
 import codecs
+import functools
 import os
 import re
 import string
@@ -11,6 +13,8 @@ import types
 from itertools import chain
 from xml.etree import ElementTree
 
+from textblob import cache, metrics
+
 basestring = (str, bytes)
 
 try:
@@ -359,6 +363,16 @@ def find_tokens(
     Punctuation marks are split from other words. Periods (or ?!) mark the end of a sentence.
     Headings without an ending period are inferred by line breaks.
     """
+    if (
+        isinstance(string, str)
+        and replace == _REPLACEMENTS
+        and linebreak == _LINEBREAK
+    ):
+        tokens = _scan_tokens(string, punctuation, abbreviations)
+        sentences = (
+            " ".join([t for t in tokens[i:j] if t != EOS]) for i, j in _find_sentences(tokens)
+        )
+        return [_merge_tokens(s) for s in sentences if s != ""]
     # Handle periods separately.
     punctuation = tuple(punctuation.replace(".", ""))
     # Handle replacements (contractions).
@@ -445,6 +459,155 @@ def find_tokens(
     return sentences
 
 
+# find_token_offsets() handles the default contractions and line breaks in a single scan:
+# the default replacements only split "n't" from the preceding word (the other contractions
+# start with a quote, which is split anyway), and two or more line breaks end a sentence.
+_REPLACEMENTS = dict(replacements)
+_LINEBREAK = r"\n{2,}"
+_QUOTES = "\"'“”‘’"
+_TOKENS = re.compile(
+    r"(?:\r?\n){2,}"  # Paragraph line breaks.
+    r"|[%s]" % _QUOTES  # Quotes.
+    + r"|(?:[^\s%sn]|n(?!'t))+|n" % _QUOTES  # Words, split before "n't".
+)
+# Tokens that end a sentence, and tokens that are part of the end of a sentence.
+# Quotes are never part of the end of a sentence: find_tokens() checks if they are
+# balanced by counting them in the sentence before it is filled, which always breaks.
+_SENTENCE_END = {"...", ".", "!", "?", EOS}
+_SENTENCE_TAIL = {"”", "’", "...", ".", "!", "?", ")", EOS}
+
+
+def _split_token(t, punctuation, abbreviations):
+    """Returns a tuple of tokens and a tuple of (token, start, end)-tuples for the given
+    whitespace-delimited string, where leading and trailing punctuation marks and periods
+    are split, as in find_tokens(). Offsets are relative to the start of the string.
+    """
+    if t[0] in "\r\n":
+        return (EOS,), ((EOS, 0, len(t)),)
+    tokens, tail = [], []
+    i, j = 0, len(t)
+    while t.startswith(punctuation):
+        # Split leading punctuation.
+        tokens.append((t[0], i, i + 1))
+        t = t[1:]
+        i += 1
+    while t.endswith(punctuation + (".",)):
+        # Split trailing punctuation.
+        if t.endswith(punctuation):
+            tail.append((t[-1], j - 1, j))
+            t = t[:-1]
+            j -= 1
+        # Split ellipsis (...) before splitting period.
+        if t.endswith("..."):
+            tail.append(("...", j - 3, j))
+            t = t[:-3].rstrip(".")
+            j = i + len(t)
+        # Split period (if not an abbreviation).
+        if t.endswith("."):
+            if (
+                t in abbreviations
+                or RE_ABBR1.match(t) is not None
+                or RE_ABBR2.match(t) is not None
+                or RE_ABBR3.match(t) is not None
+            ):
+                break
+            else:
+                tail.append((t[-1], j - 1, j))
+                t = t[:-1]
+                j -= 1
+    if t != "":
+        tokens.append((t, i, j))
+    tokens.extend(reversed(tail))
+    return tuple(t for t, _, _ in tokens), tuple(tokens)
+
+
+class _TokenCache(dict):
+    """A dictionary of whitespace-delimited strings => _split_token() tuples,
+    filled on lookup. Most words recur, so they only need to be split once.
+    """
+
+    def __init__(self, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, size=100000):
+        self.punctuation = tuple(punctuation.replace(".", ""))
+        self.abbreviations = abbreviations
+        self.size = size
+
+    def __missing__(self, t):
+        if len(self) >= self.size:
+            self.clear()
+        v = self[t] = _split_token(t, self.punctuation, self.abbreviations)
+        return v
+
+
+_token_cache = _TokenCache()
+
+
+def _scan_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, offsets=False):
+    """Returns the list of tokens in the given string, in a single scan.
+    With offsets=True, returns a list of (token, start, end)-tuples instead.
+    """
+    if punctuation == PUNCTUATION and abbreviations is ABBREVIATIONS:
+        split = _token_cache
+    else:
+        split = _TokenCache(punctuation, abbreviations)
+    if not offsets:
+        return [t for w in _TOKENS.findall(string) for t in split[w][0]]
+    words = [(m.start(), split[m.group()][1]) for m in _TOKENS.finditer(string)]
+    return [(t, k + i, k + j) for k, a in words for t, i, j in a]
+
+
+def _find_sentences(tokens):
+    """Returns a list of (i, j)-tuples, where tokens[i:j] is a sentence (possibly empty,
+    or followed by the END-OF-SENTENCE tokens it ends with).
+    """
+    # Handle citations, trailing parenthesis, repeated punctuation (!?).
+    sentences, i, n = [], 0, len(tokens)
+    for j in [k for k, t in enumerate(tokens) if t in _SENTENCE_END]:
+        if j < i:
+            continue
+        while j < n and tokens[j] in _SENTENCE_TAIL:
+            j += 1
+        sentences.append((i, j))
+        i = j
+    sentences.append((i, n))
+    return sentences
+
+
+def _merge_tokens(s):
+    """Returns the given space-separated string of tokens with sarcasm (!) and emoticons merged."""
+    s = RE_SARCASM.sub("(!)", s)
+    s = RE_EMOTICONS.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), s)
+    return s
+
+
+def find_token_offsets(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS):
+    """Returns a list of (sentence, start, end, tokens)-tuples for the given string,
+    where sentence is the space-separated string of tokens returned by find_tokens(),
+    tokens is a list of (token, start, end)-tuples,
+    and start and end are character offsets in the given string.
+    Merged tokens (e.g., emoticons) span the whitespace between their parts.
+    """
+    offsets = _scan_tokens(string, punctuation, abbreviations, offsets=True)
+    tokens = [t for t, _, _ in offsets]
+    a = []
+    for i, j in _find_sentences(tokens):
+        s = [x for x in offsets[i:j] if x[0] != EOS]
+        if len(s) == 0:
+            continue
+        sentence = " ".join([t for t, _, _ in s])
+        merged = _merge_tokens(sentence)
+        if merged != sentence:
+            # Merging only removes spaces, so each token is a run of consecutive tokens.
+            s, tokens_ = [], iter(s)
+            for t in merged.split(" "):
+                w, i, j = next(tokens_)
+                while len(w) < len(t):
+                    x, _, j = next(tokens_)
+                    w += x
+                s.append((t, i, j))
+        a.append((merged, s[0][1], s[-1][2], s))
+    return a
+
+
 #### LEXICON #######################################################################################
 
 # --- LEXICON ---------------------------------------------------------------------------------------
@@ -456,6 +619,15 @@ def find_tokens(
 # Named entity rules are used to discover proper nouns (NNP's).
 
 
+def _cached(path, build):
+    """Returns the data built from the file at the given path, using the
+    compiled on-disk cache if it is up-to-date (see textblob.cache).
+    """
+    if isinstance(path, basestring) and os.path.isfile(path):
+        return cache.cached(os.path.basename(path), path, build)
+    return build()
+
+
 def _read(path, encoding="utf-8", comment=";;;"):
     """Returns an iterator over the lines in the file at the given path,
     stripping comments and decoding each line to Unicode.
@@ -505,9 +677,13 @@ class Lexicon(lazydict):
         self.context = Context(self, path=context)
         self.entities = Entities(self, path=entities, tag=NNP)
 
+    @metrics.timed("lazydict")
     def load(self):
         # Arnold NNP x
-        dict.update(self, (x.split(" ")[:2] for x in _read(self._path) if x.strip()))
+        def build():
+            return dict(x.split(" ")[:2] for x in _read(self._path) if x.strip())
+
+        dict.update(self, _cached(self._path, build))
 
     @property
     def path(self):
@@ -557,46 +733,75 @@ class Morphology(lazylist, Rules):
         cmd.update(("f" + k, v) for k, v in list(cmd.items()))
         Rules.__init__(self, lexicon, cmd)
         self._path = path
+        self._compiled = None
 
     @property
     def path(self):
         return self._path
 
+    @metrics.timed("lazylist")
     def load(self):
         # ["NN", "s", "fhassuf", "1", "NNS", "x"]
-        list.extend(self, (x.split() for x in _read(self._path)))
+        def build():
+            return [x.split() for x in _read(self._path)]
+
+        list.extend(self, _cached(self._path, build))
 
     def apply(self, token, previous=(None, None), next=(None, None)):
         """Applies lexical rules to the given token, which is a [word, tag] list."""
+        rules, index = self._compile()
         w = token[0]
-        for r in self:
+        known = self.lexicon.__contains__
+        if isinstance(self.lexicon, lazydict) and len(self.lexicon) > 0:
+            # Bypass lazydict.__contains__ once the lexicon is loaded.
+            known = functools.partial(dict.__contains__, self.lexicon)
+        # Collect the rules that match the word, then apply them in order.
+        m = []
+        for x, ids in index["char"].items():
+            if x in w:
+                m.extend(ids)
+        for x, ids in index["addpref"].items():
+            if known(x + w):
+                m.extend(ids)
+        for x, ids in index["addsuf"].items():
+            if known(w + x):
+                m.extend(ids)
+        for n in range(len(w) + 1):
+            prefix, suffix = w[:n], w[len(w) - n :]
+            m.extend(index["haspref"].get(prefix, ()))
+            m.extend(index["hassuf"].get(suffix, ()))
+            if prefix in index["deletepref"] and known(w[n:]):
+                m.extend(index["deletepref"][prefix])
+            if suffix in index["deletesuf"] and known(w[:-n]):
+                m.extend(index["deletesuf"][suffix])
+        m.extend(index["goodleft"].get(next[0], ()))
+        m.extend(index["goodright"].get(previous[0], ()))
+        for i in sorted(m):
+            f, tag, pos = rules[i]
+            if f and token[1] != tag:
+                continue
+            token[1] = pos
+        return token
+
+    def _compile(self):
+        """Returns a list of (f, tag, pos)-tuples for each rule, where rules with f=True
+        only apply to words tagged tag, and a dictionary of command => x => [rule index],
+        so that the rules that match a word can be found with a lookup for each affix.
+        """
+        n = len(self)
+        if self._compiled is not None and self._compiled[0] == n:
+            return self._compiled[1]
+        rules = []
+        index = dict((cmd, {}) for cmd in self.cmd if not cmd.startswith("f"))
+        for i, r in enumerate(self):
             if r[1] in self.cmd:  # Rule = ly hassuf 2 RB x
                 f, x, pos, cmd = bool(0), r[0], r[-2], r[1].lower()
             if r[2] in self.cmd:  # Rule = NN s fhassuf 1 NNS x
                 f, x, pos, cmd = bool(1), r[1], r[-2], r[2].lower().lstrip("f")
-            if f and token[1] != r[0]:
-                continue
-            if (
-                (cmd == "char" and x in w)
-                or (cmd == "haspref" and w.startswith(x))
-                or (cmd == "hassuf" and w.endswith(x))
-                or (cmd == "addpref" and x + w in self.lexicon)
-                or (cmd == "addsuf" and w + x in self.lexicon)
-                or (
-                    cmd == "deletepref"
-                    and w.startswith(x)
-                    and w[len(x) :] in self.lexicon
-                )
-                or (
-                    cmd == "deletesuf"
-                    and w.endswith(x)
-                    and w[: -len(x)] in self.lexicon
-                )
-                or (cmd == "goodleft" and x == next[0])
-                or (cmd == "goodright" and x == previous[0])
-            ):
-                token[1] = pos
-        return token
+            rules.append((f, r[0], pos))
+            index[cmd].setdefault(x, []).append(i)
+        self._compiled = (n, (rules, index))
+        return self._compiled[1]
 
     def insert(self, i, tag, affix, cmd="hassuf", tagged=None):
         """Inserts a new rule that assigns the given tag to words with the given affix,
@@ -613,6 +818,7 @@ class Morphology(lazylist, Rules):
         else:
             r = [affix, cmd.lstrip("f"), tag, "x"]
         lazylist.insert(self, i, r)
+        self._compiled = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self) - 1, *args, **kwargs)
@@ -629,6 +835,54 @@ class Morphology(lazylist, Rules):
 # VBD VB PREVTAG TO => unknown word tagged VBD changes to VB if preceded by a word tagged TO.
 
 
+# For each contextual rule command, a function that returns the values of x
+# (or of (x, y) for _CONTEXT_XY commands) for which the rule matches token t[i].
+# The prev1or2or3wd and next1or2or3wd commands are never applied.
+_CONTEXT_KEYS = {
+    "prevtag": lambda t, i: (t[i - 1][1],),
+    "nexttag": lambda t, i: (t[i + 1][1],),
+    "prev2tag": lambda t, i: (t[i - 2][1],),
+    "next2tag": lambda t, i: (t[i + 2][1],),
+    "prev1or2tag": lambda t, i: (t[i - 1][1], t[i - 2][1]),
+    "next1or2tag": lambda t, i: (t[i + 1][1], t[i + 2][1]),
+    "prev1or2or3tag": lambda t, i: (t[i - 1][1], t[i - 2][1], t[i - 3][1]),
+    "next1or2or3tag": lambda t, i: (t[i + 1][1], t[i + 2][1], t[i + 3][1]),
+    "surroundtag": lambda t, i: ((t[i - 1][1], t[i + 1][1]),),
+    "curwd": lambda t, i: (t[i][0],),
+    "prevwd": lambda t, i: (t[i - 1][0],),
+    "nextwd": lambda t, i: (t[i + 1][0],),
+    "prev1or2wd": lambda t, i: (t[i - 1][0], t[i - 2][0]),
+    "next1or2wd": lambda t, i: (t[i + 1][0], t[i + 2][0]),
+    "prevwdtag": lambda t, i: ((t[i - 1][0], t[i - 1][1]),),
+    "nextwdtag": lambda t, i: ((t[i + 1][0], t[i + 1][1]),),
+    "wdprevtag": lambda t, i: ((t[i - 1][1], t[i][0]),),
+    "wdnexttag": lambda t, i: ((t[i][0], t[i + 1][1]),),
+    "wdand2aft": lambda t, i: ((t[i][0], t[i + 2][0]),),
+    "wdand2tagbfr": lambda t, i: ((t[i - 2][1], t[i][0]),),
+    "wdand2tagaft": lambda t, i: ((t[i][0], t[i + 2][1]),),
+    "lbigram": lambda t, i: ((t[i - 1][0], t[i][0]),),
+    "rbigram": lambda t, i: ((t[i][0], t[i + 1][0]),),
+    "prevbigram": lambda t, i: ((t[i - 2][1], t[i - 1][1]),),
+    "nextbigram": lambda t, i: ((t[i + 1][1], t[i + 2][1]),),
+}
+_CONTEXT_XY = set(
+    (
+        "surroundtag",
+        "prevwdtag",
+        "nextwdtag",
+        "wdprevtag",
+        "wdnexttag",
+        "wdand2aft",
+        "wdand2tagbfr",
+        "wdand2tagaft",
+        "lbigram",
+        "rbigram",
+        "prevbigram",
+        "nextbigram",
+    )
+)
+
+
 class Context(lazylist, Rules):
     def __init__(self, lexicon=None, path=""):
         """A list of rules based on context (preceding and following words)."""
@@ -665,64 +919,67 @@ class Context(lazylist, Rules):
         )
         Rules.__init__(self, lexicon, dict.fromkeys(cmd, True))
         self._path = path
+        self._compiled = None
 
     @property
     def path(self):
         return self._path
 
+    @metrics.timed("lazylist")
     def load(self):
         # ["VBD", "VB", "PREVTAG", "TO"]
-        list.extend(self, (x.split() for x in _read(self._path)))
+        def build():
+            return [x.split() for x in _read(self._path)]
+
+        list.extend(self, _cached(self._path, build))
 
     def apply(self, tokens):
         """Applies contextual rules to the given list of tokens,
         where each token is a [word, tag] list.
         """
+        rules = self._compile()
+        default = rules.get("*", ())
         o = [("STAART", "STAART")] * 3  # Empty delimiters for look ahead/back.
         t = o + tokens + o
         for i, token in enumerate(t):
-            for r in self:
-                if token[1] == "STAART":
+            if token[1] == "STAART":
+                continue
+            # All rules for the token's (original) tag that match are applied in order,
+            # so the tag of the matching rule that comes last wins.
+            best = None
+            for keys, matches in rules.get(token[1], default):
+                for k in keys(t, i):
+                    m = matches.get(k)
+                    if m is not None and (best is None or m[0] > best[0]):
+                        best = m
+            if best is not None:
+                t[i] = [t[i][0], best[1]]
+        return t[len(o) : -len(o)]
+
+    def _compile(self):
+        """Returns the rules as a dictionary indexed by tag (or "*" for rules for any tag),
+        with for each rule command a (keys, matches)-tuple, where keys(t, i) returns the
+        x-values (or (x, y)-tuples) for which rules with the command match t[i],
+        and matches is a dictionary of x-value => (rule index, new tag).
+        """
+        n = len(self)
+        if self._compiled is not None and self._compiled[0] == n:
+            return self._compiled[1]
+        rules = list(enumerate(self))
+        compiled = {}
+        for tag in set(r[0] for i, r in rules):
+            commands = {}
+            for i, r in rules:
+                if r[0] not in (tag, "*"):
                     continue
-                if token[1] != r[0] and r[0] != "*":
+                cmd, x, y = r[2].lower(), r[3], r[4] if len(r) > 4 else ""
+                if cmd not in _CONTEXT_KEYS:
                     continue
-                cmd, x, y = r[2], r[3], r[4] if len(r) > 4 else ""
-                cmd = cmd.lower()
-                if (
-                    (cmd == "prevtag" and x == t[i - 1][1])
-                    or (cmd == "nexttag" and x == t[i + 1][1])
-                    or (cmd == "prev2tag" and x == t[i - 2][1])
-                    or (cmd == "next2tag" and x == t[i + 2][1])
-                    or (cmd == "prev1or2tag" and x in (t[i - 1][1], t[i - 2][1]))
-                    or (cmd == "next1or2tag" and x in (t[i + 1][1], t[i + 2][1]))
-                    or (
-                        cmd == "prev1or2or3tag"
-                        and x in (t[i - 1][1], t[i - 2][1], t[i - 3][1])
-                    )
-                    or (
-                        cmd == "next1or2or3tag"
-                        and x in (t[i + 1][1], t[i + 2][1], t[i + 3][1])
-                    )
-                    or (cmd == "surroundtag" and x == t[i - 1][1] and y == t[i + 1][1])
-                    or (cmd == "curwd" and x == t[i + 0][0])
-                    or (cmd == "prevwd" and x == t[i - 1][0])
-                    or (cmd == "nextwd" and x == t[i + 1][0])
-                    or (cmd == "prev1or2wd" and x in (t[i - 1][0], t[i - 2][0]))
-                    or (cmd == "next1or2wd" and x in (t[i + 1][0], t[i + 2][0]))
-                    or (cmd == "prevwdtag" and x == t[i - 1][0] and y == t[i - 1][1])
-                    or (cmd == "nextwdtag" and x == t[i + 1][0] and y == t[i + 1][1])
-                    or (cmd == "wdprevtag" and x == t[i - 1][1] and y == t[i + 0][0])
-                    or (cmd == "wdnexttag" and x == t[i + 0][0] and y == t[i + 1][1])
-                    or (cmd == "wdand2aft" and x == t[i + 0][0] and y == t[i + 2][0])
-                    or (cmd == "wdand2tagbfr" and x == t[i - 2][1] and y == t[i + 0][0])
-                    or (cmd == "wdand2tagaft" and x == t[i + 0][0] and y == t[i + 2][1])
-                    or (cmd == "lbigram" and x == t[i - 1][0] and y == t[i + 0][0])
-                    or (cmd == "rbigram" and x == t[i + 0][0] and y == t[i + 1][0])
-                    or (cmd == "prevbigram" and x == t[i - 2][1] and y == t[i - 1][1])
-                    or (cmd == "nextbigram" and x == t[i + 1][1] and y == t[i + 2][1])
-                ):
-                    t[i] = [t[i][0], r[1]]
-        return t[len(o) : -len(o)]
+                matches = commands.setdefault(cmd, {})
+                matches[(x, y) if cmd in _CONTEXT_XY else x] = (i, r[1])
+            compiled[tag] = [(_CONTEXT_KEYS[cmd], m) for cmd, m in commands.items()]
+        self._compiled = (n, compiled)
+        return compiled
 
     def insert(self, i, tag1, tag2, cmd="prevtag", x=None, y=None):
         """Inserts a new rule that updates words with tag1 to tag2,
@@ -735,6 +992,7 @@ class Context(lazylist, Rules):
             x, tag1 = tag1.split(" > ")
             cmd = "nexttag"
         lazylist.insert(self, i, [tag1, tag2, cmd, x or "", y or ""])
+        self._compiled = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self) - 1, *args, **kwargs)
@@ -773,12 +1031,18 @@ class Entities(lazydict, Rules):
     def path(self):
         return self._path
 
+    @metrics.timed("lazydict")
     def load(self):
         # ["Alexander", "the", "Great", "PERS"]
         # {"alexander": [["alexander", "the", "great", "pers"], ...]}
-        for x in _read(self.path):
-            x = [x.lower() for x in x.split()]
-            dict.setdefault(self, x[0], []).append(x)
+        def build():
+            entities = {}
+            for x in _read(self.path):
+                x = [x.lower() for x in x.split()]
+                entities.setdefault(x[0], []).append(x)
+            return entities
+
+        dict.update(self, _cached(self.path, build))
 
     def apply(self, tokens):
         """Applies the named entity recognizer to the given list of tokens,
@@ -898,14 +1162,37 @@ class Sentiment(lazydict):
     def confidence(self):
         return self._confidence
 
+    @metrics.timed("lazydict")
     def load(self, path=None):
         """Loads the XML-file (with sentiment annotations) from the given path.
-        By default, Sentiment.path is lazily loaded.
+        By default, Sentiment.path is lazily loaded,
+        from the compiled on-disk cache if it is up-to-date (see textblob.cache).
         """
+        if path:
+            self._load(path)
+            return
+        if not os.path.exists(self._path):
+            return
+
+        def build():
+            self._load(self._path)
+            return dict.copy(self), self._synsets, self.labeler, self._language
+
+        words, synsets, labels, language = cache.cached(
+            os.path.basename(self._path),
+            self._path,
+            build,
+            params=(type(self).__qualname__, self._synset, self._confidence),
+        )
+        dict.update(self, words)
+        dict.update(self.labeler, labels)
+        dict.update(self._synsets, synsets)
+        self._language = language
+
+    def _load(self, path):
+        """Parses the XML-file at the given path into the dictionary."""
         # <word form="great" wordnet_id="a-01123879" pos="JJ" polarity="1.0" subjectivity="1.0" intensity="1.0" />
         # <word form="damnmit" polarity="-0.75" subjectivity="1.0" label="profanity" />
-        if not path:
-            path = self._path
         if not os.path.exists(path):
             return
         words, synsets, labels = {}, {}, {}
@@ -1321,6 +1608,8 @@ def find_chunks(tagged, language="en"):
     """
     chunked = [x for x in tagged]
     tags = "".join(f"{tag}{SEPARATOR}" for token, tag in tagged)
+    # Offsets of the separators inside the tags-string.
+    separators = [m.start() for m in re.finditer(re.escape(SEPARATOR), tags)]
     # Use Germanic or Romance chunking rules according to given language.
     for tag, rule in CHUNKS[
         int(language in ("ca", "es", "pt", "fr", "it", "pt", "ro"))
@@ -1328,9 +1617,8 @@ def find_chunks(tagged, language="en"):
         for m in rule.finditer(tags):
             # Find the start of chunks inside the tags-string.
             # Number of preceding separators = number of preceding tokens.
-            i = m.start()
-            j = tags[:i].count(SEPARATOR)
-            n = m.group(0).count(SEPARATOR)
+            j = bisect.bisect_left(separators, m.start())
+            n = bisect.bisect_left(separators, m.end()) - j
             for k in range(j, j + n):
                 if len(chunked[k]) == 3:
                     continue
@@ -1374,13 +1662,16 @@ def find_prepositions(chunked):
             ):
                 chunk[-1] = "B-PNP"
                 pp = True
-                for ch in chunked[i + 1 :]:
+                for j in range(i + 1, len(chunked)):
+                    ch = chunked[j]
                     if not (ch[2].endswith(("NP", "PP")) or ch[1] in ("VBG", "VBN")):
                         break
-                    if ch[2].endswith("PP") and pp:
-                        ch[-1] = "I-PNP"
+                    if ch[2].endswith("PP") and not pp:
+                        # This PP starts a PNP of its own, further on in the outer loop,
+                        # which marks the same tokens as continuing the scan here would.
+                        break
+                    ch[-1] = "I-PNP"
                     if not ch[2].endswith("PP"):
-                        ch[-1] = "I-PNP"
                         pp = False
     return chunked
 
@@ -1450,6 +1741,17 @@ class Parser:
             linebreak=r"\n{2,}",
         )
 
+    def find_token_offsets(self, string, **kwargs):
+        """Returns a list of (sentence, start, end, tokens)-tuples from the given string,
+        where tokens is a list of (token, start, end)-tuples with character offsets.
+        """
+        # "The cat purs." => [("The cat purs .", 0, 13, [("The", 0, 3), ...])]
+        return find_token_offsets(
+            str(string),
+            punctuation=kwargs.get("punctuation", PUNCTUATION),
+            abbreviations=kwargs.get("abbreviations", ABBREVIATIONS),
+        )
+
     def find_tags(self, tokens, **kwargs):
         """Annotates the given list of tokens with part-of-speech tags.
         Returns a list of tokens, where each token is now a [word, tag]-list.
@@ -1485,7 +1787,7 @@ class Parser:
         """Annotates the given list of tokens with word lemmata."""
         return [token + [token[0].lower()] for token in tokens]
 
-    def parse(
+    def annotate(
         self,
         s,
         tokenize=True,
@@ -1496,15 +1798,11 @@ class Parser:
         encoding="utf-8",
         **kwargs,
     ):
-        """Takes a string (sentences) and returns a tagged Unicode string (TaggedString).
-        Sentences in the output are separated by newlines.
-        With tokenize=True, punctuation is split from words and sentences are separated by \n.
-        With tags=True, part-of-speech tags are parsed (NN, VB, IN, ...).
-        With chunks=True, phrase chunk tags are parsed (NP, VP, PP, PNP, ...).
-        With relations=True, semantic role labels are parsed (SBJ, OBJ).
-        With lemmata=True, word lemmata are parsed.
-        Optional parameters are passed to
-        the tokenizer, tagger, chunker, labeler and lemmatizer.
+        """Takes a string (sentences) and returns a list of sentences,
+        where each sentence is a list of tokens and each token is a list of word + tags,
+        e.g., [[["The", "DT", "B-NP", "O"], ["cat", "NN", "I-NP", "O"]]].
+        This is the same as Parser.parse(s, ...).split(), without building the tagged string.
+        The parameters are the same as for Parser.parse().
         """
         # Tokenizer.
         if tokenize:
@@ -1532,6 +1830,33 @@ class Parser:
             # Lemmatizer.
             if lemmata:
                 s[i] = self.find_lemmata(s[i], **kwargs)
+        return s
+
+    def parse(
+        self,
+        s,
+        tokenize=True,
+        tags=True,
+        chunks=True,
+        relations=False,
+        lemmata=False,
+        encoding="utf-8",
+        **kwargs,
+    ):
+        """Takes a string (sentences) and returns a tagged Unicode string (TaggedString).
+        Sentences in the output are separated by newlines.
+        With tokenize=True, punctuation is split from words and sentences are separated by \n.
+        With tags=True, part-of-speech tags are parsed (NN, VB, IN, ...).
+        With chunks=True, phrase chunk tags are parsed (NP, VP, PP, PNP, ...).
+        With relations=True, semantic role labels are parsed (SBJ, OBJ).
+        With lemmata=True, word lemmata are parsed.
+        Optional parameters are passed to
+        the tokenizer, tagger, chunker, labeler and lemmatizer.
+        See also Parser.annotate().
+        """
+        s = self.annotate(
+            s, tokenize, tags, chunks, relations, lemmata, encoding, **kwargs
+        )
         # Slash-formatted tagged string.
         # With collapse=False (or split=True), returns raw list
         # (this output is not usable by tree.Text).
@@ -1613,17 +1938,107 @@ class TaggedString(str):
 #### SPELLING CORRECTION ###########################################################################
 # Based on: Peter Norvig, "How to Write a Spelling Corrector", http://norvig.com/spell-correct.html
 
+# The optional symmetric delete index is based on: Wolf Garbe, SymSpell,
+# https://github.com/wolfgarbe/SymSpell
+# Instead of generating every edit of a misspelled word, the known words are indexed by
+# every string that is 0-2 deletions away from them. Two words with edit distance 1-2
+# share at least one such string, so candidates can be found with a few dictionary lookups.
+
+
+def _deletes(w, depth=2):
+    """Returns the set of strings with 0-depth characters deleted from the given word."""
+    a = edge = {w}
+    for _ in range(depth):
+        edge = {e[:i] + e[i + 1 :] for e in edge for i in range(len(e))}
+        a = a | edge
+    return a
+
+
+def _distance(a, b):
+    """Returns the Damerau-Levenshtein edit distance between the given strings,
+    i.e., the number of characters deleted, swapped, replaced or inserted.
+    """
+    # Lowrance & Wagner's algorithm, which also counts swaps of characters
+    # with other characters deleted or inserted in between ("ca" => "abc").
+    n, m = len(a), len(b)
+    x = n + m
+    d = [[x] * (m + 2)] + [[x] + list(range(m + 1)) for _ in range(n + 1)]
+    for i in range(n + 1):
+        d[i + 1][1] = i
+    last = {}
+    for i in range(1, n + 1):
+        db = 0
+        for j in range(1, m + 1):
+            k, h = last.get(b[j - 1], 0), db
+            if a[i - 1] == b[j - 1]:
+                cost, db = 0, j
+            else:
+                cost = 1
+            d[i + 1][j + 1] = min(
+                d[i][j] + cost,
+                d[i + 1][j] + 1,
+                d[i][j + 1] + 1,
+                d[k][h] + (i - k - 1) + 1 + (j - h - 1),
+            )
+        last[a[i - 1]] = i
+    return d[n + 1][m + 1]
+
 
 class Spelling(lazydict):
     ALPHA = "abcdefghijklmnopqrstuvwxyz"
 
-    def __init__(self, path=""):
+    def __init__(self, path="", use_index=False, cache_size=10000):
+        """A spelling corrector that suggests the most probable known words.
+        With use_index=True, known words are looked up in a symmetric delete index,
+        which is cached on disk (see textblob.cache) and much faster for misspelled words.
+        The suggestions are the same.
+        The suggestions for the last cache_size distinct words are kept in memory.
+        """
         self._path = path
-
+        self._index = None
+        # Whether the known words were changed after they were loaded.
+        self._changed = False
+        self.use_index = use_index
+        # Most words recur (e.g., "the", "teh"), so suggestions are memoized.
+        self._suggest_cached = functools.lru_cache(maxsize=cache_size)(self._suggest)
+
+    @metrics.timed("lazydict")
     def load(self):
         for x in _read(self._path):
             x = x.split()
             dict.__setitem__(self, x[0], int(x[1]))
+        self.cache_clear()
+
+    def _lazy(self, method, *args):
+        if method in ("__setitem__", "setdefault", "update", "pop", "popitem"):
+            value = lazydict._lazy(self, method, *args)
+            # Keep calling this method, rather than the dict method set by lazydict.
+            self.__dict__.pop(method, None)
+            self._invalidate()
+            return value
+        return lazydict._lazy(self, method, *args)
+
+    def __delitem__(self, *args):
+        dict.__delitem__(self, *args)
+        self._invalidate()
+
+    def clear(self):
+        dict.clear(self)
+        self._invalidate()
+
+    def _invalidate(self):
+        """Discards the index and the suggestions, which depend on the known words."""
+        self._changed = True
+        self._index = None
+        self.cache_clear()
+
+    def cache_info(self):
+        """Returns the hits, misses, maxsize and currsize of the suggestion cache."""
+        return self._suggest_cached.cache_info()
+
+    def cache_clear(self):
+        """Clears the suggestion cache, e.g., after words are added."""
+        self._suggest_cached.cache_clear()
 
     @property
     def path(self):
@@ -1666,6 +2081,46 @@ class Spelling(lazydict):
         # Only keep candidates that are actually known words (20% speedup).
         return set(e2 for e1 in self._edit1(w) for e2 in self._edit1(e1) if e2 in self)
 
+    def index(self):
+        """Returns the symmetric delete index of known words,
+        a dictionary of strings => space-separated known words with 0-2 characters deleted,
+        or None if some known words have characters that are not in Spelling.ALPHA.
+        """
+        if len(self) == 0:
+            self.load()
+        if self._index is None:
+
+            def build():
+                if any(w.strip(Spelling.ALPHA) for w in self):
+                    # Only words with the letters of _edit1() are indexed.
+                    return False
+                index = {}
+                for w in self:
+                    for x in _deletes(w):
+                        index[x] = x in index and index[x] + " " + w or w
+                return index
+
+            # The on-disk cache is keyed by the file, so it only holds the index
+            # of the words in the file.
+            self._index = build() if self._changed else _cached(self._path, build)
+        return self._index or None
+
+    def _search(self, w):
+        """Returns a list of sets of known words with edit distance 1 and 2 from the given word,
+        using the symmetric delete index.
+        """
+        index = self.index()
+        candidates = set()
+        for x in _deletes(w):
+            if x in index:
+                candidates.update(index[x].split(" "))
+        a = (set(), set())
+        for c in candidates:
+            n = _distance(w, c)
+            if 0 < n <= 2 and c in self:
+                a[n - 1].add(c)
+        return a
+
     def _known(self, words=None):
         """Returns the given list of words filtered by known words."""
         if words is None:
@@ -1678,6 +2133,9 @@ class Spelling(lazydict):
         """
         if len(self) == 0:
             self.load()
+        return list(self._suggest_cached(w))
+
+    def _suggest(self, w):
         if len(w) == 1:
             return [(w, 1.0)]  # I
         if w in PUNCTUATION:
@@ -1686,12 +2144,16 @@ class Spelling(lazydict):
             return [(w, 1.0)]  # \n
         if w.replace(".", "").isdigit():
             return [(w, 1.0)]  # 1.5
-        candidates = (
-            self._known([w])
-            or self._known(self._edit1(w))
-            or self._known(self._edit2(w))
-            or [w]
-        )
+        if self.use_index and w not in self and self.index() is not None:
+            candidates = self._search(w)
+            candidates = candidates[0] or candidates[1] or [w]
+        else:
+            candidates = (
+                self._known([w])
+                or self._known(self._edit1(w))
+                or self._known(self._edit2(w))
+                or [w]
+            )
         candidates = [(self.get(c, 0.0), c) for c in candidates]
         s = float(sum(p for p, word in candidates) or 1)
         candidates = sorted(((p / s, word) for p, word in candidates), reverse=True)
@@ -22,7 +22,8 @@ Example usage: ::
 
 import json
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import chain
 
 import nltk
 
@@ -38,12 +39,18 @@ from textblob.en import suggest
 from textblob.inflect import pluralize as _pluralize
 from textblob.inflect import singularize as _singularize
 from textblob.mixins import BlobComparableMixin, StringlikeMixin
-from textblob.np_extractors import FastNPExtractor
+from textblob.np_extractors import ConllExtractor, FastNPExtractor
 from textblob.parsers import PatternParser
 from textblob.sentiments import PatternAnalyzer
 from textblob.taggers import NLTKTagger
-from textblob.tokenizers import WordTokenizer, sent_tokenize, word_tokenize
-from textblob.utils import PUNCTUATION_REGEX, lowerstrip
+from textblob.tokenizers import WordTokenizer, exclude_punc, sent_word_tokenize
+from textblob.utils import (
+    PUNCTUATION_REGEX,
+    batched,
+    lowerstrip,
+    process_map,
+    resolve_n_jobs,
+)
 
 # Wordnet interface
 # NOTE: textblob.wordnet is not imported so that the wordnet corpus can be lazy-loaded
@@ -51,6 +58,9 @@ _wordnet = nltk.corpus.wordnet
 
 basestring = (str, bytes)
 
+# Computes polarity and subjectivity, whatever the blob's analyzer
+_pattern_analyzer = PatternAnalyzer()
+
 
 def _penn_to_wordnet(tag):
     """Converts a Penn corpus tag into a Wordnet tag."""
@@ -384,6 +394,15 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
             self, tokenizer, pos_tagger, np_extractor, analyzer, parser, classifier
         )
 
+    @cached_property
+    def _segments(self):
+        """The sentences of the blob and the word tokens of each sentence, as
+        a list of ``(sentence, tokens)`` tuples. The text is segmented once
+        and the result is shared by ``words``, ``tokens``, ``sentences``,
+        ``pos_tags`` and ``noun_phrases``.
+        """
+        return sent_word_tokenize(self.raw)
+
     @cached_property
     def words(self):
         """Return a list of word tokens. This excludes punctuation characters.
@@ -392,13 +411,18 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :returns: A :class:`WordList <WordList>` of word tokens.
         """
-        return WordList(word_tokenize(self.raw, include_punc=False))
+        return WordList(
+            chain.from_iterable(exclude_punc(tokens) for _, tokens in self._segments)
+        )
 
     @cached_property
     def tokens(self):
         """Return a list of tokens, using this blob's tokenizer object
         (defaults to :class:`WordTokenizer <textblob.tokenizers.WordTokenizer>`).
         """
+        if type(self.tokenizer) is WordTokenizer:
+            # Same result as WordTokenizer().tokenize(self.raw)
+            return WordList(chain.from_iterable(t for _, t in self._segments))
         return WordList(self.tokenizer.tokenize(self.raw))
 
     def tokenize(self, tokenizer=None):
@@ -427,6 +451,27 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
             raise NameError("This blob has no classifier. Train one first!")
         return self.classifier.classify(self.raw)
 
+    @cached_property
+    def classification(self):
+        """The label assigned to the blob by its ``classifier``. Unlike
+        :meth:`classify`, the result is computed once and cached.
+
+        .. versionadded:: 0.19.0
+        """
+        return self.classify()
+
+    @cached_property
+    def _pattern_sentiment(self):
+        """The result of :class:`PatternAnalyzer
+        <textblob.en.sentiments.PatternAnalyzer>`, with assessments. The text
+        is scored once and the result is shared by ``sentiment``,
+        ``sentiment_assessments``, ``polarity`` and ``subjectivity``.
+        """
+        return _pattern_analyzer.analyze(self.raw, keep_assessments=True)
+
+    def _uses_pattern_analyzer(self):
+        return type(self.analyzer) is PatternAnalyzer
+
     @cached_property
     def sentiment(self):
         """Return a tuple of form (polarity, subjectivity ) where polarity
@@ -436,6 +481,8 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: namedtuple of the form ``Sentiment(polarity, subjectivity)``
         """
+        if self._uses_pattern_analyzer():
+            return PatternAnalyzer.RETURN_TYPE(*self._pattern_sentiment[:2])
         return self.analyzer.analyze(self.raw)
 
     @cached_property
@@ -449,6 +496,8 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         :rtype: namedtuple of the form ``Sentiment(polarity, subjectivity,
         assessments)``
         """
+        if self._uses_pattern_analyzer():
+            return self._pattern_sentiment
         return self.analyzer.analyze(self.raw, keep_assessments=True)
 
     @cached_property
@@ -457,7 +506,7 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: float
         """
-        return PatternAnalyzer().analyze(self.raw)[0]
+        return self._pattern_sentiment.polarity
 
     @cached_property
     def subjectivity(self):
@@ -466,15 +515,20 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: float
         """
-        return PatternAnalyzer().analyze(self.raw)[1]
+        return self._pattern_sentiment.subjectivity
 
     @cached_property
     def noun_phrases(self):
         """Returns a list of noun phrases for this blob."""
+        if type(self.np_extractor) in (FastNPExtractor, ConllExtractor):
+            # The built-in extractors can reuse the blob's segmentation
+            text = self
+        else:
+            text = self.raw
         return WordList(
             [
                 phrase.strip().lower()
-                for phrase in self.np_extractor.extract(self.raw)
+                for phrase in self.np_extractor.extract(text)
                 if len(phrase) > 1
             ]
         )
@@ -551,8 +605,9 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         """
         # regex matches: word or punctuation or whitespace
         tokens = nltk.tokenize.regexp_tokenize(self.raw, r"\w+|[^\w\s]|\s")
-        corrected = (Word(w).correct() for w in tokens)
-        ret = "".join(corrected)
+        # Correct each distinct token once.
+        corrected = {w: Word(w).correct() for w in set(tokens)}
+        ret = "".join(corrected[w] for w in tokens)
         return self.__class__(ret)
 
     def _cmpkey(self):
@@ -614,15 +669,24 @@ class TextBlob(BaseBlob):
         """Return list of :class:`Sentence <Sentence>` objects."""
         return self._create_sentence_objects()
 
-    @cached_property
-    def words(self):
-        """Return a list of word tokens. This excludes punctuation characters.
-        If you want to include punctuation characters, access the ``tokens``
-        property.
+    def classify_sentences(self, n_jobs=1):
+        """Classify each sentence of the blob using the blob's ``classifier``.
+        The sentences are classified in one batch with the classifier's
+        ``classify_many`` method, and each label is cached as the sentence's
+        ``classification``.
 
-        :returns: A :class:`WordList <WordList>` of word tokens.
+        :param int n_jobs: The number of worker processes passed to
+            ``classify_many``.
+        :rtype: list
+
+        .. versionadded:: 0.19.0
         """
-        return WordList(word_tokenize(self.raw, include_punc=False))
+        if self.classifier is None:
+            raise NameError("This blob has no classifier. Train one first!")
+        labels = self.classifier.classify_many(self.raw_sentences, n_jobs=n_jobs)
+        for sentence, label in zip(self.sentences, labels):
+            sentence.__dict__["classification"] = label
+        return labels
 
     @property
     def raw_sentences(self):
@@ -655,9 +719,8 @@ class TextBlob(BaseBlob):
     def _create_sentence_objects(self):
         """Returns a list of Sentence objects from the raw text."""
         sentence_objects = []
-        sentences = sent_tokenize(self.raw)
         char_index = 0  # Keeps track of character index within the blob
-        for sent in sentences:
+        for sent, tokens in self._segments:
             # Compute the start and end indices of the sentence
             # within the blob
             start_index = self.raw.index(sent, char_index)
@@ -675,6 +738,8 @@ class TextBlob(BaseBlob):
                 parser=self.parser,
                 classifier=self.classifier,
             )
+            # A sentence is its own, single segment
+            s._segments = [(sent, tokens)]
             sentence_objects.append(s)
         return sentence_objects
 
@@ -711,6 +776,41 @@ class Sentence(BaseBlob):
         }
 
 
+#: Annotations that :meth:`Blobber.pipe` can precompute
+PIPE_FIELDS = (
+    "words",
+    "tokens",
+    "tags",
+    "pos_tags",
+    "noun_phrases",
+    "sentiment",
+    "sentiment_assessments",
+    "polarity",
+    "subjectivity",
+    "classification",
+)
+
+# The Blobber used by the current pipe worker process
+_pipe_blobber = None
+
+
+def _init_pipe_worker(blobber):
+    global _pipe_blobber
+    _pipe_blobber = blobber
+
+
+def _annotate_batch(args):
+    """Return a list of dicts mapping each cached attribute in ``attrs`` to
+    its value, one dict per text.
+    """
+    texts, attrs = args
+    results = []
+    for text in texts:
+        blob = _pipe_blobber(text)
+        results.append({attr: getattr(blob, attr) for attr in attrs})
+    return results
+
+
 class Blobber:
     """A factory for TextBlobs that all share the same tagger,
     tokenizer, parser, classifier, and np_extractor.
@@ -776,6 +876,77 @@ class Blobber:
             classifier=self.classifier,
         )
 
+    def pipe(
+        self,
+        texts,
+        batch_size=1000,
+        n_process=1,
+        fields=("tags", "noun_phrases", "sentiment"),
+    ):
+        """Process a stream of texts, yielding a :class:`TextBlob <TextBlob>`
+        for each text, in input order, with the annotations in ``fields``
+        already computed.
+
+        With ``n_process > 1``, batches of texts are annotated in a pool of
+        worker processes. Each worker receives a copy of this Blobber's models
+        once and reuses them for every batch it processes.
+
+        Usage:
+
+            >>> from textblob import Blobber
+            >>> tb = Blobber()
+            >>> for blob in tb.pipe(texts, n_process=4, fields=["sentiment"]):
+            ...     print(blob.sentiment)
+
+        :param texts: An iterable of strings. May be a generator.
+        :param int batch_size: The number of texts sent to a worker at a time.
+        :param int n_process: The number of worker processes. ``-1`` uses all
+            CPUs. If ``1``, texts are processed in the current process.
+        :param fields: The annotations to precompute. Any of
+            :data:`PIPE_FIELDS <textblob.blob.PIPE_FIELDS>`.
+
+        .. versionadded:: 0.19.0
+        """
+        attrs = []
+        for field in fields:
+            if field not in PIPE_FIELDS:
+                raise ValueError(
+                    f"Cannot precompute {field!r}. "
+                    f"Valid fields are: {', '.join(PIPE_FIELDS)}"
+                )
+            # "tags" is an alias for "pos_tags"; cache under the real name
+            attrs.append(getattr(TextBlob, field).func.__name__)
+        n_process = resolve_n_jobs(n_process)
+        if n_process == 1:
+            for text in texts:
+                blob = self(text)
+                for attr in attrs:
+                    getattr(blob, attr)
+                yield blob
+            return
+        # Batches that have been handed to the pool, oldest first
+        submitted = deque()
+
+        def submit(batches):
+            for batch in batches:
+                submitted.append(batch)
+                yield batch, attrs
+
+        results = process_map(
+            _annotate_batch,
+            submit(batched(texts, batch_size)),
+            n_process,
+            initializer=_init_pipe_worker,
+            initargs=(self,),
+        )
+        for batch_results in results:
+            for text, values in zip(submitted.popleft(), batch_results):
+                # The values were computed from the same text with the same
+                # models, so they can seed the blob's cached properties
+                blob = self(text)
+                blob.__dict__.update(values)
+                yield blob
+
     def __repr__(self):
         classifier_name = (
             self.classifier.__class__.__name__ + "()" if self.classifier else "None"
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Compiles TextBlob's bundled data files and trains its default models into
+the on-disk cache ahead of time (see :mod:`textblob.cache`), e.g. while
+building a container image. Models whose NLTK corpora are missing are skipped.
+
+Usage: ::
+
+    $ python -m textblob.build_cache
+
+To build the cache in a specific directory: ::
+
+    $ TEXTBLOB_CACHE_DIR=/opt/textblob/cache python -m textblob.build_cache
+
+"""
+
+import sys
+
+from textblob import cache
+from textblob.exceptions import MissingCorpusError
+
+
+def build():
+    from textblob.en import lexicon, sentiment
+    from textblob.en.np_extractors import ChunkParser, FastNPExtractor
+    from textblob.en.sentiments import NaiveBayesAnalyzer
+
+    for data in (
+        lexicon,
+        lexicon.morphology,
+        lexicon.context,
+        lexicon.entities,
+        sentiment,
+    ):
+        len(data)  # Loading lazily compiles and caches the data.
+    for model in (FastNPExtractor(), ChunkParser(), NaiveBayesAnalyzer()):
+        try:
+            model.train()
+        except MissingCorpusError:
+            print(f"Skipped {type(model).__name__}: missing NLTK corpus.")
+
+
+def main():
+    cache_dir = cache.get_cache_dir()
+    if cache_dir is None:
+        sys.exit(f"The cache is disabled ({cache.ENV_VAR} is empty).")
+    build()
+    print(f"Finished. Cache directory: {cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""On-disk cache for data that TextBlob compiles from its bundled source files,
+e.g. the part-of-speech lexicon and its rule files.
+
+Entries are keyed by a hash of the source files they were built from, so a
+cache entry is rebuilt automatically whenever a source file changes.
+
+The cache directory defaults to ``$XDG_CACHE_HOME/textblob`` (or
+``~/.cache/textblob``). Set the ``TEXTBLOB_CACHE_DIR`` environment variable to
+use another directory, or set it to an empty string to disable the cache.
+The cache can be built ahead of time with ``python -m textblob.build_cache``.
+
+.. versionadded:: 0.19.0
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+
+#: Bump this whenever the layout of a cached object changes.
+CACHE_VERSION = 1
+
+ENV_VAR = "TEXTBLOB_CACHE_DIR"
+
+
+def get_cache_dir():
+    """Return the cache directory, or ``None`` if caching is disabled."""
+    path = os.environ.get(ENV_VAR)
+    if path is not None:
+        return path or None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "textblob")
+
+
+def source_key(paths, params=()):
+    """Return a hex digest identifying the contents of the files at ``paths``
+    and the build parameters ``params``, whose ``repr`` must be stable.
+    Returns ``None`` if any of the paths is not a file (e.g., when data is
+    passed in as a string), in which case the result must not be cached.
+    """
+    h = hashlib.sha1(repr((CACHE_VERSION, params)).encode())
+    for path in paths:
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return None
+        with open(path, "rb") as fp:
+            h.update(fp.read())
+    return h.hexdigest()
+
+
+def _entry_path(cache_dir, name, key):
+    return os.path.join(cache_dir, f"{name}-{key}.pickle")
+
+
+def load(name, key):
+    """Return the object stored under ``name`` and ``key``, or ``None`` if
+    there is no usable cache entry.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None or key is None:
+        return None
+    try:
+        with open(_entry_path(cache_dir, name, key), "rb") as fp:
+            return pickle.load(fp)
+    except Exception:
+        # Missing, truncated or otherwise unreadable entries are rebuilt.
+        return None
+
+
+def dump(name, key, obj):
+    """Store ``obj`` under ``name`` and ``key``, replacing stale entries of the
+    same name. Failures (e.g., a read-only cache directory) are ignored.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None or key is None:
+        return
+    path = _entry_path(cache_dir, name, key)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written entry.
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(obj, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            # mkstemp creates private files; entries may be shared, e.g. when
+            # the cache is built ahead of time in a container image.
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        for stale in glob.glob(_entry_path(glob.escape(cache_dir), name, "*")):
+            if stale != path:
+                os.unlink(stale)
+    except OSError:
+        pass
+
+
+def cached(name, paths, build, params=()):
+    """Return the cached object built from the files at ``paths`` with the
+    build parameters ``params``, calling ``build()`` and caching its result if
+    there is no up-to-date entry.
+    """
+    if isinstance(paths, str):
+        paths = (paths,)
+    key = source_key(paths, params) if get_cache_dir() is not None else None
+    obj = load(name, key)
+    if obj is None:
+        obj = build()
+        dump(name, key, obj)
+    return obj
@@ -31,15 +31,28 @@ Example Usage:
 .. versionadded:: 0.6.0
 """  # noqa: E501
 
+import copy
+import inspect
+import math
+from collections import Counter, defaultdict, namedtuple
 from itertools import chain
 
 import nltk
 
 import textblob.formats as formats
+from textblob import metrics
 from textblob.decorators import cached_property
 from textblob.exceptions import FormatError
 from textblob.tokenizers import word_tokenize
-from textblob.utils import is_filelike, strip_punc
+from textblob.utils import (
+    batched,
+    is_filelike,
+    load_model,
+    process_map,
+    resolve_n_jobs,
+    save_model,
+    strip_punc,
+)
 
 basestring = (str, bytes)
 
@@ -103,6 +116,36 @@ def basic_extractor(document, train_set):
     return features
 
 
+def _basic_features(tokens, word_set, sparse=False):
+    """Return the features of :func:`basic_extractor` for a document with the
+    given set of ``tokens``. If ``sparse``, only return the features that are
+    ``True``, i.e. the words in ``word_set`` that are contained in the
+    document, which takes time proportional to the length of the document
+    rather than to the size of ``word_set``.
+    """
+    if sparse:
+        return dict((f"contains({w})", True) for w in tokens if w in word_set)
+    return dict((f"contains({w})", (w in tokens)) for w in word_set)
+
+
+def _sparse_basic_features(document, word_set):
+    """Return the features of :func:`basic_extractor` that are ``True``."""
+    return _basic_features(_get_document_tokens(document), word_set, sparse=True)
+
+
+def _uses_train_set(feature_extractor):
+    """Return whether the feature extractor is called with the training set as
+    its second argument (see :meth:`BaseClassifier.extract_features`).
+    """
+    try:
+        inspect.signature(feature_extractor).bind(None, None)
+    except TypeError:
+        return False
+    except ValueError:  # No signature, e.g. a builtin.
+        return True
+    return True
+
+
 def contains_extractor(document):
     """A basic document feature extractor that returns a dict of words that
     the document contains.
@@ -115,6 +158,38 @@ def contains_extractor(document):
 ##### CLASSIFIERS #####
 
 
+# The classifier used by the current classify_many worker process, and the
+# labeled featuresets of a cross_validate worker process
+_worker_classifier = None
+_worker_featuresets = None
+
+
+def _init_classify_worker(classifier, labeled_featuresets=None):
+    global _worker_classifier, _worker_featuresets
+    _worker_classifier = classifier
+    _worker_featuresets = labeled_featuresets
+
+
+def _classify_batch(args):
+    """Apply the worker classifier's batch method named ``method`` to a list
+    of texts.
+    """
+    method, texts = args
+    return getattr(_worker_classifier, method)(texts)
+
+
+def _evaluate_fold(args):
+    """Return the confusion counts of the worker classifier for one fold."""
+    fold, k, kwargs = args
+    return _worker_classifier._evaluate_fold(_worker_featuresets, fold, k, **kwargs)
+
+
+#: The result of :meth:`NLTKClassifier.cross_validate`
+CrossValidation = namedtuple(
+    "CrossValidation", ["accuracy", "precision", "recall", "confusion", "folds"]
+)
+
+
 class BaseClassifier:
     """Abstract classifier class from which all classifers inherit. At a
     minimum, descendant classes must implement a ``classify`` method and have
@@ -136,6 +211,16 @@ class BaseClassifier:
     .. versionadded:: 0.6.0
     """
 
+    #: The number of texts that :meth:`classify_many` sends to a worker
+    #: process at a time.
+    batch_size = 1000
+
+    # The attributes that hold the training data, and the attributes that
+    # hold the trained model. Worker processes receive copies of the
+    # classifier without them (see _worker_copy).
+    _training_attrs = ("train_set", "train_features")
+    _model_attrs = ("classifier",)
+
     def __init__(
         self, train_set, feature_extractor=basic_extractor, format=None, **kwargs
     ):
@@ -154,6 +239,32 @@ class BaseClassifier:
         """Reads a data file and returns an iterable that can be used
         as testing or training data.
         """
+        return self._get_format(dataset, format).to_iterable()
+
+    def _iter_data(self, dataset, format=None):
+        """Return an iterator over the records of ``dataset``, which is read
+        lazily if it is a file-like object and its format supports it.
+        """
+        if not is_filelike(dataset):
+            return iter(dataset)
+        format_class = self._get_format_class(dataset, format)
+        if "lazy" in inspect.signature(format_class).parameters:
+            data = format_class(dataset, lazy=True, **self.format_kwargs)
+            return data.iter_records()
+        # Custom formats may not have a lazy mode.
+        return iter(format_class(dataset, **self.format_kwargs).to_iterable())
+
+    def _get_format(self, dataset, format=None):
+        """Return the :class:`Format <textblob.formats.BaseFormat>` object
+        that reads a data file.
+        """
+        format_class = self._get_format_class(dataset, format)
+        return format_class(dataset, **self.format_kwargs)
+
+    def _get_format_class(self, dataset, format=None):
+        """Return the format class named ``format``, or the detected format
+        class of ``dataset`` if ``format`` is ``None``.
+        """
         # Attempt to detect file format if "format" isn't specified
         if not format:
             format_class = formats.detect(dataset)
@@ -167,7 +278,7 @@ class BaseClassifier:
             if format not in registry.keys():
                 raise ValueError(f"'{format}' format not supported.")
             format_class = registry[format]
-        return format_class(dataset, **self.format_kwargs).to_iterable()
+        return format_class
 
     @cached_property
     def classifier(self):
@@ -178,6 +289,58 @@ class BaseClassifier:
         """Classifies a string of text."""
         raise NotImplementedError('Must implement a "classify" method.')
 
+    @metrics.timed("classifier")
+    def classify_many(self, texts, n_jobs=1):
+        """Classify each of the given texts.
+
+        With ``n_jobs > 1``, batches of texts are classified in a pool of
+        worker processes. Each worker receives a copy of the trained
+        classifier once and reuses it for every batch, so the classifier and
+        its feature extractor must be picklable.
+
+        :param texts: An iterable of strings.
+        :param int n_jobs: The number of worker processes. ``-1`` uses all
+            CPUs. If ``1``, texts are classified in the current process.
+        :rtype: list
+
+        .. versionadded:: 0.19.0
+        """
+        return self._map_batches("_classify_many", texts, n_jobs)
+
+    def _classify_many(self, texts):
+        return [self.classify(text) for text in texts]
+
+    def _map_batches(self, method, texts, n_jobs):
+        """Return the concatenated results of the batch method named
+        ``method`` for ``texts``, computed in ``n_jobs`` processes.
+        """
+        n_jobs = resolve_n_jobs(n_jobs)
+        if n_jobs == 1:
+            return getattr(self, method)(list(texts))
+        # Train the classifier once, before it is sent to the workers.
+        _ = self.classifier
+        results = process_map(
+            _classify_batch,
+            ((method, batch) for batch in batched(texts, self.batch_size)),
+            n_jobs,
+            initializer=_init_classify_worker,
+            initargs=(self._worker_copy(),),
+        )
+        return list(chain.from_iterable(results))
+
+    def _worker_copy(self, model=True):
+        """Return a shallow copy of the classifier to send to worker
+        processes, without the training data. If ``model`` is false, the
+        trained model is left out as well.
+        """
+        worker_copy = copy.copy(self)
+        for name in self._training_attrs:
+            worker_copy.__dict__[name] = None
+        if not model:
+            for name in self._model_attrs:
+                worker_copy.__dict__.pop(name, None)
+        return worker_copy
+
     def train(self, labeled_featureset):
         """Trains the classifier."""
         raise NotImplementedError('Must implement a "train" method.')
@@ -213,11 +376,17 @@ class NLTKClassifier(BaseClassifier):
     #: The NLTK class to be wrapped. Must be a class within nltk.classify
     nltk_class = None
 
+    #: The format version of saved models.
+    MODEL_VERSION = 1
+
+    # Whether the model was restored with load(), without its training data
+    _loaded = False
+
     def __init__(
         self, train_set, feature_extractor=basic_extractor, format=None, **kwargs
     ):
         super().__init__(train_set, feature_extractor, format, **kwargs)
-        self.train_features = [(self.extract_features(d), c) for d, c in self.train_set]
+        self.train_features = self._extract_labeled_features(self.train_set)
 
     def __repr__(self):
         class_name = self.__class__.__name__
@@ -233,6 +402,7 @@ class NLTKClassifier(BaseClassifier):
                 "NLTKClassifier must have a nltk_class" " variable that is not None."
             ) from error
 
+    @metrics.timed("classifier")
     def train(self, *args, **kwargs):
         """Train the classifier with a labeled feature set and return
         the classifier. Takes the same arguments as the wrapped NLTK class.
@@ -258,6 +428,7 @@ class NLTKClassifier(BaseClassifier):
         """Return an iterable of possible labels."""
         return self.classifier.labels()
 
+    @metrics.timed("classifier", tokens=metrics.count_words)
     def classify(self, text):
         """Classifies the text.
 
@@ -266,6 +437,10 @@ class NLTKClassifier(BaseClassifier):
         text_features = self.extract_features(text)
         return self.classifier.classify(text_features)
 
+    def _classify_many(self, texts):
+        featuresets = [self.extract_features(text) for text in texts]
+        return self.classifier.classify_many(featuresets)
+
     def accuracy(self, test_set, format=None):
         """Compute the accuracy on a test set.
 
@@ -275,12 +450,110 @@ class NLTKClassifier(BaseClassifier):
             ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
             file format.
         """
-        if is_filelike(test_set):
-            test_data = self._read_data(test_set, format)
-        else:  # test_set is a list of tuples
-            test_data = test_set
-        test_features = [(self.extract_features(d), c) for d, c in test_data]
-        return nltk.classify.accuracy(self.classifier, test_features)
+        correct = total = 0
+        # Classify the test set in batches, so that a file is read lazily.
+        for batch in batched(self._iter_data(test_set, format), self.batch_size):
+            texts, labels = zip(*batch)
+            predicted = self._classify_many(texts)
+            correct += sum(x == y for x, y in zip(predicted, labels))
+            total += len(labels)
+        return correct / total if total else 0
+
+    def cross_validate(self, k=10, n_jobs=1, **kwargs):
+        """Estimate how well the classifier generalizes with k-fold
+        cross-validation on the training set. Document ``i`` is in fold
+        ``i % k``; each fold is classified by a classifier trained on the
+        other folds. The features of each document are the ones already
+        extracted for training, so they are extracted only once (with the
+        basic extractor, the words of all folds are features).
+
+        With ``n_jobs > 1``, folds are trained and evaluated in a pool of
+        worker processes. Each worker receives the features of the training
+        set and the classifier's parameters once.
+
+        Returns a :data:`CrossValidation <textblob.classifiers.CrossValidation>`
+        named tuple of the form ``(accuracy, precision, recall, confusion,
+        folds)``. ``precision`` and ``recall`` map each label to its
+        precision and recall over all folds, ``confusion`` is a
+        :class:`collections.Counter` of ``(label, predicted_label)`` pairs
+        and ``folds`` is the list of accuracies per fold.
+
+        :param int k: The number of folds.
+        :param int n_jobs: The number of worker processes. ``-1`` uses all
+            CPUs.
+        :param kwargs: Additional keyword arguments are passed to the
+            ``train`` method of the wrapped NLTK class.
+
+        .. versionadded:: 0.19.0
+        """
+        if getattr(self, "train_features", None) is None:
+            raise ValueError(
+                "Cross-validation requires the features of the training set."
+            )
+        if not 2 <= k <= len(self.train_features):
+            raise ValueError(
+                "k must be at least 2 and at most the size of the training set."
+            )
+        n_jobs = resolve_n_jobs(n_jobs)
+        if n_jobs == 1:
+            results = [
+                self._evaluate_fold(self.train_features, fold, k, **kwargs)
+                for fold in range(k)
+            ]
+        else:
+            results = process_map(
+                _evaluate_fold,
+                ((fold, k, kwargs) for fold in range(k)),
+                n_jobs,
+                initializer=_init_classify_worker,
+                initargs=(self._worker_copy(model=False), self.train_features),
+            )
+        confusion = Counter()
+        folds = []
+        for fold_confusion in results:
+            confusion.update(fold_confusion)
+            total = sum(fold_confusion.values())
+            correct = sum(n for (x, y), n in fold_confusion.items() if x == y)
+            folds.append(correct / total)
+        labels = {label for pair in confusion for label in pair}
+        predicted, actual = Counter(), Counter()
+        for (label, predicted_label), n in confusion.items():
+            actual[label] += n
+            predicted[predicted_label] += n
+        precision, recall = {}, {}
+        for label in labels:
+            correct = confusion[label, label]
+            precision[label] = correct / predicted[label] if predicted[label] else 0.0
+            recall[label] = correct / actual[label] if actual[label] else 0.0
+        correct = sum(confusion[label, label] for label in labels)
+        accuracy = correct / sum(confusion.values())
+        return CrossValidation(accuracy, precision, recall, confusion, folds)
+
+    def _evaluate_fold(self, labeled_featuresets, fold, k, **kwargs):
+        """Train a classifier on the labeled featuresets outside ``fold`` and
+        return a Counter of the ``(label, predicted_label)`` pairs of the
+        featuresets in ``fold``.
+        """
+        train_features = [
+            labeled for i, labeled in enumerate(labeled_featuresets) if i % k != fold
+        ]
+        classifier = self._train_fold(train_features, **kwargs)
+        confusion = Counter()
+        test_features = labeled_featuresets[fold::k]
+        for batch in batched(test_features, self.batch_size):
+            featuresets, labels = zip(*batch)
+            confusion.update(zip(labels, classifier.classify_many(featuresets)))
+        return confusion
+
+    def _train_fold(self, labeled_featuresets, **kwargs):
+        """Return a new NLTK classifier trained on ``labeled_featuresets``."""
+        return self.nltk_class.train(labeled_featuresets, **kwargs)
+
+    def _extract_labeled_features(self, labeled_data):
+        """Return a list of ``(features, label)`` tuples for a list of
+        ``(text, label)`` tuples.
+        """
+        return [(self.extract_features(d), c) for d, c in labeled_data]
 
     def update(self, new_data, *args, **kwargs):
         """Update the classifier with new training data and re-trains the
@@ -289,19 +562,354 @@ class NLTKClassifier(BaseClassifier):
         :param new_data: New data as a list of tuples of the form
             ``(text, label)``.
         """
+        self._check_updatable()
         self.train_set += new_data
         self._word_set.update(_get_words_from_dataset(new_data))
-        self.train_features = [(self.extract_features(d), c) for d, c in self.train_set]
-        try:
-            self.classifier = self.nltk_class.train(
-                self.train_features, *args, **kwargs
-            )
-        except AttributeError as error:  # Descendant has not defined nltk_class
-            raise ValueError(
-                "NLTKClassifier must have a nltk_class" " variable that is not None."
-            ) from error
+        self.train_features = self._extract_labeled_features(self.train_set)
+        self.train(*args, **kwargs)
         return True
 
+    def _check_updatable(self):
+        if self._loaded:
+            raise ValueError(
+                "A classifier restored with load() cannot be updated, since its "
+                "training data is not saved. Train a new classifier instead."
+            )
+
+    def save(self, path):
+        """Save the trained classifier to a file, training it first if needed.
+        Only what is needed to classify texts is saved: the words of the
+        training set and the parameters of the trained model, but not the
+        training set or its features. The feature extractor is not saved
+        either.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        save_model(path, type(self).__name__, self.MODEL_VERSION, self._saved_model())
+
+    @classmethod
+    def load(cls, path, feature_extractor=basic_extractor):
+        """Return a classifier with the model saved at ``path`` by
+        :meth:`save`. The classifier has an empty training set, so it can
+        classify texts but not be updated: :meth:`update` raises a
+        ``ValueError``. Only load files from trusted sources.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        :param callable feature_extractor: The feature extractor the model was
+            trained with.
+        """
+        model = load_model(path, cls.__name__, cls.MODEL_VERSION)
+        classifier = cls([], feature_extractor, **model["params"])
+        classifier._set_model(model)
+        classifier._loaded = True
+        return classifier
+
+    def _saved_model(self):
+        return {
+            "params": {},
+            "word_set": sorted(self._word_set),
+            "classifier": self._dump_classifier(),
+        }
+
+    def _set_model(self, model):
+        self._word_set = set(model["word_set"])
+        self.classifier = self._load_classifier(model["classifier"])
+
+    def _dump_classifier(self):
+        """Return the parameters of the trained NLTK classifier to save."""
+        return self.classifier
+
+    def _load_classifier(self, data):
+        """Return the NLTK classifier for the saved parameters ``data``."""
+        return data
+
+
+class _NaiveBayesCounts:
+    """The sufficient statistics of a Naive Bayes model: the number of
+    featuresets per label, and how often each feature had each value per
+    label. Featuresets can be added at any time, and the model is trained
+    from the counts as :meth:`nltk.classify.NaiveBayesClassifier.train` does.
+    """
+
+    def __init__(self, labeled_featuresets=()):
+        self.label_freqdist = nltk.FreqDist()
+        self.feature_freqdist = defaultdict(nltk.FreqDist)
+        self.feature_values = defaultdict(set)
+        self.add(labeled_featuresets)
+
+    def add(self, labeled_featuresets):
+        for featureset, label in labeled_featuresets:
+            self.label_freqdist[label] += 1
+            for fname, fval in featureset.items():
+                self.feature_freqdist[label, fname][fval] += 1
+                self.feature_values[fname].add(fval)
+
+    def add_count(self, label, fname, fval, count):
+        """Add ``count`` featuresets, which already have been added, where
+        the feature ``fname`` has the value ``fval``.
+        """
+        self.feature_freqdist[label, fname][fval] += count
+        self.feature_values[fname].add(fval)
+
+    def _implicit_counts(self, fnames, implicit, always=False):
+        """Return copies of the counts where each feature name in ``fnames``
+        that a featureset did not have has the value ``implicit``.
+        """
+        feature_freqdist = defaultdict(nltk.FreqDist)
+        for key, freqdist in self.feature_freqdist.items():
+            feature_freqdist[key] = freqdist.copy()
+        feature_values = defaultdict(set)
+        for fname, values in self.feature_values.items():
+            feature_values[fname] = set(values)
+        for label, num_samples in self.label_freqdist.items():
+            for fname in fnames:
+                freqdist = feature_freqdist[label, fname]
+                count = freqdist.N()
+                if always or num_samples - count > 0:
+                    freqdist[implicit] += num_samples - count
+                    feature_values[fname].add(implicit)
+        return feature_freqdist, feature_values
+
+    def train(self, cls, fnames=None, implicit=None, estimator=nltk.ELEProbDist):
+        """Return a trained Naive Bayes classifier of the class ``cls``. The
+        feature names in ``fnames`` (by default, every feature name that was
+        counted) that a featureset did not have have the value ``implicit``.
+        """
+        if fnames is None:
+            fnames = set(self.feature_values)
+        feature_freqdist, feature_values = self._implicit_counts(fnames, implicit)
+        label_probdist = estimator(self.label_freqdist)
+        feature_probdist = {}
+        for (label, fname), freqdist in feature_freqdist.items():
+            probdist = estimator(freqdist, bins=len(feature_values[fname]))
+            feature_probdist[label, fname] = probdist
+        return cls(label_probdist, feature_probdist)
+
+    def train_positive(self, positive_prob_prior=0.5, estimator=nltk.ELEProbDist):
+        """Return a trained :class:`nltk.classify.PositiveNaiveBayesClassifier`
+        for counts with the label ``True`` for the positive featuresets and
+        ``False`` for the unlabeled featuresets, as
+        :meth:`nltk.classify.PositiveNaiveBayesClassifier.train` does.
+        """
+        for label in (True, False):
+            self.label_freqdist.setdefault(label, 0)
+        fnames = set(self.feature_values)
+        feature_freqdist, feature_values = self._implicit_counts(
+            fnames, None, always=True
+        )
+        negative_prob_prior = 1.0 - positive_prob_prior
+        label_probdist = nltk.DictionaryProbDist(
+            {True: positive_prob_prior, False: negative_prob_prior}
+        )
+        feature_probdist = {}
+        for fname in fnames:
+            freqdist = feature_freqdist[True, fname]
+            probdist = estimator(freqdist, bins=len(feature_values[fname]))
+            feature_probdist[True, fname] = probdist
+        for fname in fnames:
+            freqdist = feature_freqdist[False, fname]
+            global_probdist = estimator(freqdist, bins=len(feature_values[fname]))
+            negative_feature_probs = {}
+            for fval in feature_values[fname]:
+                prob = (
+                    global_probdist.prob(fval)
+                    - positive_prob_prior * feature_probdist[True, fname].prob(fval)
+                ) / negative_prob_prior
+                negative_feature_probs[fval] = max(prob, 0.0)
+            feature_probdist[False, fname] = nltk.DictionaryProbDist(
+                negative_feature_probs, normalize=True
+            )
+        return nltk.classify.PositiveNaiveBayesClassifier(
+            label_probdist, feature_probdist
+        )
+
+
+class _SavedProbDist(nltk.ProbDistI):
+    """A probability distribution over the values of a feature, restored
+    from the base 2 log probabilities of a saved model. Values that are not
+    among the ``samples`` have the log probability ``unseen``.
+    """
+
+    SUM_TO_ONE = False
+
+    def __init__(self, logprobs, unseen):
+        super().__init__()
+        self._logprobs = logprobs
+        self._unseen = unseen
+
+    def logprob(self, sample):
+        return self._logprobs.get(sample, self._unseen)
+
+    def prob(self, sample):
+        return 2 ** self.logprob(sample)
+
+    def max(self):
+        return max(self._logprobs, key=self._logprobs.get)
+
+    def samples(self):
+        return self._logprobs.keys()
+
+
+def _dump_naive_bayes(classifier):
+    """Return the log probabilities of a trained NLTK Naive Bayes classifier,
+    from which :func:`_load_naive_bayes` restores it. For each label and
+    feature name, the log probabilities of the feature values that the
+    probability distribution has samples for are stored, and the log
+    probability of any other value.
+    """
+    labels = list(classifier.labels())
+    label_index = {label: i for i, label in enumerate(labels)}
+    unseen_value = object()
+    features = []
+    for (label, fname), probdist in classifier._feature_probdist.items():
+        samples = tuple(probdist.samples())
+        features.append(
+            (
+                label_index[label],
+                fname,
+                samples,
+                tuple(probdist.logprob(fval) for fval in samples),
+                probdist.logprob(unseen_value),
+            )
+        )
+    label_probdist = classifier._label_probdist
+    return {
+        "labels": labels,
+        "label_logprobs": [label_probdist.logprob(label) for label in labels],
+        "features": features,
+    }
+
+
+def _load_naive_bayes(cls, data):
+    """Return a Naive Bayes classifier of the class ``cls`` for the log
+    probabilities returned by :func:`_dump_naive_bayes`.
+    """
+    labels = data["labels"]
+    label_probdist = nltk.DictionaryProbDist(
+        dict(zip(labels, data["label_logprobs"])), log=True
+    )
+    feature_probdist = {}
+    for i, fname, samples, logprobs, unseen in data["features"]:
+        probdist = _SavedProbDist(dict(zip(samples, logprobs)), unseen)
+        feature_probdist[labels[i], fname] = probdist
+    return cls(label_probdist, feature_probdist)
+
+
+def _naive_bayes_table(data):
+    """Return the log probabilities returned by :func:`_dump_naive_bayes` as
+    a table for :func:`_naive_bayes_prob_classify`.
+
+    The table maps each ``(fname, fval)`` pair seen in training to a tuple of
+    log probabilities, one per label. ``unseen`` holds the log probabilities
+    of a value not seen in training for each known feature name.
+    """
+    labels = data["labels"]
+    # The log probability of a feature name that a label has no distribution
+    # for, as in nltk.classify.NaiveBayesClassifier.prob_classify
+    missing = nltk.probability.sum_logs([])
+    probdists = defaultdict(lambda: [None] * len(labels))
+    for i, fname, samples, logprobs, unseen in data["features"]:
+        probdists[fname][i] = (dict(zip(samples, logprobs)), unseen)
+    logprobs, unseen = {}, {}
+    for fname, label_probdists in probdists.items():
+        fvals = set()
+        for probdist in label_probdists:
+            if probdist is not None:
+                fvals.update(probdist[0])
+        for fval in fvals:
+            logprobs[fname, fval] = tuple(
+                missing if probdist is None else probdist[0].get(fval, probdist[1])
+                for probdist in label_probdists
+            )
+        unseen[fname] = tuple(
+            missing if probdist is None else probdist[1] for probdist in label_probdists
+        )
+    return {
+        "labels": labels,
+        "label_logprobs": list(data["label_logprobs"]),
+        "logprobs": logprobs,
+        "unseen": unseen,
+    }
+
+
+def _naive_bayes_prob_classify(table, featureset):
+    """Return the probability distribution over labels for ``featureset``,
+    given a table returned by :func:`_naive_bayes_table`. Results are
+    identical to ``NaiveBayesClassifier.prob_classify``.
+    """
+    scores = list(table["label_logprobs"])
+    logprobs, unseen = table["logprobs"], table["unseen"]
+    for feature in featureset.items():
+        row = logprobs.get(feature)
+        if row is None:
+            # Features with names unseen in training are ignored.
+            row = unseen.get(feature[0])
+            if row is None:
+                continue
+        for i, logprob in enumerate(row):
+            scores[i] += logprob
+    return nltk.DictionaryProbDist(
+        dict(zip(table["labels"], scores)), normalize=True, log=True
+    )
+
+
+class _SparseNaiveBayesClassifier(nltk.classify.NaiveBayesClassifier):
+    """NLTK's Naive Bayes classifier for sparse featuresets, which only
+    contain the features whose value is not ``False``. The features of the
+    model that a featureset does not contain have the value ``False``.
+
+    The label log probabilities of a featureset are computed as a baseline,
+    the log probability of each label with every feature ``False``, plus the
+    difference made by each feature that the featureset contains.
+    """
+
+    def __init__(self, label_probdist, feature_probdist):
+        super().__init__(label_probdist, feature_probdist)
+        logprobs = dict(
+            (label, [label_probdist.logprob(label)]) for label in self._labels
+        )
+        deltas = defaultdict(dict)
+        for (label, fname), probdist in feature_probdist.items():
+            absent = probdist.logprob(False)
+            logprobs[label].append(absent)
+            deltas[fname][label] = probdist.logprob(True) - absent
+        # The sum is exact, so it does not depend on the order of the
+        # features.
+        self._baseline = dict(
+            (label, math.fsum(values)) for label, values in logprobs.items()
+        )
+        self._deltas = dict(deltas)
+
+    @classmethod
+    def train(cls, labeled_featuresets, fnames, estimator=nltk.ELEProbDist):
+        """Train on sparse featuresets. The model is the same as the model
+        that :meth:`nltk.classify.NaiveBayesClassifier.train` returns for the
+        dense featuresets, where each feature name in ``fnames`` that a
+        featureset does not contain has the value ``False``.
+        """
+        # The implicit False values are counted once per label and feature
+        # name rather than once per featureset and feature name.
+        counts = _NaiveBayesCounts(labeled_featuresets)
+        return counts.train(cls, fnames, False, estimator)
+
+    def prob_classify(self, featureset):
+        logprob = dict(self._baseline)
+        for fname, fval in featureset.items():
+            if fname not in self._deltas or fval is False:
+                continue
+            if fval is True:
+                for label, delta in self._deltas[fname].items():
+                    logprob[label] += delta
+            else:
+                for label in self._deltas[fname]:
+                    probdist = self._feature_probdist[label, fname]
+                    logprob[label] += probdist.logprob(fval) - probdist.logprob(False)
+        return nltk.DictionaryProbDist(logprob, normalize=True, log=True)
+
 
 class NaiveBayesClassifier(NLTKClassifier):
     """A classifier based on the Naive Bayes algorithm, as implemented in
@@ -315,12 +923,246 @@ class NaiveBayesClassifier(NLTKClassifier):
     :param format: If ``train_set`` is a filename, the file format, e.g.
         ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
         file format.
+    :param bool sparse: Only store the features that a document contains,
+        i.e. the words of the training set that occur in it, instead of one
+        feature per word of the training set. This saves time and memory
+        with large vocabularies and gives the same results (up to rounding).
+        Requires ``feature_extractor=basic_extractor``.
+    :param bool stream: Read the training set once, e.g. lazily from a large
+        file, and only keep the counts of features per label that the model
+        is trained from, rather than the training set and its features.
+        ``train_set`` may then be any iterable of ``(text, classification)``
+        tuples, and ``train_set`` and ``train_features`` are ``None``. The
+        results are the same. Requires a feature extractor that does not use
+        the training set, or ``basic_extractor``.
 
     .. versionadded:: 0.6.0
+
+    .. versionchanged:: 0.19.0
+        Add the ``sparse`` and ``stream`` parameters.
     """
 
     nltk_class = nltk.classify.NaiveBayesClassifier
 
+    _training_attrs = (
+        "train_set",
+        "_train_features",
+        "_counts",
+        "_unknown_tokens",
+        "_token_counts",
+    )
+
+    def __init__(
+        self,
+        train_set,
+        feature_extractor=basic_extractor,
+        format=None,
+        sparse=False,
+        stream=False,
+        **kwargs,
+    ):
+        if sparse and feature_extractor is not basic_extractor:
+            raise ValueError("sparse=True requires the basic_extractor.")
+        if (
+            stream
+            and feature_extractor is not basic_extractor
+            and _uses_train_set(feature_extractor)
+        ):
+            raise ValueError(
+                "stream=True requires a feature extractor that does not use "
+                "the training set."
+            )
+        self.sparse = sparse
+        self.stream = stream
+        self._counts = None
+        # Whether the training features lack words added by update, and
+        # must be extracted again (see train_features).
+        self._stale_features = False
+        # The number of training documents per label that contain each token
+        # which is not in the training set's words (see update).
+        self._unknown_tokens = defaultdict(Counter)
+        # In stream mode, the number of training documents per label that
+        # contain each token.
+        self._token_counts = defaultdict(Counter)
+        if not stream:
+            super().__init__(train_set, feature_extractor, format, **kwargs)
+            return
+        self.format_kwargs = kwargs
+        self.feature_extractor = feature_extractor
+        self.train_set = None
+        self.train_features = None
+        self._word_set = set()
+        self._counts = _NaiveBayesCounts()
+        self._count_records(self._iter_data(train_set, format))
+
+    def __repr__(self):
+        if not self.stream:
+            return super().__repr__()
+        class_name = self.__class__.__name__
+        num_instances = self._counts.label_freqdist.N()
+        return f"<{class_name} trained on {num_instances} instances>"
+
+    def _count_records(self, records):
+        """Count the features of ``(text, label)`` records in stream mode.
+        With the basic extractor, the words of each document are counted, and
+        the training set's words are updated as the records are read.
+        """
+        for d, c in records:
+            if self.feature_extractor is not basic_extractor:
+                self._counts.add([(self.extract_features(d), c)])
+                continue
+            if isinstance(d, basestring):
+                d = word_tokenize(d, include_punc=False)
+            words = list(d)
+            self._word_set.update(words)
+            self._counts.label_freqdist[c] += 1
+            # The tokens of _get_document_tokens, from the words
+            tokens = set(strip_punc(w, all=False) for w in words)
+            self._token_counts[c].update(tokens)
+
+    @property
+    def train_features(self):
+        """The list of ``(features, label)`` tuples of the training set."""
+        if self._stale_features:
+            self._stale_features = False
+            self._unknown_tokens = defaultdict(Counter)
+            self._train_features = self._extract_labeled_features(self.train_set)
+        return self._train_features
+
+    @train_features.setter
+    def train_features(self, value):
+        self._stale_features = False
+        self._train_features = value
+
+    def extract_features(self, text):
+        """Extracts features from a body of text. In sparse mode, only the
+        features that are ``True`` are returned.
+
+        :rtype: dictionary of features
+        """
+        if self.sparse:
+            return _sparse_basic_features(text, self._word_set)
+        return super().extract_features(text)
+
+    def _extract_labeled_features(self, labeled_data):
+        if self.feature_extractor is not basic_extractor:
+            return super()._extract_labeled_features(labeled_data)
+        labeled_features = []
+        for d, c in labeled_data:
+            tokens = _get_document_tokens(d)
+            unknown = self._unknown_tokens[c]
+            for token in tokens:
+                if token not in self._word_set:
+                    unknown[token] += 1
+            features = _basic_features(tokens, self._word_set, self.sparse)
+            labeled_features.append((features, c))
+        return labeled_features
+
+    @metrics.timed("classifier")
+    def train(self, *args, **kwargs):
+        """Train the classifier with a labeled feature set and return
+        the classifier. Takes the same arguments as
+        :meth:`nltk.classify.NaiveBayesClassifier.train`.
+
+        :rtype: A classifier
+        """
+        if not self.stream:
+            self._counts = _NaiveBayesCounts(self.train_features)
+        return self._train_from_counts(*args, **kwargs)
+
+    def _train_from_counts(self, *args, **kwargs):
+        if self.stream and self.feature_extractor is basic_extractor:
+            # Count the features of the training set's words. The other words
+            # of each document are implicitly False.
+            counts = _NaiveBayesCounts()
+            counts.label_freqdist = self._counts.label_freqdist
+            for label, tokens in self._token_counts.items():
+                for w, count in tokens.items():
+                    if w in self._word_set:
+                        counts.add_count(label, f"contains({w})", True, count)
+            fnames = [f"contains({w})" for w in self._word_set]
+            cls = _SparseNaiveBayesClassifier if self.sparse else self.nltk_class
+            self.classifier = counts.train(cls, fnames, False, *args, **kwargs)
+        else:
+            self.classifier = self._train_counts(self._counts, *args, **kwargs)
+        return self.classifier
+
+    def _train_counts(self, counts, *args, **kwargs):
+        """Return a classifier trained from the :class:`_NaiveBayesCounts`
+        of the training features.
+        """
+        if self.sparse:
+            fnames = [f"contains({w})" for w in self._word_set]
+            return counts.train(
+                _SparseNaiveBayesClassifier, fnames, False, *args, **kwargs
+            )
+        return counts.train(self.nltk_class, None, None, *args, **kwargs)
+
+    def _train_fold(self, labeled_featuresets, **kwargs):
+        return self._train_counts(_NaiveBayesCounts(labeled_featuresets), **kwargs)
+
+    def update(self, new_data, *args, **kwargs):
+        """Update the classifier with new training data and re-trains the
+        classifier. Only the features of the new data are extracted and
+        counted, unless a custom feature extractor uses the training set.
+        The result is the same as training on all of the data again.
+
+        :param new_data: New data as a list of tuples of the form
+            ``(text, label)``.
+
+        .. versionchanged:: 0.19.0
+            Only extract the features of the new data. In stream mode,
+            ``new_data`` may be any iterable, which is read once.
+        """
+        self._check_updatable()
+        if self.stream:
+            self._count_records(new_data)
+            self._train_from_counts(*args, **kwargs)
+            return True
+        incremental = self.feature_extractor is basic_extractor or (
+            not _uses_train_set(self.feature_extractor)
+        )
+        if self._counts is None or not incremental:
+            return super().update(new_data, *args, **kwargs)
+        new_words = _get_words_from_dataset(new_data) - self._word_set
+        self.train_set += new_data
+        self._word_set.update(new_words)
+        if self.feature_extractor is basic_extractor:
+            # Count the new words' features of the documents trained on so far.
+            for label, num_samples in self._counts.label_freqdist.items():
+                unknown = self._unknown_tokens[label]
+                for w in new_words:
+                    count = unknown.pop(w, 0)
+                    if count > 0:
+                        self._counts.add_count(label, f"contains({w})", True, count)
+                    if not self.sparse and num_samples - count > 0:
+                        self._counts.add_count(
+                            label, f"contains({w})", False, num_samples - count
+                        )
+        new_features = self._extract_labeled_features(new_data)
+        if new_words and self.feature_extractor is basic_extractor:
+            # The features of the documents trained on so far lack the new
+            # words. They are extracted again when they are next needed.
+            self._stale_features = True
+        elif not self._stale_features:
+            self._train_features += new_features
+        self._counts.add(new_features)
+        self._train_from_counts(*args, **kwargs)
+        return True
+
+    def _saved_model(self):
+        model = super()._saved_model()
+        model["params"] = {"sparse": self.sparse}
+        return model
+
+    def _dump_classifier(self):
+        return _dump_naive_bayes(self.classifier)
+
+    def _load_classifier(self, data):
+        cls = _SparseNaiveBayesClassifier if self.sparse else self.nltk_class
+        return _load_naive_bayes(cls, data)
+
+    @metrics.timed("classifier", tokens=metrics.count_words)
     def prob_classify(self, text):
         """Return the label probability distribution for classifying a string
         of text.
@@ -340,6 +1182,21 @@ class NaiveBayesClassifier(NLTKClassifier):
         text_features = self.extract_features(text)
         return self.classifier.prob_classify(text_features)
 
+    @metrics.timed("classifier")
+    def prob_classify_many(self, texts, n_jobs=1):
+        """Return the label probability distribution for each of the given
+        texts. Takes the same arguments as :meth:`classify_many`.
+
+        :rtype: list of nltk.probability.DictionaryProbDist
+
+        .. versionadded:: 0.19.0
+        """
+        return self._map_batches("_prob_classify_many", texts, n_jobs)
+
+    def _prob_classify_many(self, texts):
+        featuresets = [self.extract_features(text) for text in texts]
+        return self.classifier.prob_classify_many(featuresets)
+
     def informative_features(self, *args, **kwargs):
         """Return the most informative features as a list of tuples of the
         form ``(feature_name, feature_value)``.
@@ -357,6 +1214,135 @@ class NaiveBayesClassifier(NLTKClassifier):
         return self.classifier.show_most_informative_features(*args, **kwargs)
 
 
+def _compile_naive_bayes(classifier):
+    """Compile a trained NLTK Naive Bayes classifier into a dictionary with
+    the ``labels``, a ``labels x features`` array of base 2 log
+    probabilities ``logprobs``, and the ``columns`` of the array for each
+    ``(fname, fval)`` pair. The ``unseen`` column of a feature name is used for
+    values that the feature never had in the training set. Column 0 is the
+    log probability of each label (the baseline of a sparse classifier).
+    """
+    import numpy as np
+
+    labels = list(classifier.labels())
+    columns, unseen = {}, {}
+    if isinstance(classifier, _SparseNaiveBayesClassifier):
+        rows = [[classifier._baseline[label] for label in labels]]
+        for fname, deltas in classifier._deltas.items():
+            columns[fname, True] = len(rows)
+            rows.append([deltas.get(label, -np.inf) for label in labels])
+    else:
+        table = _naive_bayes_table(_dump_naive_bayes(classifier))
+        labels = table["labels"]
+        rows = [table["label_logprobs"]]
+        for feature, row in table["logprobs"].items():
+            columns[feature] = len(rows)
+            rows.append(row)
+        for fname, row in table["unseen"].items():
+            unseen[fname] = len(rows)
+            rows.append(row)
+    return {
+        "labels": labels,
+        "logprobs": np.array(rows, dtype=float).T,
+        "columns": columns,
+        "unseen": unseen,
+    }
+
+
+class NumpyNaiveBayesClassifier(NaiveBayesClassifier):
+    """A Naive Bayes classifier that stores the log probabilities of the
+    trained NLTK model in a NumPy array, and classifies a batch of texts with
+    a few array operations instead of a loop over the features of each text.
+    The results are the same as :class:`NaiveBayesClassifier` (up to
+    rounding).
+
+    NOTE: Requires numpy.
+
+    :param train_set: The training set, either a list of tuples of the form
+        ``(text, classification)`` or a filename. ``text`` may be either
+        a string or an iterable.
+    :param feature_extractor: A feature extractor function that takes one or
+        two arguments: ``document`` and ``train_set``.
+    :param format: If ``train_set`` is a filename, the file format, e.g.
+        ``"csv"`` or ``"json"``. If ``None``, will attempt to detect the
+        file format.
+    :param bool sparse: Only store the features that a document contains.
+        See :class:`NaiveBayesClassifier`.
+
+    .. versionadded:: 0.19.0
+    """
+
+    #: The number of texts that are scored at once.
+    batch_size = 1000
+
+    _model_attrs = ("classifier", "_model")
+
+    def _train_from_counts(self, *args, **kwargs):
+        classifier = super()._train_from_counts(*args, **kwargs)
+        self.__dict__.pop("_model", None)  # Recompile the trained classifier.
+        return classifier
+
+    @cached_property
+    def _model(self):
+        return _compile_naive_bayes(self.classifier)
+
+    def _logprobs(self, texts):
+        """Return a ``texts x labels`` array of base 2 log probabilities."""
+        import numpy as np
+
+        columns, unseen = self._model["columns"], self._model["unseen"]
+        rows = []
+        for batch in batched(texts, self.batch_size):
+            indices, offsets = [], []
+            for text in batch:
+                offsets.append(len(indices))
+                indices.append(0)
+                for feature in self.extract_features(text).items():
+                    i = columns.get(feature)
+                    if i is None:
+                        i = unseen.get(feature[0])
+                    if i is not None:
+                        indices.append(i)
+            # Gather the columns of the features of each text, and sum each
+            # text's columns. Every text has column 0, so none is empty.
+            logprobs = self._model["logprobs"][:, indices]
+            rows.append(np.add.reduceat(logprobs, offsets, axis=1).T)
+        if not rows:
+            return np.empty((0, len(self._model["labels"])))
+        return np.concatenate(rows)
+
+    def _prob_classify_many(self, texts):
+        labels = self._model["labels"]
+        return [
+            nltk.DictionaryProbDist(
+                dict(zip(labels, row.tolist())), normalize=True, log=True
+            )
+            for row in self._logprobs(texts)
+        ]
+
+    def _classify_many(self, texts):
+        logprobs = self._logprobs(texts)
+        labels = self._model["labels"]
+        return [labels[i] for i in logprobs.argmax(axis=1).tolist()]
+
+    @metrics.timed("classifier", tokens=metrics.count_words)
+    def prob_classify(self, text):
+        """Return the label probability distribution for classifying a string
+        of text.
+
+        :rtype: nltk.probability.DictionaryProbDist
+        """
+        return self._prob_classify_many([text])[0]
+
+    @metrics.timed("classifier", tokens=metrics.count_words)
+    def classify(self, text):
+        """Classifies the text.
+
+        :param str text: A string of text.
+        """
+        return self._classify_many([text])[0]
+
+
 class DecisionTreeClassifier(NLTKClassifier):
     """A classifier based on the decision tree algorithm, as implemented in
     NLTK.
@@ -432,35 +1418,68 @@ class PositiveNaiveBayesClassifier(NLTKClassifier):
     :param feature_extractor: A feature extractor function.
     :param positive_prob_prior: A prior estimate of the probability of the
         label ``True``.
+    :param bool stream: Read ``positive_set`` and ``unlabeled_set`` once,
+        which may then be any iterables of strings, and only keep the counts
+        of features that the model is trained from. ``positive_set``,
+        ``unlabeled_set``, ``positive_features`` and ``unlabeled_features``
+        are then ``None``.
 
     .. versionadded:: 0.7.0
+
+    .. versionchanged:: 0.19.0
+        Add the ``stream`` parameter.
     """
 
     nltk_class = nltk.classify.PositiveNaiveBayesClassifier
 
+    _training_attrs = (
+        "positive_set",
+        "unlabeled_set",
+        "positive_features",
+        "unlabeled_features",
+        "_counts",
+    )
+
     def __init__(
         self,
         positive_set,
         unlabeled_set,
         feature_extractor=contains_extractor,
         positive_prob_prior=0.5,
+        stream=False,
         **kwargs,
     ):
         self.feature_extractor = feature_extractor
+        self.positive_prob_prior = positive_prob_prior
+        self.stream = stream
+        self._counts = None
+        if stream:
+            self.positive_set = self.unlabeled_set = None
+            self.positive_features = self.unlabeled_features = None
+            self._counts = _NaiveBayesCounts()
+            self._counts.add((self.extract_features(d), True) for d in positive_set)
+            self._counts.add((self.extract_features(d), False) for d in unlabeled_set)
+            return
         self.positive_set = positive_set
         self.unlabeled_set = unlabeled_set
         self.positive_features = [self.extract_features(d) for d in self.positive_set]
         self.unlabeled_features = [self.extract_features(d) for d in self.unlabeled_set]
-        self.positive_prob_prior = positive_prob_prior
 
     def __repr__(self):
         class_name = self.__class__.__name__
+        if self.stream:
+            num_positive = self._counts.label_freqdist[True]
+            num_unlabeled = self._counts.label_freqdist[False]
+        else:
+            num_positive = len(self.positive_set)
+            num_unlabeled = len(self.unlabeled_set)
         return (
-            f"<{class_name} trained on {len(self.positive_set)} labeled "
-            f"and {len(self.unlabeled_set)} unlabeled instances>"
+            f"<{class_name} trained on {num_positive} labeled "
+            f"and {num_unlabeled} unlabeled instances>"
         )
 
     # Override
+    @metrics.timed("classifier")
     def train(self, *args, **kwargs):
         """Train the classifier with a labeled and unlabeled feature sets and return
         the classifier. Takes the same arguments as the wrapped NLTK class.
@@ -470,9 +1489,11 @@ class PositiveNaiveBayesClassifier(NLTKClassifier):
 
         :rtype: A classifier
         """
-        self.classifier = self.nltk_class.train(
-            self.positive_features, self.unlabeled_features, self.positive_prob_prior
-        )
+        if not self.stream:
+            self._counts = _NaiveBayesCounts()
+            self._counts.add((features, True) for features in self.positive_features)
+            self._counts.add((features, False) for features in self.unlabeled_features)
+        self.classifier = self._counts.train_positive(self.positive_prob_prior)
         return self.classifier
 
     def update(
@@ -488,32 +1509,65 @@ class PositiveNaiveBayesClassifier(NLTKClassifier):
 
         :param new_positive_data: List of new, labeled strings.
         :param new_unlabeled_data: List of new, unlabeled strings.
+
+        .. versionchanged:: 0.19.0
+            Only count the features of the new data.
         """
+        self._check_updatable()
+        if self._counts is None:
+            self.train()
         self.positive_prob_prior = positive_prob_prior
         if new_positive_data:
-            self.positive_set += new_positive_data
-            self.positive_features += [
-                self.extract_features(d) for d in new_positive_data
-            ]
+            new_features = [self.extract_features(d) for d in new_positive_data]
+            if not self.stream:
+                self.positive_set += new_positive_data
+                self.positive_features += new_features
+            self._counts.add((features, True) for features in new_features)
         if new_unlabeled_data:
-            self.unlabeled_set += new_unlabeled_data
-            self.unlabeled_features += [
-                self.extract_features(d) for d in new_unlabeled_data
-            ]
-        self.classifier = self.nltk_class.train(
-            self.positive_features,
-            self.unlabeled_features,
-            self.positive_prob_prior,
-            *args,
-            **kwargs,
+            new_features = [self.extract_features(d) for d in new_unlabeled_data]
+            if not self.stream:
+                self.unlabeled_set += new_unlabeled_data
+                self.unlabeled_features += new_features
+            self._counts.add((features, False) for features in new_features)
+        self.classifier = self._counts.train_positive(
+            self.positive_prob_prior, *args, **kwargs
         )
         return True
 
+    @classmethod
+    def load(cls, path, feature_extractor=contains_extractor):
+        """Return a classifier with the model saved at ``path`` by
+        :meth:`save`. The classifier has no training data, so it can classify
+        texts but not be updated: :meth:`update` raises a ``ValueError``.
+        Only load files from trusted sources.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        :param callable feature_extractor: The feature extractor the model was
+            trained with.
+        """
+        model = load_model(path, cls.__name__, cls.MODEL_VERSION)
+        classifier = cls([], [], feature_extractor, **model["params"])
+        classifier._set_model(model)
+        classifier._loaded = True
+        return classifier
+
+    def _saved_model(self):
+        return {
+            "params": {"positive_prob_prior": self.positive_prob_prior},
+            "classifier": _dump_naive_bayes(self.classifier),
+        }
+
+    def _set_model(self, model):
+        self.classifier = _load_naive_bayes(self.nltk_class, model["classifier"])
+
 
 class MaxEntClassifier(NLTKClassifier):
     __doc__ = nltk.classify.maxent.MaxentClassifier.__doc__
     nltk_class = nltk.classify.maxent.MaxentClassifier
 
+    @metrics.timed("classifier", tokens=metrics.count_words)
     def prob_classify(self, text):
         """Return the label probability distribution for classifying a string
         of text.
@@ -532,3 +1586,18 @@ class MaxEntClassifier(NLTKClassifier):
         """
         feats = self.extract_features(text)
         return self.classifier.prob_classify(feats)
+
+    @metrics.timed("classifier")
+    def prob_classify_many(self, texts, n_jobs=1):
+        """Return the label probability distribution for each of the given
+        texts. Takes the same arguments as :meth:`classify_many`.
+
+        :rtype: list of nltk.probability.DictionaryProbDist
+
+        .. versionadded:: 0.19.0
+        """
+        return self._map_batches("_prob_classify_many", texts, n_jobs)
+
+    def _prob_classify_many(self, texts):
+        featuresets = [self.extract_features(text) for text in texts]
+        return self.classifier.prob_classify_many(featuresets)
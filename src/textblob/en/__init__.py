@@ -48,10 +48,10 @@ class Parser(_Parser):
 
 
 class Sentiment(_Sentiment):
-    def load(self, path=None):
-        _Sentiment.load(self, path)
+    def _load(self, path):
+        _Sentiment._load(self, path)
         # Map "terrible" to adverb "terribly" (+1% accuracy)
-        if not path:
+        if path == self.path:
             for w, pos in list(dict.items(self)):
                 if "JJ" in pos:
                     if w.endswith("y"):
@@ -92,6 +92,13 @@ def parse(s, *args, **kwargs):
     return parser.parse(str(s), *args, **kwargs)
 
 
+def annotate(s, *args, **kwargs):
+    """Returns a list of sentences, where each sentence is a list of tokens
+    and each token is a list of word + tags, without building a tagged string.
+    """
+    return parser.annotate(str(s), *args, **kwargs)
+
+
 def parsetree(s, *args, **kwargs):
     """Returns a parsed Text from the given string."""
     return Text(parse(str(s), *args, **kwargs))
@@ -107,7 +114,7 @@ def split(s, token=None):
 def tag(s, tokenize=True, encoding="utf-8"):
     """Returns a list of (token, tag)-tuples from the given string."""
     tags = []
-    for sentence in parse(s, tokenize, True, False, False, False, encoding).split():
+    for sentence in annotate(s, tokenize, True, False, False, False, encoding):
         for token in sentence:
             tags.append((token[0], token[1]))
     return tags
@@ -2,19 +2,37 @@
 
 import nltk
 
+from textblob import cache, metrics
 from textblob.base import BaseNPExtractor
 from textblob.decorators import requires_nltk_corpus
 from textblob.taggers import PatternTagger
-from textblob.utils import filter_insignificant, tree2str
+from textblob.utils import filter_insignificant, load_model, save_model, tree2str
 
 
 class ChunkParser(nltk.ChunkParserI):
+    #: The format version of saved models.
+    MODEL_VERSION = 1
+
     def __init__(self):
         self._trained = False
 
-    @requires_nltk_corpus
     def train(self):
-        """Train the Chunker on the ConLL-2000 corpus."""
+        """Train the Chunker on the ConLL-2000 corpus.
+
+        The trained model is stored in the on-disk cache (see
+        :mod:`textblob.cache`), so other processes only need to load it.
+        """
+        self._set_model(
+            cache.cached(
+                "chunk-parser",
+                (),
+                self._train_model,
+                params=(self.MODEL_VERSION, nltk.__version__),
+            )
+        )
+
+    @requires_nltk_corpus
+    def _train_model(self):
         train_data = [
             [(t, c) for _, t, c in nltk.chunk.tree2conlltags(sent)]
             for sent in nltk.corpus.conll2000.chunked_sents(
@@ -22,9 +40,43 @@ class ChunkParser(nltk.ChunkParserI):
             )
         ]
         unigram_tagger = nltk.UnigramTagger(train_data)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        bigram_tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        return {
+            "unigram": unigram_tagger._context_to_tag,
+            "bigram": bigram_tagger._context_to_tag,
+        }
+
+    def _set_model(self, model):
+        self._model = model
+        unigram_tagger = nltk.UnigramTagger(model=model["unigram"])
+        self.tagger = nltk.BigramTagger(model=model["bigram"], backoff=unigram_tagger)
         self._trained = True
 
+    def save(self, path):
+        """Save the trained chunk-tag tables to a file, training them first if
+        needed.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        if not self._trained:
+            self.train()
+        save_model(path, type(self).__name__, self.MODEL_VERSION, self._model)
+
+    @classmethod
+    def load(cls, path):
+        """Return a parser with the model saved at ``path`` by :meth:`save`.
+        Only load files from trusted sources.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        parser = cls()
+        parser._set_model(load_model(path, cls.__name__, cls.MODEL_VERSION))
+        return parser
+
     def parse(self, sentence):
         """Return the parse tree for the sentence."""
         if not self._trained:
@@ -59,12 +111,33 @@ class ConllExtractor(BaseNPExtractor):
     # POS suffixes that will be ignored
     INSIGNIFICANT_SUFFIXES = ["DT", "CC", "PRP$", "PRP"]
 
-    def __init__(self, parser=None):
-        self.parser = ChunkParser() if not parser else parser
+    def __init__(self, parser=None, model=None):
+        """Create a new extractor.
+
+        :param parser: (optional) A chunk parser. Defaults to a
+            :class:`ChunkParser`.
+        :param str model: (optional) The path of a model saved with
+            :meth:`ChunkParser.save <textblob.en.np_extractors.ChunkParser.save>`
+            for the default parser, to avoid training it.
 
+        .. versionchanged:: 0.19.0
+            Add the ``model`` parameter.
+        """
+        if not parser:
+            parser = ChunkParser.load(model) if model else ChunkParser()
+        self.parser = parser
+
+    @metrics.timed("np_extractor", tokens=metrics.count_words)
     def extract(self, text):
-        """Return a list of noun phrases (strings) for body of text."""
-        sentences = nltk.tokenize.sent_tokenize(text)
+        """Return a list of noun phrases (strings) for body of text.
+
+        :param text: A string or BaseBlob. A blob's existing sentence
+            segmentation is reused.
+        """
+        if isinstance(text, str):
+            sentences = nltk.tokenize.sent_tokenize(text)
+        else:
+            sentences = [sentence for sentence, _ in text._segments]
         noun_phrases = []
         for sentence in sentences:
             parsed = self._parse_sentence(sentence)
@@ -105,43 +178,88 @@ class FastNPExtractor(BaseNPExtractor):
         ("JJ", "NN"): "NNI",
     }
 
+    #: The format version of saved models.
+    MODEL_VERSION = 1
+
     def __init__(self):
         self._trained = False
 
-    @requires_nltk_corpus
     def train(self):
+        """Train the tagger on the "news" category of the Brown corpus.
+
+        The trained model is stored in the on-disk cache (see
+        :mod:`textblob.cache`), so other processes only need to load it.
+        """
+        self._set_model(
+            cache.cached(
+                "fast-np-extractor",
+                (),
+                self._train_model,
+                params=(self.MODEL_VERSION, nltk.__version__),
+            )
+        )
+        return None
+
+    @requires_nltk_corpus
+    def _train_model(self):
         train_data = nltk.corpus.brown.tagged_sents(categories="news")
-        regexp_tagger = nltk.RegexpTagger(
-            [
-                (r"^-?[0-9]+(.[0-9]+)?$", "CD"),
-                (r"(-|:|;)$", ":"),
-                (r"\'*$", "MD"),
-                (r"(The|the|A|a|An|an)$", "AT"),
-                (r".*able$", "JJ"),
-                (r"^[A-Z].*$", "NNP"),
-                (r".*ness$", "NN"),
-                (r".*ly$", "RB"),
-                (r".*s$", "NNS"),
-                (r".*ing$", "VBG"),
-                (r".*ed$", "VBD"),
-                (r".*", "NN"),
-            ]
+        unigram_tagger = nltk.UnigramTagger(train_data, backoff=_regexp_tagger())
+        bigram_tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        return {
+            "unigram": unigram_tagger._context_to_tag,
+            "bigram": bigram_tagger._context_to_tag,
+        }
+
+    def _set_model(self, model):
+        self._model = model
+        unigram_tagger = nltk.UnigramTagger(
+            model=model["unigram"], backoff=_regexp_tagger()
         )
-        unigram_tagger = nltk.UnigramTagger(train_data, backoff=regexp_tagger)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        self.tagger = nltk.BigramTagger(model=model["bigram"], backoff=unigram_tagger)
         self._trained = True
-        return None
+
+    def save(self, path):
+        """Save the trained model to a file, training it first if needed.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        if not self._trained:
+            self.train()
+        save_model(path, type(self).__name__, self.MODEL_VERSION, self._model)
+
+    @classmethod
+    def load(cls, path):
+        """Return an extractor with the model saved at ``path`` by
+        :meth:`save`. Only load files from trusted sources.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        extractor = cls()
+        extractor._set_model(load_model(path, cls.__name__, cls.MODEL_VERSION))
+        return extractor
 
     def _tokenize_sentence(self, sentence):
         """Split the sentence into single words/tokens"""
         tokens = nltk.word_tokenize(sentence)
         return tokens
 
+    @metrics.timed("np_extractor", tokens=metrics.count_words)
     def extract(self, sentence):
-        """Return a list of noun phrases (strings) for body of text."""
+        """Return a list of noun phrases (strings) for body of text.
+
+        :param sentence: A string or BaseBlob. A blob's existing word
+            tokenization is reused.
+        """
         if not self._trained:
             self.train()
-        tokens = self._tokenize_sentence(sentence)
+        if isinstance(sentence, str):
+            tokens = self._tokenize_sentence(sentence)
+        else:
+            tokens = [token for _, tokens in sentence._segments for token in tokens]
         tagged = self.tagger.tag(tokens)
         tags = _normalize_tags(tagged)
         merge = True
@@ -168,6 +286,26 @@ class FastNPExtractor(BaseNPExtractor):
 ### Utility methods ###
 
 
+def _regexp_tagger():
+    """Return the tagger that FastNPExtractor falls back on for unknown words."""
+    return nltk.RegexpTagger(
+        [
+            (r"^-?[0-9]+(.[0-9]+)?$", "CD"),
+            (r"(-|:|;)$", ":"),
+            (r"\'*$", "MD"),
+            (r"(The|the|A|a|An|an)$", "AT"),
+            (r".*able$", "JJ"),
+            (r"^[A-Z].*$", "NNP"),
+            (r".*ness$", "NN"),
+            (r".*ly$", "RB"),
+            (r".*s$", "NNS"),
+            (r".*ing$", "VBG"),
+            (r".*ed$", "VBD"),
+            (r".*", "NN"),
+        ]
+    )
+
+
 def _normalize_tags(chunk):
     """Normalize the corpus tags.
     ("NN", "NN-PL", "NNS") -> "NN"
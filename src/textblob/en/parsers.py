@@ -2,7 +2,9 @@
 
 .. versionadded:: 0.6.0
 """
+from textblob import metrics
 from textblob.base import BaseParser
+from textblob.en import annotate as pattern_annotate
 from textblob.en import parse as pattern_parse
 
 
@@ -11,6 +13,18 @@ class PatternParser(BaseParser):
     http://www.clips.ua.ac.be/pages/pattern-en#parser
     """
 
+    @metrics.timed("parser", tokens=metrics.count_words)
     def parse(self, text):
         """Parses the text."""
         return pattern_parse(text)
+
+    @metrics.timed("parser", tokens=metrics.count_words)
+    def annotate(self, text):
+        """Parses the text and returns a list of sentences, where each sentence
+        is a list of tokens and each token is a list of the word, its
+        part-of-speech tag, chunk tag and preposition tag. Faster than
+        :meth:`parse` if the string form is not needed.
+
+        .. versionadded:: 0.19.0
+        """
+        return pattern_annotate(text)
@@ -6,10 +6,27 @@ from collections import namedtuple
 
 import nltk
 
+from textblob import cache, metrics
 from textblob.base import CONTINUOUS, DISCRETE, BaseSentimentAnalyzer
+from textblob.classifiers import (
+    _dump_naive_bayes,
+    _naive_bayes_prob_classify,
+    _naive_bayes_table,
+)
 from textblob.decorators import requires_nltk_corpus
 from textblob.en import sentiment as pattern_sentiment
 from textblob.tokenizers import word_tokenize
+from textblob.utils import load_model, save_model
+
+#: Return type of :meth:`PatternAnalyzer.analyze`.
+Sentiment = namedtuple("Sentiment", ["polarity", "subjectivity"])
+
+#: Return type of :meth:`PatternAnalyzer.analyze` with ``keep_assessments=True``.
+SentimentAssessments = namedtuple(
+    "Sentiment", ["polarity", "subjectivity", "assessments"]
+)
+# Keep the "Sentiment" repr, but let pickle find the class under its own name
+SentimentAssessments.__qualname__ = "SentimentAssessments"
 
 
 class PatternAnalyzer(BaseSentimentAnalyzer):
@@ -23,26 +40,19 @@ class PatternAnalyzer(BaseSentimentAnalyzer):
     """
 
     kind = CONTINUOUS
-    # This is only here for backwards-compatibility.
-    # The return type is actually determined upon calling analyze()
-    RETURN_TYPE = namedtuple("Sentiment", ["polarity", "subjectivity"])
+    #: Return type declaration
+    RETURN_TYPE = Sentiment
 
+    @metrics.timed("analyzer", tokens=metrics.count_words)
     def analyze(self, text, keep_assessments=False):
         """Return the sentiment as a named tuple of the form:
         ``Sentiment(polarity, subjectivity, [assessments])``.
         """
-        #: Return type declaration
+        score = pattern_sentiment(text)
         if keep_assessments:
-            Sentiment = namedtuple(
-                "Sentiment", ["polarity", "subjectivity", "assessments"]
-            )
-            assessments = pattern_sentiment(text).assessments
-            polarity, subjectivity = pattern_sentiment(text)
-            return Sentiment(polarity, subjectivity, assessments)
-
+            return SentimentAssessments(score[0], score[1], score.assessments)
         else:
-            Sentiment = namedtuple("Sentiment", ["polarity", "subjectivity"])
-            return Sentiment(*pattern_sentiment(text))
+            return Sentiment(*score)
 
 
 def _default_feature_extractor(words):
@@ -62,16 +72,36 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
     kind = DISCRETE
     #: Return type declaration
     RETURN_TYPE = namedtuple("Sentiment", ["classification", "p_pos", "p_neg"])
+    RETURN_TYPE.__qualname__ = "NaiveBayesAnalyzer.RETURN_TYPE"
+
+    #: The format version of saved models.
+    MODEL_VERSION = 1
 
     def __init__(self, feature_extractor=_default_feature_extractor):
         super().__init__()
-        self._classifier = None
+        self._model = None
         self.feature_extractor = feature_extractor
 
-    @requires_nltk_corpus
     def train(self):
-        """Train the Naive Bayes classifier on the movie review corpus."""
+        """Train the Naive Bayes classifier on the movie review corpus.
+
+        With the default feature extractor, the trained model is stored in the
+        on-disk cache (see :mod:`textblob.cache`), so other processes only need
+        to load it.
+        """
+        if self.feature_extractor is _default_feature_extractor:
+            self._model = cache.cached(
+                "naive-bayes-analyzer",
+                (),
+                self._train_model,
+                params=(self.MODEL_VERSION, nltk.__version__),
+            )
+        else:
+            self._model = self._train_model()
         super().train()
+
+    @requires_nltk_corpus
+    def _train_model(self):
         neg_ids = nltk.corpus.movie_reviews.fileids("neg")
         pos_ids = nltk.corpus.movie_reviews.fileids("pos")
         neg_feats = [
@@ -89,8 +119,37 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
             for f in pos_ids
         ]
         train_data = neg_feats + pos_feats
-        self._classifier = nltk.classify.NaiveBayesClassifier.train(train_data)
+        classifier = nltk.classify.NaiveBayesClassifier.train(train_data)
+        return _naive_bayes_table(_dump_naive_bayes(classifier))
+
+    def save(self, path):
+        """Save the trained model to a file, training it first if needed.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        """
+        if not self._trained:
+            self.train()
+        save_model(path, type(self).__name__, self.MODEL_VERSION, self._model)
+
+    @classmethod
+    def load(cls, path, feature_extractor=_default_feature_extractor):
+        """Return an analyzer with the model saved at ``path`` by :meth:`save`.
+        Only load files from trusted sources.
+
+        .. versionadded:: 0.19.0
+
+        :param str path: The file path.
+        :param callable feature_extractor: The feature extractor the model was
+            trained with.
+        """
+        analyzer = cls(feature_extractor=feature_extractor)
+        analyzer._model = load_model(path, cls.__name__, cls.MODEL_VERSION)
+        analyzer._trained = True
+        return analyzer
 
+    @metrics.timed("analyzer", tokens=metrics.count_words)
     def analyze(self, text):
         """Return the sentiment as a named tuple of the form:
         ``Sentiment(classification, p_pos, p_neg)``
@@ -100,7 +159,7 @@ class NaiveBayesAnalyzer(BaseSentimentAnalyzer):
         tokens = word_tokenize(text, include_punc=False)
         filtered = (t.lower() for t in tokens if len(t) >= 3)
         feats = self.feature_extractor(filtered)
-        prob_dist = self._classifier.prob_classify(feats)
+        prob_dist = _naive_bayes_prob_classify(self._model, feats)
         return self.RETURN_TYPE(
             classification=prob_dist.max(),
             p_pos=prob_dist.prob("pos"),
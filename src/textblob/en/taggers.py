@@ -2,10 +2,11 @@
 
 import nltk
 
-import textblob as tb
+from textblob import metrics
 from textblob.base import BaseTagger
 from textblob.decorators import requires_nltk_corpus
 from textblob.en import tag as pattern_tag
+from textblob.tokenizers import word_tokenize
 
 
 class PatternTagger(BaseTagger):
@@ -14,6 +15,7 @@ class PatternTagger(BaseTagger):
     (http://www.clips.ua.ac.be/pattern).
     """
 
+    @metrics.timed("tagger", tokens=metrics.count_result)
     def tag(self, text, tokenize=True):
         """Tag a string or BaseBlob."""
         if not isinstance(text, str):
@@ -26,10 +28,12 @@ class NLTKTagger(BaseTagger):
     NOTE: Requires numpy. Not yet supported with PyPy.
     """
 
+    @metrics.timed("tagger", tokens=metrics.count_result)
     @requires_nltk_corpus
     def tag(self, text):
         """Tag a string or BaseBlob."""
         if isinstance(text, str):
-            text = tb.TextBlob(text)
-
-        return nltk.tag.pos_tag(text.tokens)
+            tokens = list(word_tokenize(text))
+        else:
+            tokens = text.tokens
+        return nltk.tag.pos_tag(tokens)
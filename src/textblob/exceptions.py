@@ -55,3 +55,9 @@ class FormatError(TextBlobError):
     """Raised if a data file with an unsupported format is passed to a classifier."""
 
     pass
+
+
+class ModelError(TextBlobError):
+    """Raised if a saved model cannot be loaded."""
+
+    pass
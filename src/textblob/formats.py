@@ -22,9 +22,13 @@ that format. ::
 """
 
 import csv
+import io
 import json
+import mmap
+import re
 from collections import OrderedDict
 
+from textblob.decorators import cached_property
 from textblob.utils import is_filelike
 
 DEFAULT_ENCODING = "utf-8"
@@ -47,6 +51,17 @@ class BaseFormat:
         """Return an iterable object from the data."""
         raise NotImplementedError('Must implement a "to_iterable" method.')
 
+    def iter_records(self):
+        """Return an iterator over the ``(text, label)`` records of the data.
+        Formats that are constructed with ``lazy=True`` read their records
+        from the file here, one at a time, so that a file can be processed
+        without holding all of its records in memory. The records of a lazy
+        format can only be iterated once.
+
+        .. versionadded:: 0.19.0
+        """
+        return iter(self.to_iterable())
+
     @classmethod
     def detect(cls, stream):
         """Detect the file format given a filename.
@@ -59,19 +74,43 @@ class BaseFormat:
 
 
 class DelimitedFormat(BaseFormat):
-    """A general character-delimited format."""
+    """A general character-delimited format.
+
+    :param File fp: A file-like object.
+    :param bool lazy: Read the rows of the file as they are iterated with
+        :meth:`iter_records`, instead of reading the whole file in the
+        constructor. The file must stay open until then.
+
+    .. versionchanged:: 0.19.0
+        Add the ``lazy`` parameter.
+    """
 
     delimiter = ","
 
-    def __init__(self, fp, **kwargs):
+    def __init__(self, fp, lazy=False, **kwargs):
         BaseFormat.__init__(self, fp, **kwargs)
-        reader = csv.reader(fp, delimiter=self.delimiter)
-        self.data = [row for row in reader]
+        self._fp = fp
+        if not lazy:
+            self.data = list(self.iter_records())
+
+    @cached_property
+    def data(self):
+        """The list of rows in the file."""
+        return list(self.iter_records())
 
     def to_iterable(self):
         """Return an iterable object from the data."""
         return self.data
 
+    def iter_records(self):
+        """Return an iterator that reads the rows of the file one at a time.
+
+        .. versionadded:: 0.19.0
+        """
+        if "data" in self.__dict__:
+            return iter(self.data)
+        return csv.reader(self._fp, delimiter=self.delimiter)
+
     @classmethod
     def detect(cls, stream):
         """Return True if stream is valid."""
@@ -99,6 +138,55 @@ class TSV(DelimitedFormat):
     delimiter = "\t"
 
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_json_array(fp, chunk_size=65536):
+    """Yield the items of the JSON array in the file ``fp`` one at a time,
+    reading the file in chunks of ``chunk_size`` characters.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+    state = "start"  # Then "item" (after "[" or ","), "first" or "end"
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer) and not eof:
+            chunk = fp.read(chunk_size)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        if pos == len(buffer):
+            raise json.JSONDecodeError("Unexpected end of JSON array", buffer, pos)
+        if state == "start":
+            if buffer[pos] != "[":
+                raise json.JSONDecodeError("Expecting a JSON array", buffer, pos)
+            pos += 1
+            state = "first"
+        elif state == "end" or (state == "first" and buffer[pos] == "]"):
+            if buffer[pos] == "]":
+                return
+            if buffer[pos] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            state = "item"
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = len(buffer)
+            # Unless the item is followed by a delimiter, it may continue in
+            # the next chunk, e.g. the digits of a number.
+            following = _WHITESPACE.match(buffer, end).end()
+            if not eof and buffer[following : following + 1] not in (",", "]"):
+                chunk = fp.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+            yield item
+            pos = end
+            state = "end"
+
+
 class JSON(BaseFormat):
     """JSON format.
 
@@ -110,16 +198,41 @@ class JSON(BaseFormat):
             {"text": "Today is a good day.", "label": "pos"},
             {"text": "I hate this car.", "label": "neg"},
         ]
+
+    :param File fp: A file-like object.
+    :param bool lazy: Decode the objects of the array as they are iterated
+        with :meth:`iter_records`, instead of reading the whole file in the
+        constructor. The file must stay open until then.
+
+    .. versionchanged:: 0.19.0
+        Add the ``lazy`` parameter.
     """
 
-    def __init__(self, fp, **kwargs):
+    def __init__(self, fp, lazy=False, **kwargs):
         BaseFormat.__init__(self, fp, **kwargs)
-        self.dict = json.load(fp)
+        self._fp = fp
+        if not lazy:
+            self.dict = json.load(fp)
+
+    @cached_property
+    def dict(self):
+        """The decoded JSON data."""
+        return json.load(self._fp)
 
     def to_iterable(self):
         """Return an iterable object from the JSON data."""
         return [(d["text"], d["label"]) for d in self.dict]
 
+    def iter_records(self):
+        """Return an iterator that decodes the objects of the JSON array one
+        at a time.
+
+        .. versionadded:: 0.19.0
+        """
+        if "dict" in self.__dict__:
+            return iter(self.to_iterable())
+        return ((d["text"], d["label"]) for d in _iter_json_array(self._fp))
+
     @classmethod
     def detect(cls, stream):
         """Return True if stream is valid JSON."""
@@ -130,8 +243,105 @@ class JSON(BaseFormat):
             return False
 
 
+class JSONL(BaseFormat):
+    """JSON Lines format.
+
+    Assumes that each line is a JSON object with ``text`` and ``label``
+    properties. Blank lines are skipped.
+    ::
+
+        {"text": "Today is a good day.", "label": "pos"}
+        {"text": "I hate this car.", "label": "neg"}
+
+    :param File fp: A file-like object.
+    :param str text_key: The property that holds the text.
+    :param str label_key: The property that holds the label.
+    :param bool lazy: Decode the lines as they are iterated with
+        :meth:`iter_records`, instead of reading the whole file in the
+        constructor. The file must stay open until then.
+    :param bool use_mmap: Read the lines of a file on disk from a memory map
+        of the file rather than through the file object.
+
+    .. versionadded:: 0.19.0
+    """
+
+    def __init__(
+        self,
+        fp,
+        text_key="text",
+        label_key="label",
+        lazy=False,
+        use_mmap=True,
+        **kwargs,
+    ):
+        BaseFormat.__init__(self, fp, **kwargs)
+        self._fp = fp
+        self.text_key = text_key
+        self.label_key = label_key
+        self.use_mmap = use_mmap
+        if not lazy:
+            self.data = list(self.iter_records())
+
+    @cached_property
+    def data(self):
+        """The list of ``(text, label)`` records in the file."""
+        return list(self.iter_records())
+
+    def to_iterable(self):
+        """Return an iterable object from the data."""
+        return self.data
+
+    def iter_records(self):
+        """Return an iterator that decodes the lines of the file one at a
+        time.
+        """
+        if "data" in self.__dict__:
+            return iter(self.data)
+        return (
+            (d[self.text_key], d[self.label_key])
+            for d in map(json.loads, self._iter_lines())
+        )
+
+    def _iter_lines(self):
+        """Yield the non-blank lines of the file, from a memory map of the
+        file if possible.
+        """
+        mapped = None
+        if self.use_mmap:
+            try:
+                # The memory map starts at the beginning of the file.
+                if self._fp.tell() == 0:
+                    fileno = self._fp.fileno()
+                    mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                pass  # Not a file on disk, or an empty file
+        if mapped is None:
+            lines = self._fp
+        else:
+            encoding = getattr(self._fp, "encoding", None) or DEFAULT_ENCODING
+            lines = (line.decode(encoding) for line in iter(mapped.readline, b""))
+        try:
+            for line in lines:
+                if line.strip():
+                    yield line
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+    @classmethod
+    def detect(cls, stream):
+        """Return True if the first line of stream is a JSON object."""
+        try:
+            return isinstance(json.loads(stream.split("\n", 1)[0]), dict)
+        except (ValueError, AttributeError):
+            return False
+
+
 _registry = OrderedDict(
     [
+        # JSON Lines are tried first, since their lines may also look like
+        # comma-separated values.
+        ("jsonl", JSONL),
         ("csv", CSV),
         ("json", JSON),
         ("tsv", TSV),
@@ -139,18 +349,33 @@ _registry = OrderedDict(
 )
 
 
-def detect(fp, max_read=1024):
+def detect(fp, max_read=1024, max_line=65536):
     """Attempt to detect a file's format, trying each of the supported
     formats. Return the format class that was detected. If no format is
     detected, return ``None``.
+
+    :param int max_read: The number of characters to read.
+    :param int max_line: If the first ``max_read`` characters do not contain
+        a line break, up to this many more characters are read to complete
+        the first line, e.g. for JSON Lines. A longer first line is not
+        completed.
+
+    .. versionchanged:: 0.19.0
+        Add the ``max_line`` parameter.
     """
     if not is_filelike(fp):
         return None
+    stream = fp.read(max_read)
+    # Complete the first line if the file-like object can read lines.
+    readline = getattr(fp, "readline", None)
+    if readline is not None and isinstance(stream, str) and "\n" not in stream:
+        line = readline(max_line)
+        if isinstance(line, str) and (len(line) < max_line or line.endswith("\n")):
+            stream += line
+    fp.seek(0)
     for Format in _registry.values():
-        if Format.detect(fp.read(max_read)):
-            fp.seek(0)
+        if Format.detect(stream):
             return Format
-        fp.seek(0)
     return None
 
 
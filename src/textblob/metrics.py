@@ -0,0 +1,172 @@
+"""Opt-in instrumentation of TextBlob's processing stages.
+
+When enabled, every call to a tokenizer, tagger, noun phrase extractor,
+sentiment analyzer, parser or classifier, and every load of a lazily loaded
+lexicon, records its latency and the number of word tokens it processed.
+Metrics are disabled by default, in which case each instrumented call only
+checks a flag. Enable them with :func:`enable` or by setting the
+``TEXTBLOB_METRICS`` environment variable to ``1``. ::
+
+    >>> from textblob import TextBlob, metrics
+    >>> metrics.enable()
+    >>> tags = TextBlob("Simple is better than complex.").tags
+    >>> metrics.snapshot()["tagger.PatternTagger.tag"]["calls"]
+    1
+
+Stages are named ``<stage>.<class>.<method>``, or ``<stage>.<function>``.
+Latencies are inclusive, e.g. the latency of a tagger includes the latency
+of the tokenizer it calls. Metrics are kept per process, so calls made in
+worker processes (``n_jobs > 1``) are not recorded.
+
+.. versionadded:: 0.19.0
+"""
+
+import bisect
+import os
+import threading
+import time
+from functools import wraps
+
+ENV_VAR = "TEXTBLOB_METRICS"
+
+#: Upper bounds, in seconds, of the latency histogram buckets. Slower calls
+#: are counted in an overflow bucket.
+BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_stats = {}
+_lock = threading.Lock()
+
+
+class _Stat:
+    __slots__ = ("calls", "errors", "tokens", "total", "min", "max", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.tokens = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def as_dict(self):
+        bounds = [str(bound) for bound in BUCKETS] + ["+Inf"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "tokens": self.tokens,
+            "total_seconds": self.total,
+            "min_seconds": self.min,
+            "max_seconds": self.max,
+            "histogram": dict(zip(bounds, self.histogram)),
+        }
+
+
+def enable():
+    """Start recording metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording metrics. The metrics recorded so far are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Return whether metrics are being recorded."""
+    return _enabled
+
+
+def reset():
+    """Discard all recorded metrics."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot():
+    """Return the recorded metrics as a dict that maps each stage name to a
+    dict of its ``calls``, ``errors``, ``tokens``, ``total_seconds``,
+    ``min_seconds``, ``max_seconds`` and ``histogram``. The histogram maps the
+    upper bound of each latency bucket (see :data:`BUCKETS`) to the number of
+    calls in that bucket. The result can be serialized to JSON.
+    """
+    with _lock:
+        return {name: stat.as_dict() for name, stat in sorted(_stats.items())}
+
+
+def record(name, seconds, tokens=0, error=False):
+    """Record one call of the stage ``name`` that took ``seconds`` and
+    processed ``tokens`` tokens. Use this to instrument custom stages.
+    """
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.calls += 1
+        stat.errors += error
+        stat.tokens += tokens
+        stat.total += seconds
+        if stat.min is None or seconds < stat.min:
+            stat.min = seconds
+        if stat.max is None or seconds > stat.max:
+            stat.max = seconds
+        stat.histogram[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+
+def count_result(result, text):
+    """Count the tokens of a stage as the length of its result."""
+    return len(result)
+
+
+def count_words(result, text):
+    """Count the tokens of a stage as the number of words in its input, which
+    may be a string, a blob or a list of tokens.
+    """
+    text = getattr(text, "raw", text)
+    if isinstance(text, str):
+        return len(text.split())
+    if isinstance(text, (list, tuple)):
+        return len(text)
+    return 0
+
+
+def timed(stage, tokens=None):
+    """Decorator that records the metrics of a function or method under
+    ``<stage>.<function>``, or ``<stage>.<class>.<method>`` where ``<class>``
+    is the class of the instance.
+
+    :param str stage: The kind of stage, e.g. ``"tagger"``.
+    :param tokens: (optional) A function that takes the result and the
+        (first) argument of a call, and returns the number of tokens
+        processed, e.g. :func:`count_result` or :func:`count_words`.
+    """
+
+    def decorator(func):
+        is_method = "." in func.__qualname__
+
+        @wraps(func)
+        def decorated(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            if is_method:
+                name = f"{stage}.{type(args[0]).__name__}.{func.__name__}"
+                text = args[1] if len(args) > 1 else None
+            else:
+                name = f"{stage}.{func.__name__}"
+                text = args[0] if args else None
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(name, time.perf_counter() - start, error=True)
+                raise
+            seconds = time.perf_counter() - start
+            record(name, seconds, tokens(result, text) if tokens else 0)
+            return result
+
+        return decorated
+
+    return decorator
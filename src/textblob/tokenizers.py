@@ -7,6 +7,7 @@ from itertools import chain
 
 import nltk
 
+from textblob import metrics
 from textblob.base import BaseTokenizer
 from textblob.decorators import requires_nltk_corpus
 from textblob.utils import strip_punc
@@ -24,6 +25,7 @@ class WordTokenizer(BaseTokenizer):
     * separate periods that appear at the end of line
     """
 
+    @metrics.timed("tokenizer", tokens=metrics.count_result)
     def tokenize(self, text, include_punc=True):
         """Return a list of word tokens.
 
@@ -35,16 +37,24 @@ class WordTokenizer(BaseTokenizer):
         if include_punc:
             return tokens
         else:
-            # Return each word token
-            # Strips punctuation unless the word comes from a contraction
-            # e.g. "Let's" => ["Let", "'s"]
-            # e.g. "Can't" => ["Ca", "n't"]
-            # e.g. "home." => ['home']
-            return [
-                word if word.startswith("'") else strip_punc(word, all=False)
-                for word in tokens
-                if strip_punc(word, all=False)
-            ]
+            return exclude_punc(tokens)
+
+
+def exclude_punc(tokens):
+    """Return each word token in ``tokens``, leaving out punctuation tokens.
+
+    Strips punctuation unless the word comes from a contraction
+    e.g. "Let's" => ["Let", "'s"]
+    e.g. "Can't" => ["Ca", "n't"]
+    e.g. "home." => ['home']
+
+    .. versionadded:: 0.19.0
+    """
+    return [
+        word if word.startswith("'") else strip_punc(word, all=False)
+        for word in tokens
+        if strip_punc(word, all=False)
+    ]
 
 
 class SentenceTokenizer(BaseTokenizer):
@@ -54,6 +64,7 @@ class SentenceTokenizer(BaseTokenizer):
     then uses that to find sentence boundaries.
     """
 
+    @metrics.timed("tokenizer", tokens=metrics.count_words)
     @requires_nltk_corpus
     def tokenize(self, text):
         """Return a list of sentences."""
@@ -66,14 +77,46 @@ sent_tokenize = SentenceTokenizer().itokenize
 _word_tokenizer = WordTokenizer()  # Singleton word tokenizer
 
 
+def _tokenize_sentence(sentence):
+    """Tokenize a single sentence into words, without segmenting it again."""
+    return nltk.tokenize.word_tokenize(sentence, preserve_line=True)
+
+
+def _count_sentence_tokens(result, text):
+    return sum(len(tokens) for _, tokens in result)
+
+
+@metrics.timed("tokenizer", tokens=_count_sentence_tokens)
+def sent_word_tokenize(text):
+    """Tokenize text into sentences, and each sentence into words. The sentence
+    tokenizer only runs once over the text.
+
+    :returns: A list of ``(sentence, tokens)`` tuples, where ``tokens`` is the
+        list of word tokens (including punctuation) in ``sentence``.
+
+    .. versionadded:: 0.19.0
+    """
+    return [
+        (sentence, _tokenize_sentence(sentence)) for sentence in sent_tokenize(text)
+    ]
+
+
 def word_tokenize(text, include_punc=True, *args, **kwargs):
     """Convenience function for tokenizing text into words.
 
     NOTE: NLTK's word tokenizer expects sentences as input, so the text will be
     tokenized to sentences before being tokenized to words.
+
+    Additional arguments are passed to
+    :meth:`WordTokenizer.tokenize <textblob.tokenizers.WordTokenizer.tokenize>`
+    for each sentence.
     """
-    words = chain.from_iterable(
-        _word_tokenizer.itokenize(sentence, include_punc, *args, **kwargs)
-        for sentence in sent_tokenize(text)
-    )
-    return words
+    if args or kwargs:
+        return chain.from_iterable(
+            _word_tokenizer.itokenize(sentence, include_punc, *args, **kwargs)
+            for sentence in sent_tokenize(text)
+        )
+    tokens = (_tokenize_sentence(sentence) for sentence in sent_tokenize(text))
+    if not include_punc:
+        tokens = (exclude_punc(sentence_tokens) for sentence_tokens in tokens)
+    return chain.from_iterable(tokens)
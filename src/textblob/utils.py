@@ -1,5 +1,11 @@
+import os
+import pickle
 import re
 import string
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from textblob.exceptions import ModelError
 
 PUNCTUATION_REGEX = re.compile(f"[{re.escape(string.punctuation)}]")
 
@@ -53,3 +59,89 @@ def filter_insignificant(chunk, tag_suffixes=("DT", "CC", "PRP$", "PRP")):
 def is_filelike(obj):
     """Return whether ``obj`` is a file-like object."""
     return hasattr(obj, "read")
+
+
+def batched(iterable, size):
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def resolve_n_jobs(n_jobs):
+    """Return the number of worker processes to use for ``n_jobs``. ``None``
+    means 1; negative values count back from the number of CPUs, so ``-1``
+    means all CPUs.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None.")
+    return n_jobs
+
+
+def process_map(func, iterable, n_jobs, initializer=None, initargs=()):
+    """Apply ``func`` to each item of ``iterable`` in a pool of ``n_jobs``
+    worker processes and yield the results in input order.
+
+    Unlike ``Executor.map``, items are consumed lazily: at most ``2 * n_jobs``
+    items are in flight at any time, so ``iterable`` may be an unbounded
+    generator.
+
+    :param func: A picklable, module-level function.
+    :param iterable: The items to process.
+    :param int n_jobs: The number of worker processes.
+    :param initializer: (optional) Called once in each worker process with
+        ``initargs``, e.g. to load models.
+    """
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending = deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def save_model(path, kind, version, data):
+    """Pickle a trained model's ``data`` to the file at ``path``, tagged with
+    the model's ``kind`` and format ``version`` for :func:`load_model`.
+    """
+    with open(path, "wb") as fp:
+        pickle.dump(
+            {"kind": kind, "version": version, "data": data},
+            fp,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+
+def load_model(path, kind, version):
+    """Return the model data saved with :func:`save_model` at ``path``.
+
+    Raises a :exc:`ModelError <textblob.exceptions.ModelError>` if the file
+    does not hold a model of the given ``kind`` and format ``version``.
+    Only load files from trusted sources; they are unpickled.
+    """
+    with open(path, "rb") as fp:
+        try:
+            model = pickle.load(fp)
+        except Exception as error:
+            raise ModelError(f"{path!r} is not a saved model.") from error
+    if not isinstance(model, dict) or model.get("kind") != kind:
+        raise ModelError(f"{path!r} is not a saved {kind} model.")
+    if model["version"] != version:
+        raise ModelError(
+            f"{path!r} holds a version {model['version']} {kind} model; "
+            f"expected version {version}. Retrain and save the model again."
+        )
+    return model["data"]
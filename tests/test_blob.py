@@ -4,7 +4,7 @@ Tests for the text processor.
 
 import json
 from datetime import datetime
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import nltk
 import pytest
@@ -16,7 +16,7 @@ from textblob.np_extractors import ConllExtractor, FastNPExtractor
 from textblob.parsers import PatternParser
 from textblob.sentiments import NaiveBayesAnalyzer, PatternAnalyzer
 from textblob.taggers import NLTKTagger, PatternTagger
-from textblob.tokenizers import SentenceTokenizer, WordTokenizer
+from textblob.tokenizers import SentenceTokenizer, WordTokenizer, sent_tokenize
 
 Synset = nltk.corpus.reader.Synset
 
@@ -156,6 +156,19 @@ class SentenceTest(TestCase):
     def test_repr(self):
         assert repr(self.sentence) == f'Sentence("{self.raw_sentence}")'
 
+    def test_sentiment_is_scored_once(self):
+        sentence = tb.Sentence("I feel great this morning.")
+        with mock.patch(
+            "textblob.en.sentiments.pattern_sentiment", wraps=tb.en.sentiment
+        ) as mock_sentiment:
+            polarity = sentence.polarity
+            subjectivity = sentence.subjectivity
+            sentence.sentiment  # noqa: B018
+            sentence.sentiment_assessments  # noqa: B018
+        assert mock_sentiment.call_count == 1
+        assert sentence.sentiment == (polarity, subjectivity)
+        assert sentence.sentiment_assessments.assessments
+
     def test_stripped_sentence(self):
         assert (
             self.sentence.stripped
@@ -408,6 +421,19 @@ is managed by the non-profit Python Software Foundation."""  # noqa: E501
         short = tb.TextBlob("Just a bundle of words")
         assert short.words == tb.WordList(["Just", "a", "bundle", "of", "words"])
 
+    def test_text_is_segmented_once(self):
+        blob = tb.TextBlob("Beautiful is better than ugly. Explicit is better.")
+        with mock.patch(
+            "textblob.tokenizers.sent_tokenize", wraps=sent_tokenize
+        ) as mock_sent_tokenize:
+            blob.words  # noqa: B018
+            blob.tokens  # noqa: B018
+            blob.sentences  # noqa: B018
+            blob.tags  # noqa: B018
+        assert mock_sent_tokenize.call_count == 1
+        assert blob.tokens == tb.WordList(WordTokenizer().tokenize(blob.raw))
+        assert blob.sentences[1].tokens == ["Explicit", "is", "better", "."]
+
     def test_words_includes_apostrophes_in_contractions(self):
         blob = tb.TextBlob("Let's test this.")
         assert blob.words == tb.WordList(["Let", "'s", "test", "this"])
@@ -840,6 +866,19 @@ is managed by the non-profit Python Software Foundation."""  # noqa: E501
         blob = tb.TextBlob("This isn't gonna be good")
         with pytest.raises(NameError):
             blob.classify()
+        with pytest.raises(NameError):
+            blob.classify_sentences()
+
+    def test_classify_sentences(self):
+        blob = tb.TextBlob(
+            "This is an amazing library. I do not like this restaurant.",
+            classifier=classifier,
+        )
+        assert blob.classify_sentences() == ["pos", "neg"]
+        assert [s.__dict__["classification"] for s in blob.sentences] == [
+            "pos",
+            "neg",
+        ]
 
     def test_word_string_type_after_pos_tags_is_str(self):
         text = "John is a cat"
@@ -1015,6 +1054,39 @@ class BlobberTest(TestCase):
         blob = b("I am so amazing")
         assert blob.classify() == "pos"
 
+    def test_pipe(self):
+        texts = ["I love this library.", "This is a terrible car.", "Hello world."]
+        blobs = list(self.blobber.pipe(texts, fields=["sentiment", "tags"]))
+        assert [blob.raw for blob in blobs] == texts
+        assert all(is_blob(blob) for blob in blobs)
+        assert "sentiment" in blobs[0].__dict__
+        assert "pos_tags" in blobs[0].__dict__
+        assert "noun_phrases" not in blobs[0].__dict__
+        assert blobs[1].sentiment == tb.TextBlob(texts[1]).sentiment
+
+    def test_pipe_with_multiple_processes(self):
+        b = tb.Blobber(pos_tagger=PatternTagger(), classifier=classifier)
+        texts = [f"I love this sandwich {i}." for i in range(10)]
+        blobs = list(
+            b.pipe(
+                iter(texts),
+                batch_size=3,
+                n_process=2,
+                fields=["sentiment", "tags", "classification"],
+            )
+        )
+        assert [blob.raw for blob in blobs] == texts
+        for blob, text in zip(blobs, texts):
+            expected = b(text)
+            assert blob.__dict__["sentiment"] == expected.sentiment
+            assert blob.__dict__["pos_tags"] == expected.tags
+            assert blob.__dict__["classification"] == "pos"
+            assert blob.pos_tagger is b.pos_tagger
+
+    def test_pipe_with_invalid_field(self):
+        with pytest.raises(ValueError):
+            list(self.blobber.pipe(["Some text"], fields=["sentences"]))
+
 
 def is_blob(obj):
     return isinstance(obj, tb.TextBlob)
@@ -0,0 +1,101 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase, mock
+
+from textblob import cache
+from textblob._text import Lexicon
+from textblob.en import Sentiment, sentiment
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.source_dir = tempfile.mkdtemp()
+        patcher = mock.patch.dict(os.environ, {cache.ENV_VAR: self.cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.addCleanup(shutil.rmtree, self.source_dir)
+
+    def write_source(self, name, text):
+        path = os.path.join(self.source_dir, name)
+        with open(path, "w") as fp:
+            fp.write(text)
+        return path
+
+    def test_get_cache_dir(self):
+        assert cache.get_cache_dir() == self.cache_dir
+        with mock.patch.dict(os.environ, {cache.ENV_VAR: ""}):
+            assert cache.get_cache_dir() is None
+
+    def test_cached_builds_once(self):
+        path = self.write_source("words.txt", "cat\n")
+        build = mock.Mock(return_value=["cat"])
+        assert cache.cached("words", path, build) == ["cat"]
+        assert cache.cached("words", path, build) == ["cat"]
+        assert build.call_count == 1
+
+    def test_cached_rebuilds_when_source_changes(self):
+        path = self.write_source("words.txt", "cat\n")
+        cache.cached("words", path, lambda: ["cat"])
+        self.write_source("words.txt", "dog\n")
+        assert cache.cached("words", path, lambda: ["dog"]) == ["dog"]
+        # The stale entry is removed.
+        assert len(os.listdir(self.cache_dir)) == 1
+
+    def test_cached_ignores_corrupt_entries(self):
+        path = self.write_source("words.txt", "cat\n")
+        cache.cached("words", path, lambda: ["cat"])
+        (entry,) = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, entry), "wb") as fp:
+            fp.write(b"garbage")
+        assert cache.cached("words", path, lambda: ["dog"]) == ["dog"]
+
+    def test_cached_disabled(self):
+        path = self.write_source("words.txt", "cat\n")
+        build = mock.Mock(return_value=["cat"])
+        with mock.patch.dict(os.environ, {cache.ENV_VAR: ""}):
+            cache.cached("words", path, build)
+            cache.cached("words", path, build)
+        assert build.call_count == 2
+        assert os.listdir(self.cache_dir) == []
+
+    def test_lexicon_is_loaded_from_cache(self):
+        path = self.write_source("lexicon.txt", "cat NN\nran VBD\n")
+        context = self.write_source("context.txt", "NN VB PREVTAG TO\n")
+        lexicon = Lexicon(path=path, context=context)
+        assert dict(lexicon) == {"cat": "NN", "ran": "VBD"}
+        assert len(lexicon.context) == 1
+        assert len(os.listdir(self.cache_dir)) == 2
+        lexicon = Lexicon(path=path, context=context)
+        with mock.patch("textblob._text._read") as read:
+            assert dict(lexicon) == {"cat": "NN", "ran": "VBD"}
+            assert list(lexicon.context) == [["NN", "VB", "PREVTAG", "TO"]]
+            assert read.call_count == 0
+
+    def test_sentiment_is_loaded_from_cache(self):
+        compiled = Sentiment(path=sentiment.path, synset="wordnet_id")
+        assert len(compiled) > 0
+        cached = Sentiment(path=sentiment.path, synset="wordnet_id")
+        with mock.patch("textblob._text.ElementTree.parse") as parse:
+            assert dict(cached) == dict(compiled)
+            assert parse.call_count == 0
+        # Includes the adverbs derived by textblob.en.Sentiment.
+        assert cached["terribly"]["RB"] == compiled["terribly"]["RB"]
+        assert cached.labeler == compiled.labeler
+        assert cached.synset(193480) == compiled.synset(193480)
+        assert cached.language == "en"
+
+    def test_build_cache(self):
+        subprocess.run([sys.executable, "-m", "textblob.build_cache"], check=True)
+        names = {entry.split("-")[1] for entry in os.listdir(self.cache_dir)}
+        assert names >= {
+            "lexicon.txt",
+            "morphology.txt",
+            "context.txt",
+            "entities.txt",
+            "sentiment.xml",
+        }
@@ -1,5 +1,8 @@
+import io
 import os
+import tempfile
 import unittest
+from collections import Counter
 from unittest import mock
 
 import nltk
@@ -11,17 +14,21 @@ from textblob.classifiers import (
     MaxEntClassifier,
     NaiveBayesClassifier,
     NLTKClassifier,
+    NumpyNaiveBayesClassifier,
     PositiveNaiveBayesClassifier,
     _get_words_from_dataset,
+    _SparseNaiveBayesClassifier,
     basic_extractor,
     contains_extractor,
 )
-from textblob.exceptions import FormatError
+from textblob.exceptions import FormatError, ModelError
 from textblob.tokenizers import WordTokenizer
+from textblob.utils import load_model
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 CSV_FILE = os.path.join(HERE, "data.csv")
 JSON_FILE = os.path.join(HERE, "data.json")
+JSONL_FILE = os.path.join(HERE, "data.jsonl")
 TSV_FILE = os.path.join(HERE, "data.tsv")
 
 train_set = [
@@ -211,6 +218,507 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         )
 
 
+class TestClassifyMany(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.texts = [text.split() for text, _ in test_set]
+        self.classifier = NaiveBayesClassifier(self.train_set)
+
+    def test_classify_many(self):
+        expected = [self.classifier.classify(text) for text in self.texts]
+        assert self.classifier.classify_many(self.texts) == expected
+        assert self.classifier.classify_many(iter(self.texts)) == expected
+        assert self.classifier.classify_many([]) == []
+
+    def test_prob_classify_many(self):
+        probs = self.classifier.prob_classify_many(self.texts)
+        for text, prob_dist in zip(self.texts, probs):
+            expected = self.classifier.prob_classify(text)
+            assert prob_dist.prob("positive") == expected.prob("positive")
+
+    def test_classify_many_in_worker_processes(self):
+        self.classifier.batch_size = 2
+        expected = [self.classifier.classify(text) for text in self.texts]
+        assert self.classifier.classify_many(self.texts, n_jobs=2) == expected
+        probs = self.classifier.prob_classify_many(self.texts, n_jobs=2)
+        assert [p.max() for p in probs] == expected
+
+    def test_worker_copy_has_no_training_data(self):
+        expected = self.classifier.classify_many(self.texts)
+        worker_copy = self.classifier._worker_copy()
+        assert worker_copy.train_set is None
+        assert worker_copy._counts is None
+        assert worker_copy.classify_many(self.texts) == expected
+        assert self.classifier.train_set == self.train_set
+        assert "classifier" not in self.classifier._worker_copy(model=False).__dict__
+
+    @pytest.mark.numpy
+    def test_numpy_classify_many_in_worker_processes(self):
+        classifier = NumpyNaiveBayesClassifier(self.train_set)
+        classifier.batch_size = 2
+        expected = classifier.classify_many(self.texts)
+        assert classifier.classify_many(self.texts, n_jobs=2) == expected
+
+    def test_decision_tree_classify_many(self):
+        classifier = DecisionTreeClassifier(self.train_set)
+        expected = [classifier.classify(text) for text in self.texts]
+        assert classifier.classify_many(self.texts) == expected
+
+
+class TestSparseNaiveBayesClassifier(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.test_set = [(text.split(), label) for text, label in test_set]
+        self.dense = NaiveBayesClassifier(self.train_set)
+        self.classifier = NaiveBayesClassifier(list(self.train_set), sparse=True)
+
+    def test_extract_features(self):
+        features = self.classifier.extract_features(["I", "love", "cats"])
+        assert features == {"contains(I)": True, "contains(love)": True}
+
+    def test_baseline_does_not_depend_on_feature_order(self):
+        classifier = self.classifier.classifier
+        feature_probdist = dict(reversed(classifier._feature_probdist.items()))
+        reordered = _SparseNaiveBayesClassifier(
+            classifier._label_probdist, feature_probdist
+        )
+        assert reordered._baseline == classifier._baseline
+
+    def test_matches_dense_classifier(self):
+        for text, _ in self.test_set:
+            dense = self.dense.prob_classify(text)
+            sparse = self.classifier.prob_classify(text)
+            assert sparse.max() == dense.max()
+            for label in ("positive", "negative"):
+                assert sparse.prob(label) == pytest.approx(dense.prob(label))
+        assert self.classifier.accuracy(self.test_set) == self.dense.accuracy(
+            self.test_set
+        )
+        assert self.classifier.informative_features(5) == (
+            self.dense.informative_features(5)
+        )
+
+    def test_update(self):
+        new_data = [("The car is horrible".split(), "negative")]
+        self.classifier.update(list(new_data))
+        dense = NaiveBayesClassifier(self.train_set + new_data)
+        text = "the car".split()
+        assert self.classifier.prob_classify(text).prob("negative") == (
+            pytest.approx(dense.prob_classify(text).prob("negative"))
+        )
+
+    def test_requires_basic_extractor(self):
+        with pytest.raises(ValueError):
+            NaiveBayesClassifier(self.train_set, contains_extractor, sparse=True)
+
+
+class TestNaiveBayesClassifierUpdate(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.new_data = [
+            ("The car is horrible".split(), "negative"),
+            ("What a car !".split(), "positive"),
+        ]
+        self.texts = [text.split() for text, _ in test_set] + [["car", "!"]]
+
+    def assert_same_model(self, updated, retrained):
+        for text in self.texts:
+            for label in ("positive", "negative"):
+                assert updated.prob_classify(text).prob(label) == pytest.approx(
+                    retrained.prob_classify(text).prob(label)
+                )
+
+    def test_update(self):
+        for kwargs in ({}, {"sparse": True}):
+            classifier = NaiveBayesClassifier(list(self.train_set), **kwargs)
+            classifier.train()
+            with mock.patch.object(
+                classifier, "extract_features", wraps=classifier.extract_features
+            ) as extract_features:
+                classifier.update(list(self.new_data))
+            retrained = NaiveBayesClassifier(self.train_set + self.new_data, **kwargs)
+            self.assert_same_model(classifier, retrained)
+            assert len(classifier.train_features) == len(retrained.train_set)
+            # Only the new data is extracted.
+            assert extract_features.call_count <= len(self.new_data)
+
+    def test_update_counts_new_words_in_trained_documents(self):
+        # The token "hello" of "hello!" is not a word of the training set
+        # until it is updated.
+        train_set = [(["hello!"], "positive"), (["bye"], "negative")]
+        new_data = [(["hello"], "negative")]
+        classifier = NaiveBayesClassifier(list(train_set))
+        classifier.update(list(new_data))
+        retrained = NaiveBayesClassifier(train_set + new_data)
+        text = ["hello"]
+        assert classifier.prob_classify(text).prob("positive") == pytest.approx(
+            retrained.prob_classify(text).prob("positive")
+        )
+
+    def test_update_then_train(self):
+        for kwargs in ({}, {"sparse": True}):
+            classifier = NaiveBayesClassifier(list(self.train_set), **kwargs)
+            classifier.train()
+            classifier.update(list(self.new_data))
+            classifier.train()
+            retrained = NaiveBayesClassifier(self.train_set + self.new_data, **kwargs)
+            self.assert_same_model(classifier, retrained)
+            assert classifier.train_features == retrained.train_features
+
+    def test_update_then_cross_validate(self):
+        train_set = [
+            (["c", "b"], "n"),
+            (["a", "e"], "p"),
+            (["c", "a"], "p"),
+            (["a", "e"], "n"),
+            (["d", "a"], "p"),
+            (["a", "d"], "p"),
+        ]
+        new_data = [(["b", "h", "f"], "p"), (["g", "a", "b"], "p")]
+        classifier = NaiveBayesClassifier(list(train_set))
+        classifier.train()
+        classifier.update(list(new_data))
+        retrained = NaiveBayesClassifier(train_set + new_data)
+        assert classifier.cross_validate(k=4) == retrained.cross_validate(k=4)
+
+    def test_update_with_extractor_using_train_set(self):
+        def extractor(document, train_set):
+            return {"known": sum(w in train_set for w in document)}
+
+        classifier = NaiveBayesClassifier(list(self.train_set), extractor)
+        classifier.train()
+        classifier.update(list(self.new_data))
+        retrained = NaiveBayesClassifier(self.train_set + self.new_data, extractor)
+        self.assert_same_model(classifier, retrained)
+
+
+def first_word_extractor(document):
+    return {"first": document.split()[0]}
+
+
+class TestStreamingNaiveBayesClassifier(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.test_set = [(text.split(), label) for text, label in test_set]
+
+    def assert_same_probs(self, classifier, reference):
+        for text, _ in self.test_set:
+            expected = reference.prob_classify(text).prob("positive")
+            probs = classifier.prob_classify(text)
+            assert probs.prob("positive") == pytest.approx(expected)
+
+    def test_stream(self):
+        for sparse in (False, True):
+            reference = NaiveBayesClassifier(list(self.train_set), sparse=sparse)
+            classifier = NaiveBayesClassifier(
+                iter(self.train_set), sparse=sparse, stream=True
+            )
+            assert classifier.train_set is None
+            assert classifier.train_features is None
+            assert classifier._word_set == reference._word_set
+            self.assert_same_probs(classifier, reference)
+            assert repr(classifier) == repr(reference)
+
+    def test_stream_update(self):
+        new_data = [(["car", "horrible"], "negative"), (["I", "love"], "positive")]
+        reference = NaiveBayesClassifier(list(self.train_set))
+        reference.update(list(new_data))
+        classifier = NaiveBayesClassifier(iter(self.train_set), stream=True)
+        classifier.classify(["car"])
+        classifier.update(iter(new_data))
+        self.assert_same_probs(classifier, reference)
+
+    def test_stream_from_file(self):
+        with open(CSV_FILE) as fp:
+            records = formats.CSV(fp).to_iterable()
+        reference = nltk.classify.NaiveBayesClassifier.train(
+            [(first_word_extractor(text), label) for text, label in records]
+        )
+        with open(CSV_FILE) as fp:
+            classifier = NaiveBayesClassifier(fp, first_word_extractor, stream=True)
+        for text in ("I love this car", "This car is horrible"):
+            features = first_word_extractor(text)
+            assert classifier.prob_classify(text).prob("pos") == pytest.approx(
+                reference.prob_classify(features).prob("pos")
+            )
+        with open(CSV_FILE) as fp:
+            accuracy = classifier.accuracy(fp)
+        expected = nltk.classify.accuracy(
+            reference, [(first_word_extractor(text), label) for text, label in records]
+        )
+        assert accuracy == pytest.approx(expected)
+
+    def test_stream_from_jsonl_file(self):
+        with open(CSV_FILE) as fp:
+            expected = NaiveBayesClassifier(fp, first_word_extractor, stream=True)
+        with open(JSONL_FILE) as fp:
+            classifier = NaiveBayesClassifier(fp, first_word_extractor, stream=True)
+        text = "I love this car"
+        assert classifier.prob_classify(text).prob("pos") == pytest.approx(
+            expected.prob_classify(text).prob("pos")
+        )
+        with open(CSV_FILE) as fp:
+            accuracy = expected.accuracy(fp)
+        with open(JSONL_FILE) as fp:
+            assert classifier.accuracy(fp, format="jsonl") == accuracy
+
+    def test_custom_format_without_lazy_mode(self):
+        class PipeFormat(formats.BaseFormat):
+            def __init__(self, fp, delimiter="|"):
+                self.rows = [line.strip().split(delimiter) for line in fp]
+
+            @classmethod
+            def detect(cls, stream):
+                return False
+
+            def to_iterable(self):
+                return [tuple(row) for row in self.rows]
+
+        formats.register("pipe", PipeFormat)
+        self.addCleanup(formats.get_registry().pop, "pipe")
+        data = "I love this car|pos\nThis car is horrible|neg\n"
+        classifier = NaiveBayesClassifier(
+            io.StringIO(data), first_word_extractor, format="pipe", stream=True
+        )
+        assert classifier.classify("I like it") == "pos"
+        assert classifier.accuracy(io.StringIO(data), format="pipe") == 1.0
+
+    def test_stream_requires_extractor_without_train_set(self):
+        with pytest.raises(ValueError):
+            NaiveBayesClassifier(
+                self.train_set, lambda document, train_set: {}, stream=True
+            )
+
+    def test_positive_naive_bayes_stream(self):
+        positive = [["The", "team", "won"], ["They", "lost", "the", "ball"]]
+        unlabeled = [["The", "President", "did", "not", "comment"], ["I", "lost"]]
+        reference = PositiveNaiveBayesClassifier(list(positive), list(unlabeled))
+        classifier = PositiveNaiveBayesClassifier(
+            iter(positive), iter(unlabeled), stream=True
+        )
+        assert classifier.positive_set is None
+        assert repr(classifier) == repr(reference)
+        features = contains_extractor(["My", "team", "lost"])
+        assert classifier.classifier.prob_classify(features).prob(True) == (
+            reference.classifier.prob_classify(features).prob(True)
+        )
+
+
+@pytest.mark.numpy
+class TestNumpyNaiveBayesClassifier(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.test_set = [(text.split(), label) for text, label in test_set]
+        self.reference = NaiveBayesClassifier(self.train_set)
+        self.classifier = NumpyNaiveBayesClassifier(self.train_set)
+
+    def test_prob_classify_many(self):
+        texts = [text for text, _ in self.test_set]
+        for dense, vectorized in zip(
+            [self.reference.prob_classify(text) for text in texts],
+            self.classifier.prob_classify_many(texts),
+        ):
+            for label in ("positive", "negative"):
+                assert vectorized.prob(label) == pytest.approx(dense.prob(label))
+
+    def test_classify_many(self):
+        texts = [text for text, _ in self.test_set]
+        expected = [self.reference.classify(text) for text in texts]
+        assert self.classifier.classify_many(texts) == expected
+        assert self.classifier.classify(texts[0]) == expected[0]
+        assert self.classifier.classify_many([]) == []
+
+    def test_accuracy(self):
+        accuracy = self.reference.accuracy(self.test_set)
+        assert self.classifier.accuracy(self.test_set) == pytest.approx(accuracy)
+
+    def test_sparse(self):
+        classifier = NumpyNaiveBayesClassifier(self.train_set, sparse=True)
+        text = self.test_set[0][0]
+        assert classifier.prob_classify(text).prob("positive") == pytest.approx(
+            self.reference.prob_classify(text).prob("positive")
+        )
+
+    def test_unseen_feature_values(self):
+        def extractor(document):
+            return {"first": document[0], "length": len(document)}
+
+        reference = NaiveBayesClassifier(self.train_set, extractor)
+        classifier = NumpyNaiveBayesClassifier(self.train_set, extractor)
+        for text in (["I", "am"], ["Unseen", "first", "word"]):
+            assert classifier.prob_classify(text).prob("positive") == (
+                pytest.approx(reference.prob_classify(text).prob("positive"))
+            )
+
+    def test_update(self):
+        self.classifier.classify_many([["car"]])
+        self.classifier.update([(["car"], "negative"), (["car"], "negative")])
+        assert self.classifier.classify_many([["car"]]) == ["negative"]
+
+
+class TestCrossValidate(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.classifier = NaiveBayesClassifier(self.train_set)
+
+    def test_cross_validate(self):
+        result = self.classifier.cross_validate(k=5)
+        confusion = Counter()
+        for fold in range(5):
+            classifier = nltk.classify.NaiveBayesClassifier.train(
+                [
+                    labeled
+                    for i, labeled in enumerate(self.classifier.train_features)
+                    if i % 5 != fold
+                ]
+            )
+            for features, label in self.classifier.train_features[fold::5]:
+                confusion[label, classifier.classify(features)] += 1
+        assert result.confusion == confusion
+        assert sum(confusion.values()) == len(self.train_set)
+        correct = confusion["positive", "positive"] + confusion["negative", "negative"]
+        assert result.accuracy == correct / len(self.train_set)
+        assert len(result.folds) == 5
+        predicted = Counter()
+        for (_, predicted_label), n in confusion.items():
+            predicted[predicted_label] += n
+        actual = Counter(label for _, label in self.train_set)
+        for label in ("positive", "negative"):
+            correct = confusion[label, label]
+            precision = correct / predicted[label] if predicted[label] else 0.0
+            assert result.precision[label] == precision
+            assert result.recall[label] == correct / actual[label]
+
+    def test_cross_validate_in_worker_processes(self):
+        assert self.classifier.cross_validate(k=5, n_jobs=2) == (
+            self.classifier.cross_validate(k=5)
+        )
+
+    def test_cross_validate_sparse(self):
+        classifier = NaiveBayesClassifier(self.train_set, sparse=True)
+        result = classifier.cross_validate(k=5)
+        confusion = Counter()
+        for fold in range(5):
+            sparse = classifier._train_fold(
+                [
+                    labeled
+                    for i, labeled in enumerate(classifier.train_features)
+                    if i % 5 != fold
+                ]
+            )
+            dense = self.classifier._train_fold(
+                [
+                    labeled
+                    for i, labeled in enumerate(self.classifier.train_features)
+                    if i % 5 != fold
+                ]
+            )
+            for (features, label), (dense_features, _) in zip(
+                classifier.train_features[fold::5],
+                self.classifier.train_features[fold::5],
+            ):
+                confusion[label, sparse.classify(features)] += 1
+                # The labels of ties may differ, due to rounding.
+                assert sparse.prob_classify(features).prob("positive") == (
+                    pytest.approx(dense.prob_classify(dense_features).prob("positive"))
+                )
+        assert result.confusion == confusion
+
+    def test_cross_validate_decision_tree(self):
+        result = DecisionTreeClassifier(self.train_set).cross_validate(k=2)
+        assert 0 <= result.accuracy <= 1
+
+    def test_cross_validate_invalid_k(self):
+        with pytest.raises(ValueError):
+            self.classifier.cross_validate(k=1)
+        with pytest.raises(ValueError):
+            self.classifier.cross_validate(k=len(self.train_set) + 1)
+
+
+class TestSaveAndLoad(unittest.TestCase):
+    def setUp(self):
+        self.train_set = [(text.split(), label) for text, label in train_set]
+        self.texts = [text.split() for text, _ in test_set] + [["unknown"]]
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "model.pickle")
+
+    def assert_same_probs(self, loaded, classifier, labels=("positive",)):
+        for text in self.texts:
+            expected = classifier.prob_classify(text)
+            prob_dist = loaded.prob_classify(text)
+            for label in labels:
+                assert prob_dist.prob(label) == pytest.approx(expected.prob(label))
+
+    def test_naive_bayes(self):
+        for sparse in (False, True):
+            classifier = NaiveBayesClassifier(self.train_set, sparse=sparse)
+            classifier.save(self.path)
+            loaded = NaiveBayesClassifier.load(self.path)
+            assert loaded.sparse == sparse
+            assert loaded.train_set == []
+            assert loaded._word_set == classifier._word_set
+            assert loaded.labels() == classifier.labels()
+            self.assert_same_probs(loaded, classifier)
+            assert loaded.informative_features(5) == (
+                classifier.informative_features(5)
+            )
+
+    def test_saves_only_the_model(self):
+        NaiveBayesClassifier(self.train_set).save(self.path)
+        model = load_model(self.path, "NaiveBayesClassifier", 1)
+        assert set(model) == {"params", "word_set", "classifier"}
+        assert set(model["classifier"]) == {"labels", "label_logprobs", "features"}
+
+    @pytest.mark.numpy
+    def test_numpy_naive_bayes(self):
+        classifier = NumpyNaiveBayesClassifier(self.train_set)
+        classifier.save(self.path)
+        loaded = NumpyNaiveBayesClassifier.load(self.path)
+        assert loaded.classify_many(self.texts) == classifier.classify_many(self.texts)
+
+    def test_decision_tree(self):
+        classifier = DecisionTreeClassifier(self.train_set)
+        classifier.save(self.path)
+        loaded = DecisionTreeClassifier.load(self.path)
+        assert [loaded.classify(text) for text in self.texts] == [
+            classifier.classify(text) for text in self.texts
+        ]
+
+    def test_positive_naive_bayes(self):
+        positive = [["The", "team", "won"], ["They", "lost", "the", "ball"]]
+        unlabeled = [["The", "President", "did", "not", "comment"], ["I", "lost"]]
+        classifier = PositiveNaiveBayesClassifier(
+            positive, unlabeled, positive_prob_prior=0.3
+        )
+        classifier.save(self.path)
+        loaded = PositiveNaiveBayesClassifier.load(self.path)
+        assert loaded.positive_prob_prior == 0.3
+        features = contains_extractor(["My", "team", "lost"])
+        assert loaded.classifier.prob_classify(features).prob(True) == (
+            pytest.approx(classifier.classifier.prob_classify(features).prob(True))
+        )
+
+    def test_update_loaded_model(self):
+        NaiveBayesClassifier(self.train_set).save(self.path)
+        loaded = NaiveBayesClassifier.load(self.path)
+        with pytest.raises(ValueError, match="load()"):
+            loaded.update([(["What", "a", "car"], "positive")])
+        DecisionTreeClassifier(self.train_set).save(self.path)
+        loaded = DecisionTreeClassifier.load(self.path)
+        with pytest.raises(ValueError, match="load()"):
+            loaded.update([(["What", "a", "car"], "positive")])
+        PositiveNaiveBayesClassifier([["The", "team"]], [["I", "lost"]]).save(self.path)
+        loaded = PositiveNaiveBayesClassifier.load(self.path)
+        with pytest.raises(ValueError, match="load()"):
+            loaded.update(new_positive_data=[["They", "won"]])
+
+    def test_load_rejects_other_models(self):
+        DecisionTreeClassifier(self.train_set).save(self.path)
+        with pytest.raises(ModelError):
+            NaiveBayesClassifier.load(self.path)
+
+
 class TestDecisionTreeClassifier(unittest.TestCase):
     def setUp(self):
         self.classifier = DecisionTreeClassifier(train_set)
@@ -332,6 +840,29 @@ class TestPositiveNaiveBayesClassifier(unittest.TestCase):
         )
 
 
+def test_positive_naive_bayes_update_only_counts_new_data():
+    def extractor(document):
+        return dict((f"contains({w})", True) for w in document.split())
+
+    positive = ["The team won the game", "They lost the ball"]
+    unlabeled = ["The President did not comment", "The ball went off the court"]
+    classifier = PositiveNaiveBayesClassifier(
+        list(positive), list(unlabeled), feature_extractor=extractor
+    )
+    classifier.train()
+    classifier.update(["The game was intense"], ["I lost the keys"], 0.4)
+    retrained = nltk.classify.PositiveNaiveBayesClassifier.train(
+        [extractor(d) for d in positive + ["The game was intense"]],
+        [extractor(d) for d in unlabeled + ["I lost the keys"]],
+        0.4,
+    )
+    for text in ("My team lost the game", "The keys are lost"):
+        features = extractor(text)
+        assert classifier.classifier.prob_classify(features).prob(True) == (
+            pytest.approx(retrained.prob_classify(features).prob(True))
+        )
+
+
 def test_basic_extractor():
     text = "I feel happy this morning."
     feats = basic_extractor(text, train_set)
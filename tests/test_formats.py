@@ -1,11 +1,16 @@
+import io
+import json
 import os
 import unittest
 
+import pytest
+
 from textblob import formats
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 CSV_FILE = os.path.join(HERE, "data.csv")
 JSON_FILE = os.path.join(HERE, "data.json")
+JSONL_FILE = os.path.join(HERE, "data.jsonl")
 TSV_FILE = os.path.join(HERE, "data.tsv")
 
 
@@ -23,10 +28,64 @@ class TestFormats(unittest.TestCase):
             format = formats.detect(fp)
         assert format == formats.JSON
 
+    def test_detect_jsonl(self):
+        with open(JSONL_FILE) as fp:
+            format = formats.detect(fp)
+            assert fp.tell() == 0
+        assert format == formats.JSONL
+
+    def test_detect_jsonl_with_long_first_line(self):
+        line = json.dumps({"text": "a" * 2000, "label": "pos"})
+        fp = io.StringIO(line + "\n" + line + "\n")
+        assert formats.detect(fp) == formats.JSONL
+        assert fp.tell() == 0
+
+    def test_detect_reads_at_most_max_line_of_a_long_line(self):
+        class CountingIO(io.StringIO):
+            num_read = 0
+
+            def read(self, size=-1):
+                data = super().read(size)
+                self.num_read += len(data)
+                return data
+
+            def readline(self, size=-1):
+                data = super().readline(size)
+                self.num_read += len(data)
+                return data
+
+        # Minified JSON on a single line
+        data = json.dumps([{"text": "a" * 100, "label": "pos"}] * 100)
+        fp = CountingIO(data)
+        format = formats.detect(fp, max_read=1024, max_line=1024)
+        assert format not in (formats.JSON, formats.JSONL)
+        assert fp.num_read <= 2048
+        assert fp.tell() == 0
+        # A JSON Lines file with a truncated first line is not detected.
+        line = json.dumps({"text": "a" * 3000, "label": "pos"})
+        fp = io.StringIO(line + "\n" + line + "\n")
+        assert formats.detect(fp, max_line=1024) != formats.JSONL
+        fp.seek(0)
+        assert formats.detect(fp, max_line=4096) == formats.JSONL
+
+    def test_detect_file_without_readline(self):
+        class ReadOnlyIO:
+            def __init__(self, data):
+                self._fp = io.StringIO(data)
+                self.read = self._fp.read
+                self.seek = self._fp.seek
+
+        with open(CSV_FILE) as fp:
+            data = fp.read()
+        assert formats.detect(ReadOnlyIO(data)) == formats.CSV
+        line = json.dumps({"text": "a", "label": "pos"})
+        assert formats.detect(ReadOnlyIO(line + "\n" + line)) == formats.JSONL
+
     def test_available(self):
         registry = formats.get_registry()
         assert "csv" in registry.keys()
         assert "json" in registry.keys()
+        assert "jsonl" in registry.keys()
         assert "tsv" in registry.keys()
 
 
@@ -94,6 +153,71 @@ class TestJSON(unittest.TestCase):
         assert isinstance(text, str)
 
 
+class TestJSONL(unittest.TestCase):
+    def test_to_iterable(self):
+        with open(JSON_FILE) as fp:
+            expected = formats.JSON(fp).to_iterable()
+        with open(JSONL_FILE) as fp:
+            assert formats.JSONL(fp).to_iterable() == expected
+
+    def test_iter_records(self):
+        with open(JSON_FILE) as fp:
+            expected = formats.JSON(fp).to_iterable()
+        for use_mmap in (True, False):
+            with open(JSONL_FILE) as fp:
+                records = formats.JSONL(fp, lazy=True, use_mmap=use_mmap)
+                assert "data" not in records.__dict__
+                assert list(records.iter_records()) == expected
+
+    def test_iter_records_from_stream(self):
+        fp = io.StringIO('{"body": "Good", "y": 1}\n\n{"body": "Bad", "y": 0}\n')
+        records = formats.JSONL(fp, text_key="body", label_key="y", lazy=True)
+        assert list(records.iter_records()) == [("Good", 1), ("Bad", 0)]
+
+    def test_detect(self):
+        with open(JSONL_FILE) as fp:
+            assert formats.JSONL.detect(fp.read())
+        for path in (CSV_FILE, JSON_FILE, TSV_FILE):
+            with open(path) as fp:
+                assert not formats.JSONL.detect(fp.read())
+
+
+class TestLazyFormats(unittest.TestCase):
+    def test_iter_records(self):
+        for Format, path in (
+            (formats.CSV, CSV_FILE),
+            (formats.TSV, TSV_FILE),
+            (formats.JSON, JSON_FILE),
+        ):
+            with open(path) as fp:
+                records = list(Format(fp).to_iterable())
+            with open(path) as fp:
+                assert list(Format(fp).iter_records()) == records
+            with open(path) as fp:
+                lazy = Format(fp, lazy=True)
+                assert list(map(tuple, lazy.iter_records())) == list(
+                    map(tuple, records)
+                )
+
+    def test_lazy_data(self):
+        with open(CSV_FILE) as fp:
+            expected = formats.CSV(fp).data
+            fp.seek(0)
+            lazy = formats.CSV(fp, lazy=True)
+            assert "data" not in lazy.__dict__
+            assert lazy.to_iterable() == expected
+
+    def test_iter_json_array(self):
+        text = '[{"text": "a, [b]", "label": 1.5e3}, -12345, [], {}, null ]'
+        for chunk_size in (1, 2, 3, 7, 1024):
+            items = list(formats._iter_json_array(io.StringIO(text), chunk_size))
+            assert items == [{"text": "a, [b]", "label": 1500.0}, -12345, [], {}, None]
+        assert list(formats._iter_json_array(io.StringIO(" [ ] "), 1)) == []
+        for text in ("", "{}", "[1,", "[1 2]", "[1,]", "[tru]"):
+            with pytest.raises(json.JSONDecodeError):
+                list(formats._iter_json_array(io.StringIO(text), 2))
+
+
 class CustomFormat(formats.BaseFormat):
     def to_iterable():
         return [("I like turtles", "pos"), ("I hate turtles", "neg")]
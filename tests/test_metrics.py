@@ -0,0 +1,109 @@
+import json
+import unittest
+
+import pytest
+
+from textblob import metrics
+from textblob._text import Spelling
+from textblob.classifiers import NaiveBayesClassifier
+from textblob.en.parsers import PatternParser
+from textblob.en.sentiments import PatternAnalyzer
+from textblob.en.taggers import PatternTagger
+
+
+@metrics.timed("test", tokens=metrics.count_result)
+def split(text):
+    if not text:
+        raise ValueError("empty text")
+    return text.split()
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled(self):
+        metrics.disable()
+        assert not metrics.is_enabled()
+        assert split("a b") == ["a", "b"]
+        assert metrics.snapshot() == {}
+
+    def test_timed_function(self):
+        split("a b c")
+        split("d")
+        stats = metrics.snapshot()["test.split"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 0
+        assert stats["tokens"] == 4
+        assert 0 < stats["min_seconds"] <= stats["max_seconds"]
+        assert stats["min_seconds"] + stats["max_seconds"] == pytest.approx(
+            stats["total_seconds"]
+        )
+        assert sum(stats["histogram"].values()) == 2
+        assert list(stats["histogram"])[-1] == "+Inf"
+
+    def test_timed_error(self):
+        with pytest.raises(ValueError):
+            split("")
+        stats = metrics.snapshot()["test.split"]
+        assert (stats["calls"], stats["errors"], stats["tokens"]) == (1, 1, 0)
+
+    def test_record(self):
+        metrics.record("custom", 0.5, tokens=3)
+        metrics.record("custom", 20.0)
+        stats = metrics.snapshot()["custom"]
+        assert (stats["calls"], stats["tokens"]) == (2, 3)
+        assert (stats["min_seconds"], stats["max_seconds"]) == (0.5, 20.0)
+        assert stats["histogram"]["1.0"] == 1
+        assert stats["histogram"]["+Inf"] == 1
+
+    def test_disable_keeps_metrics_and_reset_clears_them(self):
+        split("a")
+        metrics.disable()
+        split("a")
+        assert metrics.snapshot()["test.split"]["calls"] == 1
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_stages(self):
+        text = "Simple is better than complex."
+        PatternTagger().tag(text)
+        PatternAnalyzer().analyze(text)
+        PatternParser().parse(text)
+        snapshot = metrics.snapshot()
+        assert snapshot["tagger.PatternTagger.tag"]["tokens"] == 6
+        assert snapshot["analyzer.PatternAnalyzer.analyze"]["tokens"] == 5
+        assert snapshot["parser.PatternParser.parse"]["tokens"] == 5
+        # The snapshot can be serialized
+        assert json.loads(json.dumps(snapshot)) == snapshot
+
+    def test_lazydict_load(self):
+        spelling = Spelling(path="the 100\nthen 20")
+        assert "the" in spelling
+        assert "then" in spelling
+        assert metrics.snapshot()["lazydict.Spelling.load"]["calls"] == 1
+
+    def test_classifier(self):
+        train = [("good great".split(), "pos"), ("bad awful".split(), "neg")]
+        classifier = NaiveBayesClassifier(train)
+        classifier.classify("good day".split())
+        classifier.classify_many(["bad day".split()])
+        snapshot = metrics.snapshot()
+        assert snapshot["classifier.NaiveBayesClassifier.train"]["calls"] == 1
+        stats = snapshot["classifier.NaiveBayesClassifier.classify"]
+        assert (stats["calls"], stats["tokens"]) == (1, 2)
+        assert snapshot["classifier.NaiveBayesClassifier.classify_many"]["calls"] == 1
+
+    def test_count_words(self):
+        assert metrics.count_words(None, "a b  c") == 3
+        assert metrics.count_words(None, ["a", "b"]) == 2
+        assert metrics.count_words(None, None) == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,17 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import nltk
 import pytest
 
+from textblob import TextBlob
 from textblob.base import BaseNPExtractor
-from textblob.np_extractors import ConllExtractor
-from textblob.utils import filter_insignificant
+from textblob.en.np_extractors import ChunkParser
+from textblob.exceptions import ModelError
+from textblob.np_extractors import ConllExtractor, FastNPExtractor
+from textblob.utils import filter_insignificant, save_model
 
 
 class TestConllExtractor(unittest.TestCase):
@@ -29,6 +35,11 @@ constructs intended to enable clear programs on both a small and large scale.
         assert "design philosophy" in noun_phrases
         assert "code readability" in noun_phrases
 
+    @pytest.mark.slow
+    def test_extract_from_blob(self):
+        blob = TextBlob(self.text)
+        assert self.extractor.extract(blob) == self.extractor.extract(self.text)
+
     @pytest.mark.slow
     def test_parse_sentence(self):
         parsed = self.extractor._parse_sentence(self.sentence)
@@ -44,6 +55,106 @@ constructs intended to enable clear programs on both a small and large scale.
         assert "DT" not in tags
 
 
+class TestChunkParser(unittest.TestCase):
+    MODEL = {
+        "unigram": {"DT": "B-NP", "JJ": "I-NP", "NN": "I-NP", "VBD": "O"},
+        "bigram": {(("O",), "JJ"): "B-NP"},
+    }
+
+    def setUp(self):
+        self.sentence = [("the", "DT"), ("cat", "NN"), ("was", "VBD"), ("big", "JJ")]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "model.pickle")
+        parser = ChunkParser()
+        parser._set_model(self.MODEL)
+        parser.save(self.path)
+
+    def test_load(self):
+        parsed = ChunkParser.load(self.path).parse(self.sentence)
+        assert [
+            subtree.leaves()
+            for subtree in parsed
+            if isinstance(subtree, nltk.tree.Tree)
+        ] == [[("the", "DT"), ("cat", "NN")], [("big", "JJ")]]
+
+    def test_conll_extractor_with_model(self):
+        extractor = ConllExtractor(model=self.path)
+        assert extractor.parser._trained
+        assert extractor.parser.tagger.tag(["DT"]) == [("DT", "B-NP")]
+
+    def test_trained_model_is_cached(self):
+        with mock.patch.dict(os.environ, {"TEXTBLOB_CACHE_DIR": self.tmpdir.name}):
+            with mock.patch.object(
+                ChunkParser, "_train_model", return_value=self.MODEL
+            ) as train_model:
+                ChunkParser().train()
+                parser = ChunkParser()
+                parser.train()
+        assert train_model.call_count == 1
+        assert parser.tagger.tag(["NN"]) == [("NN", "I-NP")]
+
+
+class TestFastNPExtractor(unittest.TestCase):
+    MODEL = {
+        "unigram": {"Python": "NP", "high-level": "JJ"},
+        "bigram": {(("JJ",), "language"): "NN"},
+    }
+
+    def setUp(self):
+        self.extractor = FastNPExtractor()
+        self.text = "Python is a widely used general-purpose, high-level language."
+        self.tokens = ["Python", "is", "a", "high-level", "language", "."]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    @pytest.mark.slow
+    def test_extract_from_blob(self):
+        blob = TextBlob(self.text)
+        assert self.extractor.extract(blob) == self.extractor.extract(self.text)
+
+    @pytest.mark.slow
+    def test_save_and_load_trained_model(self):
+        path = os.path.join(self.tmpdir.name, "model.pickle")
+        self.extractor.save(path)
+        loaded = FastNPExtractor.load(path)
+        assert loaded.extract(self.text) == self.extractor.extract(self.text)
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmpdir.name, "model.pickle")
+        self.extractor._set_model(self.MODEL)
+        self.extractor.save(path)
+        loaded = FastNPExtractor.load(path)
+        assert loaded.tagger.tag(self.tokens) == [
+            ("Python", "NP"),
+            ("is", "NNS"),
+            ("a", "AT"),
+            ("high-level", "JJ"),
+            ("language", "NN"),
+            (".", "NN"),
+        ]
+
+    def test_load_rejects_other_models(self):
+        path = os.path.join(self.tmpdir.name, "model.pickle")
+        save_model(path, "ChunkParser", FastNPExtractor.MODEL_VERSION, {})
+        with pytest.raises(ModelError):
+            FastNPExtractor.load(path)
+        save_model(path, "FastNPExtractor", -1, self.MODEL)
+        with pytest.raises(ModelError):
+            FastNPExtractor.load(path)
+
+    def test_trained_model_is_cached(self):
+        with mock.patch.dict(os.environ, {"TEXTBLOB_CACHE_DIR": self.tmpdir.name}):
+            with mock.patch.object(
+                FastNPExtractor, "_train_model", return_value=self.MODEL
+            ) as train_model:
+                FastNPExtractor().train()
+                extractor = FastNPExtractor()
+                extractor.train()
+        assert train_model.call_count == 1
+        assert extractor.tagger.tag(["Python"]) == [("Python", "NP")]
+
+
 class BadExtractor(BaseNPExtractor):
     """An extractor without an extract method. How useless."""
 
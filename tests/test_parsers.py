@@ -12,6 +12,15 @@ class TestPatternParser(unittest.TestCase):
     def test_parse(self):
         assert self.parser.parse(self.text) == pattern_parse(self.text)
 
+    def test_annotate(self):
+        annotated = self.parser.annotate(self.text)
+        assert annotated == pattern_parse(self.text).split()
+        assert annotated[0][0] == ["And", "CC", "O", "O"]
+
+    def test_annotate_word_with_slash(self):
+        text = "Read it w/o delay."
+        assert self.parser.annotate(text) == pattern_parse(text).split()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,18 @@
+import os
+import pickle
+import tempfile
 import unittest
+from unittest import mock
 
+import nltk
 import pytest
 
+from textblob.classifiers import (
+    _dump_naive_bayes,
+    _naive_bayes_prob_classify,
+    _naive_bayes_table,
+)
+from textblob.en import sentiment as pattern_sentiment
 from textblob.sentiments import (
     CONTINUOUS,
     DISCRETE,
@@ -39,14 +50,75 @@ class TestPatternSentiment(unittest.TestCase):
         assert p1_result.polarity == p1_assessment[1]
         assert p1_result.subjectivity == p1_assessment[2]
 
+    def test_analyze_assessments_scores_text_once(self):
+        with mock.patch(
+            "textblob.en.sentiments.pattern_sentiment", wraps=pattern_sentiment
+        ) as mock_sentiment:
+            self.analyzer.analyze("I feel great this morning.", keep_assessments=True)
+        assert mock_sentiment.call_count == 1
+
+    def test_return_types_are_shared(self):
+        result1 = self.analyzer.analyze("I feel great this morning.")
+        result2 = self.analyzer.analyze("This is a terrible car.")
+        assert type(result1) is type(result2) is PatternAnalyzer.RETURN_TYPE
+        result3 = self.analyzer.analyze("Great.", keep_assessments=True)
+        assert repr(result3).startswith("Sentiment(")
+        assert pickle.loads(pickle.dumps(result3)) == result3
+
 
 class TestNaiveBayesAnalyzer(unittest.TestCase):
+    TRAIN_SET = [
+        ({"great": True, "fun": True}, "pos"),
+        ({"great": True, "plot": "thin"}, "pos"),
+        ({"awful": True, "plot": "thin"}, "neg"),
+        ({"awful": True, "fun": False}, "neg"),
+    ]
+
     def setUp(self):
         self.analyzer = NaiveBayesAnalyzer()
+        classifier = nltk.classify.NaiveBayesClassifier.train(self.TRAIN_SET)
+        self.model = _naive_bayes_table(_dump_naive_bayes(classifier))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
 
     def test_kind(self):
         assert self.analyzer.kind == DISCRETE
 
+    def test_compiled_model_matches_nltk(self):
+        classifier = nltk.classify.NaiveBayesClassifier.train(self.TRAIN_SET)
+        for featureset in [
+            {"great": True},
+            {"awful": True, "fun": True},
+            {"plot": "thick", "unseen": True},
+            {"fun": None},
+            {},
+        ]:
+            expected = classifier.prob_classify(featureset)
+            result = _naive_bayes_prob_classify(self.model, featureset)
+            assert result.max() == expected.max()
+            assert result.prob("pos") == expected.prob("pos")
+            assert result.prob("neg") == expected.prob("neg")
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmpdir.name, "model.pickle")
+        self.analyzer._model = self.model
+        self.analyzer._trained = True
+        self.analyzer.save(path)
+        loaded = NaiveBayesAnalyzer.load(path)
+        assert loaded._trained
+        assert loaded._model == self.model
+
+    def test_trained_model_is_cached(self):
+        with mock.patch.dict(os.environ, {"TEXTBLOB_CACHE_DIR": self.tmpdir.name}):
+            with mock.patch.object(
+                NaiveBayesAnalyzer, "_train_model", return_value=self.model
+            ) as train_model:
+                NaiveBayesAnalyzer().train()
+                NaiveBayesAnalyzer().train()
+                # Models with custom feature extractors are not cached.
+                NaiveBayesAnalyzer(feature_extractor=dict.fromkeys).train()
+        assert train_model.call_count == 2
+
     @pytest.mark.slow
     def test_analyze(self):
         p1 = "I feel great this morning."
@@ -0,0 +1,266 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from textblob import cache
+from textblob._text import (
+    Context,
+    Morphology,
+    Spelling,
+    find_chunks,
+    find_prepositions,
+    find_token_offsets,
+    find_tokens,
+)
+
+
+class TestContext(unittest.TestCase):
+    def setUp(self):
+        self.context = Context(
+            path="\n".join(
+                [
+                    "NN VB PREVTAG TO",
+                    "NN VBP PREVWD they",
+                    "* JJ SURROUNDTAG DT NN",
+                    "VB JJ PREVTAG TO",
+                    "NN NNS PREV1OR2OR3WD many",
+                ]
+            )
+        )
+
+    def test_apply(self):
+        tokens = [["to", "TO"], ["run", "NN"], ["they", "PRP"], ["run", "NN"]]
+        assert self.context.apply(tokens) == [
+            ["to", "TO"],
+            ["run", "VB"],
+            ["they", "PRP"],
+            ["run", "VBP"],
+        ]
+
+    def test_apply_uses_last_matching_rule(self):
+        tokens = [["the", "DT"], ["they", "NN"], ["cat", "NN"]]
+        assert self.context.apply(tokens)[1] == ["they", "JJ"]
+        tokens = [["they", "PRP"], ["run", "NN"], ["cat", "NN"]]
+        assert self.context.apply(tokens)[1] == ["run", "VBP"]
+
+    def test_apply_matches_original_tag(self):
+        # The VB => JJ rule does not apply to a token that was tagged NN => VB.
+        tokens = [["to", "TO"], ["run", "NN"], ["to", "TO"], ["run", "VB"]]
+        assert self.context.apply(tokens)[1] == ["run", "VB"]
+        assert self.context.apply(tokens)[3] == ["run", "JJ"]
+
+    def test_apply_after_insert(self):
+        tokens = [["the", "DT"], ["run", "NN"]]
+        assert self.context.apply([list(t) for t in tokens])[1] == ["run", "NN"]
+        self.context.insert(0, "NN", "VB", "curwd", "run")
+        assert self.context.apply([list(t) for t in tokens])[1] == ["run", "VB"]
+
+
+class TestMorphology(unittest.TestCase):
+    def setUp(self):
+        self.morphology = Morphology(
+            lexicon={"happy": "JJ", "walk": "VB"},
+            path="\n".join(
+                [
+                    "NN s fhassuf 1 NNS x",
+                    "ly hassuf 2 RB x",
+                    "NNS ness fhassuf 4 NN x",
+                    "ing deletesuf 3 VBG x",
+                    "un haspref 2 JJ x",
+                    "Mr. goodright NNP x",
+                ]
+            ),
+        )
+
+    def apply(self, word, tag="NN", previous=(None, None), next=(None, None)):
+        return self.morphology.apply([word, tag], previous, next)[1]
+
+    def test_apply(self):
+        assert self.apply("cats") == "NNS"
+        assert self.apply("cats", tag="VB") == "VB"
+        assert self.apply("quickly") == "RB"
+        assert self.apply("walking") == "VBG"
+        assert self.apply("running") == "NN"
+        assert self.apply("unkempt") == "JJ"
+        assert self.apply("Smith", previous=("Mr.", "NNP")) == "NNP"
+
+    def test_apply_in_rule_order(self):
+        # NN => NNS (-s), then NNS => NN (-ness).
+        assert self.apply("darkness") == "NN"
+        # -ly applies before un-.
+        assert self.apply("unhappily") == "JJ"
+
+    def test_apply_after_insert(self):
+        assert self.apply("clockwise") == "NN"
+        self.morphology.insert(0, "RB", "-wise")
+        assert self.apply("clockwise") == "RB"
+
+
+class TestChunker(unittest.TestCase):
+    def test_find_chunks(self):
+        tagged = [
+            ["The", "DT"],
+            ["nice", "JJ"],
+            ["fish", "NN"],
+            ["is", "VBZ"],
+            ["dead", "JJ"],
+            [".", "."],
+        ]
+        assert [chunk for _, _, chunk in find_chunks(tagged)] == [
+            "B-NP",
+            "I-NP",
+            "I-NP",
+            "B-VP",
+            "B-ADJP",
+            "O",
+        ]
+
+    def test_find_chunks_in_long_sentence(self):
+        tagged = [[str(i), tag] for i in range(1000) for tag in ("DT", "NN", "VBZ")]
+        chunks = [chunk for _, _, chunk in find_chunks(tagged)]
+        assert chunks == ["B-NP", "I-NP", "B-VP"] * 1000
+
+    def test_find_prepositions(self):
+        chunked = [
+            ["on", "IN", "B-PP"],
+            ["the", "DT", "B-NP"],
+            ["table", "NN", "I-NP"],
+            ["in", "IN", "B-PP"],
+            ["the", "DT", "B-NP"],
+            ["kitchen", "NN", "I-NP"],
+            ["is", "VBZ", "B-VP"],
+        ]
+        assert [token[-1] for token in find_prepositions(chunked)] == [
+            "B-PNP",
+            "I-PNP",
+            "I-PNP",
+            "B-PNP",
+            "I-PNP",
+            "I-PNP",
+            "O",
+        ]
+
+
+class TestTokenizer(unittest.TestCase):
+    text = 'Isn\'t it great?! Mr. Smith said "wait..."\n\nHeading\r\n\r\nBye :-) (!)'
+
+    def test_find_tokens(self):
+        assert find_tokens(self.text) == [
+            "Is n ' t it great ? !",
+            'Mr. Smith said " wait ...',
+            '"',
+            "Heading",
+            "Bye :-) (!)",
+        ]
+
+    def test_find_tokens_matches_general_code_path(self):
+        # A line break pattern other than the default disables the single scan.
+        for text in (self.text, "U.S. etc.... (e.g. 'quoted') n't\n\n\n;)", ""):
+            assert find_tokens(text) == find_tokens(text, linebreak=r"\n\n+")
+        assert find_tokens(self.text, punctuation=".,;:!?()") == find_tokens(
+            self.text, punctuation=".,;:!?()", linebreak=r"\n\n+"
+        )
+
+    def test_find_token_offsets(self):
+        sentences = find_token_offsets(self.text)
+        assert [s for s, _, _, _ in sentences] == find_tokens(self.text)
+        for s, start, end, tokens in sentences:
+            assert s == " ".join(t for t, _, _ in tokens)
+            assert (start, end) == (tokens[0][1], tokens[-1][2])
+        sentence, start, end, tokens = sentences[0]
+        assert (start, end) == (0, 16)
+        assert tokens[:5] == [
+            ("Is", 0, 2),
+            ("n", 2, 3),
+            ("'", 3, 4),
+            ("t", 4, 5),
+            ("it", 6, 8),
+        ]
+        for t, start, end in sentences[1][3]:
+            assert self.text[start:end] == t
+
+    def test_find_token_offsets_of_merged_tokens(self):
+        text = "Bye : ) ( ! )"
+        ((sentence, start, end, tokens),) = find_token_offsets(text)
+        assert sentence == "Bye :) (!)"
+        assert tokens == [("Bye", 0, 3), (":)", 4, 7), ("(!)", 8, 13)]
+
+
+class TestSpelling(unittest.TestCase):
+    def setUp(self):
+        path = "\n".join(["the 100", "then 20", "they 10", "hello 5", "spelling 1"])
+        self.spelling = Spelling(path=path)
+        self.indexed = Spelling(path=path, use_index=True)
+
+    def test_suggest_with_index(self):
+        for w in (
+            "the",
+            "teh",
+            "Teh",
+            "thn",
+            "helo",
+            "speling",
+            "spleling",
+            "xyz",
+            ".",
+        ):
+            assert self.indexed.suggest(w) == self.spelling.suggest(w)
+        assert self.indexed.suggest("teh") == [("the", 1.0)]
+        assert self.indexed.suggest("thy") == [("the", 100 / 110), ("they", 10 / 110)]
+        assert self.indexed.suggest("thenn") == [("then", 1.0)]
+        assert self.indexed.suggest("tehn") == [("then", 1.0)]
+
+    def test_index(self):
+        index = self.indexed.index()
+        assert index["the"] == "the then they"
+        assert index["hllo"] == "hello"
+
+    def test_index_requires_alpha_words(self):
+        spelling = Spelling(path="the 100\ndon't 10", use_index=True)
+        assert spelling.index() is None
+        assert spelling.suggest("do'nt") == [("don't", 1.0)]
+
+    def test_index_after_words_change(self):
+        assert self.indexed.suggest("hlep") == [("hlep", 0.0)]
+        self.indexed["help"] = 5
+        assert self.indexed.index()["hlp"] == "help"
+        assert self.indexed.suggest("hlep") == [("help", 1.0)]
+        del self.indexed["help"]
+        assert "hlp" not in self.indexed.index()
+        self.indexed.update({"help": 5})
+        assert self.indexed.suggest("hlep") == [("help", 1.0)]
+
+    def test_cached_index_is_not_used_after_words_change(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "spelling.txt")
+        with open(path, "w") as fp:
+            fp.write("the 100\nthen 20")
+        with mock.patch.dict(os.environ, {cache.ENV_VAR: tmpdir}):
+            assert "hlp" not in Spelling(path=path, use_index=True).index()
+            spelling = Spelling(path=path, use_index=True)
+            spelling["help"] = 5
+            assert spelling.index()["hlp"] == "help"
+            assert "hlp" not in Spelling(path=path, use_index=True).index()
+
+    def test_suggest_is_memoized(self):
+        assert self.spelling.suggest("teh") == [("the", 1.0)]
+        with mock.patch.object(self.spelling, "_edit1") as edit1:
+            assert self.spelling.suggest("teh") == [("the", 1.0)]
+            assert edit1.call_count == 0
+        info = self.spelling.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        # Suggestions are copied, so they can be changed.
+        self.spelling.suggest("teh").append(("tea", 0.0))
+        assert self.spelling.suggest("teh") == [("the", 1.0)]
+        self.spelling.cache_clear()
+        assert self.spelling.cache_info().currsize == 0
+
+    def test_suggest_cache_size(self):
+        spelling = Spelling(path="the 100", cache_size=2)
+        for w in ("teh", "hte", "thee", "teh"):
+            spelling.suggest(w)
+        info = spelling.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 4, 2)
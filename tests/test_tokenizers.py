@@ -1,11 +1,14 @@
 import unittest
+from unittest import mock
 
 import pytest
 
+from textblob import tokenizers
 from textblob.tokenizers import (
     SentenceTokenizer,
     WordTokenizer,
     sent_tokenize,
+    sent_word_tokenize,
     word_tokenize,
 )
 
@@ -53,6 +56,32 @@ class TestWordTokenizer(unittest.TestCase):
         assert is_generator(tokens)
         assert list(tokens) == self.tokenizer.tokenize(self.text)
 
+    def test_word_tokenize_exclude_punc(self):
+        tokens = word_tokenize(self.text, include_punc=False)
+        assert list(tokens) == self.tokenizer.tokenize(self.text, include_punc=False)
+
+    def test_word_tokenize_forwards_tokenizer_arguments(self):
+        with mock.patch(
+            "textblob.tokenizers.sent_tokenize", lambda text: [text]
+        ), mock.patch.object(
+            tokenizers._word_tokenizer, "itokenize", return_value=iter(["a"])
+        ) as itokenize:
+            assert list(word_tokenize("a", False, "arg", option=1)) == ["a"]
+        itokenize.assert_called_once_with("a", False, "arg", option=1)
+
+    def test_sent_word_tokenize(self):
+        text = "Beautiful is better than ugly. Simple is better than complex."
+        assert sent_word_tokenize(text) == [
+            (
+                "Beautiful is better than ugly.",
+                ["Beautiful", "is", "better", "than", "ugly", "."],
+            ),
+            (
+                "Simple is better than complex.",
+                ["Simple", "is", "better", "than", "complex", "."],
+            ),
+        ]
+
 
 class TestSentenceTokenizer(unittest.TestCase):
     def setUp(self):